@@ -4,6 +4,8 @@ import re
 import math
 from io import BytesIO
 from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+import zipfile
 import base64
 
 # 현재 실행 디렉토리를 기준으로 경로 설정
@@ -213,6 +215,12 @@ try:
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
     from PyPDF2 import PdfReader, PdfWriter
+    from template_cache import merge_overlay
+    from font_manager import register_korean_font, string_width
+    from overlay_layout import (
+        render_layout, get_bank_layout, list_bank_layouts,
+        render_bank_estates, DEFAULT_BANK_LAYOUT
+    )
     PDF_OK = True
 except Exception:
     canvas = None
@@ -221,23 +229,32 @@ except Exception:
     TTFont = None
     PdfReader = None
     PdfWriter = None
+    merge_overlay = None
+    register_korean_font = None
+    string_width = None
+    render_layout = None
+    get_bank_layout = None
+    list_bank_layouts = None
+    render_bank_estates = None
+    DEFAULT_BANK_LAYOUT = None
     PDF_OK = False
 
 # 비용내역 PDF (FPDF)
 try:
     from fpdf import FPDF
+    from font_manager import add_fpdf_font
     FPDF_OK = True
 except Exception:
     FPDF = None
+    add_fpdf_font = None
     FPDF_OK = False
 
-# 등기부 PDF 파싱 (pdfplumber)
-try:
-    import pdfplumber
-    PDFPLUMBER_OK = True
-except Exception:
-    pdfplumber = None
-    PDFPLUMBER_OK = False
+# 등기부 PDF 파싱 (pdfplumber, registry_parser.py)
+from registry_parser import (
+    format_estate_text, format_collateral_address, STAGE_APT_PAGE, STAGE_PAGE, STAGE_TITLE,
+)
+from registry_cache import RegistryParseJob
+from registry_patterns import NON_DIGIT_RE, REGION_MARKER_RE, ROAD_ADDRESS_RE
 
 # 위택스 API 호출 (requests)
 try:
@@ -249,6 +266,12 @@ except Exception:
 
 LIBS_OK = PDF_OK
 
+from korean_amount import number_to_korean, convert_multiple_amounts_to_korean
+from fee_engine import quote, MANUAL_COST_NAMES, CORP_REGISTRY_FEES, corp_extra_purpose_fee, quote_corp_registry
+from fee_matrix import amount_steps, build_fee_matrix, write_fee_matrix_xlsx
+import batch_contracts
+from pdf_optimize import optimize_pdf, format_saved
+
 # =============================================================================
 # 2. 상수 및 데이터
 # =============================================================================
@@ -374,21 +397,9 @@ OBLIGORS = {
 # =============================================================================
 # 1금융권 좌표 설정 (부동산표시 영역)
 # =============================================================================
-# 좌표: x=시작X, y_top=PDF상단기준Y, box_height=박스높이
-BANK_COORDS = {
-    "하나은행": {
-        "설정계약서": {"x": 42, "y_top": 114, "box_height": 140},
-        "위임장": {"x": 89, "y_top": 116, "box_height": 289}
-    },
-    "신한은행": {
-        "설정계약서": {"x": 49, "y_top": 273, "box_height": 177},
-        "위임장": {"x": 100, "y_top": 127, "box_height": 251}
-    },
-    "우리은행": {
-        "설정계약서": {"x": 82, "y_top": 84, "box_height": 252},
-        "위임장": {"x": 85, "y_top": 118, "box_height": 228}
-    }
-}
+# 은행별 좌표는 layouts/banks/<은행명>.json (x=시작X, y_top=PDF상단기준Y, box_height=박스높이)
+# 파일을 추가하면 거래은행 목록에 자동으로 나타남
+BANK_LIST = list_bank_layouts() if list_bank_layouts else []
 
 def resource_path(relative_path):
     return os.path.join(APP_ROOT, relative_path)
@@ -426,27 +437,6 @@ def remove_commas(v):
     if isinstance(v, (int, float)): return str(int(v))
     return v.replace(',', '') if isinstance(v, str) else str(v)
 
-def floor_10(v): return math.floor(v / 10) * 10
-
-def lookup_base_fee(amount):
-    """법무사 보수표 기준 기본료 계산 (2024.9.12 시행)"""
-    if amount <= 50_000_000:
-        return 210_000
-    elif amount <= 100_000_000:
-        return 210_000 + int((amount - 50_000_000) * 10 / 10000)
-    elif amount <= 300_000_000:
-        return 260_000 + int((amount - 100_000_000) * 9 / 10000)
-    elif amount <= 500_000_000:
-        return 440_000 + int((amount - 300_000_000) * 8 / 10000)
-    elif amount <= 1_000_000_000:
-        return 600_000 + int((amount - 500_000_000) * 7 / 10000)
-    elif amount <= 2_000_000_000:
-        return 950_000 + int((amount - 1_000_000_000) * 5 / 10000)
-    elif amount <= 20_000_000_000:
-        return 1_450_000 + int((amount - 2_000_000_000) * 4 / 10000)
-    else:
-        return 8_650_000 + int((amount - 20_000_000_000) * 1 / 10000)
-
 def get_rate():
     try:
         import requests
@@ -459,37 +449,12 @@ def get_rate():
     except: pass
     return 0.0913459
 
-def number_to_korean(num_str):
-    if not num_str: return ""
-    try: num = int(re.sub(r'[^\d]', '', num_str))
-    except: return ""
-    units = ['', '만', '억', '조']; digits = ['', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
-    if num == 0: return "영원정"
-    result = []; unit_idx = 0
-    while num > 0:
-        part = num % 10000
-        if part > 0:
-            part_str = ""
-            if part >= 1000: part_str += digits[part // 1000] + "천"; part %= 1000
-            if part >= 100: part_str += digits[part // 100] + "백"; part %= 100
-            if part >= 10: part_str += digits[part // 10] + "십"; part %= 10
-            if part > 0: part_str += digits[part]
-            result.append(part_str + units[unit_idx])
-        num //= 10000; unit_idx += 1
-    return ''.join(reversed(result)) + "원정"
-
-def convert_multiple_amounts_to_korean(amount_str):
-    if not amount_str: return ""
-    if '/' in amount_str:
-        return ', '.join([number_to_korean(p.strip()) for p in amount_str.split('/') if number_to_korean(p.strip())])
-    return number_to_korean(amount_str)
-
 def extract_address_from_estate(estate_text):
     if not estate_text: return ""
     lines = [line.strip() for line in estate_text.strip().split('\n')]
     for line in lines:
         if "1동의 건물의 표시" in line or "건물의 표시" in line: continue
-        if any(region in line for region in ['특별시', '광역시', '시 ', '군 ', '구 ']):
+        if REGION_MARKER_RE.search(line):
             if '대 ' not in line and '도로명주소' not in line and '[' not in line:
                 return line.strip()
     return ""
@@ -504,8 +469,8 @@ if FPDF_OK:
             self.col_width1 = 150; self.col_width2 = 30
             if FONT_PATH and os.path.exists(FONT_PATH):
                 try:
-                    self.add_font('Malgun', '', FONT_PATH, uni=True)
-                    self.add_font('Malgun', 'B', FONT_PATH, uni=True)
+                    add_fpdf_font(self, 'Malgun', FONT_PATH)
+                    add_fpdf_font(self, 'Malgun', FONT_PATH, 'B')
                     self.set_font('Malgun', '', 11)
                 except: self.set_font('Arial', '', 11)
             else: self.set_font('Arial', '', 11)
@@ -576,235 +541,36 @@ if FPDF_OK:
             pdf_buffer.seek(0); return pdf_buffer
 else: PDFConverter = None
 
-def draw_fit_text(canvas_obj, text, x, y, max_width, font_name, font_size, min_font_size=5):
-    """텍스트를 max_width에 맞춰 폰트 크기 자동 조절 (1줄로 맞춤)"""
-    if not text:
-        return
-    
-    current_font_size = font_size
-    
-    # 폰트 크기를 줄여가며 한 줄에 맞추기
-    while current_font_size >= min_font_size:
-        canvas_obj.setFont(font_name, current_font_size)
-        
-        # 한 줄에 들어가는지 확인
-        if canvas_obj.stringWidth(text, font_name, current_font_size) <= max_width:
-            canvas_obj.drawString(x, y, text)
-            canvas_obj.setFont(font_name, font_size)  # 원래 폰트 크기로 복원
-            return
-        
-        # 안 맞으면 폰트 크기 줄이기
-        current_font_size -= 0.5
-    
-    # 최소 폰트로도 안 맞으면 잘라서 표시
-    canvas_obj.setFont(font_name, min_font_size)
-    truncated = text
-    while canvas_obj.stringWidth(truncated + "...", font_name, min_font_size) > max_width and len(truncated) > 10:
-        truncated = truncated[:-1]
-    if len(truncated) < len(text):
-        truncated += "..."
-    canvas_obj.drawString(x, y, truncated)
-    canvas_obj.setFont(font_name, font_size)  # 원래 폰트 크기로 복원
-
 def create_overlay_pdf(data, font_path):
-    packet = BytesIO(); c = canvas.Canvas(packet, pagesize=A4); width, height = A4
-    try: pdfmetrics.registerFont(TTFont('Korean', font_path)); font_name = 'Korean'
-    except: font_name = 'Helvetica'
-    font_size = 11; c.setFont(font_name, font_size); c.setFillColorRGB(0, 0, 0)
-    MAX_TEXT_WIDTH = 380
-    if data.get("date"): c.drawString(480, height - 85, data["date"])
-    if data.get("creditor_name"): c.drawString(157, height - 134, data["creditor_name"])
-    if data.get("creditor_addr"): draw_fit_text(c, data["creditor_addr"], 157, height - 150, MAX_TEXT_WIDTH, font_name, font_size)
-    if data.get("debtor_name"): c.drawString(157, height - 172, data["debtor_name"])
-    if data.get("debtor_addr"): draw_fit_text(c, data["debtor_addr"], 157, height - 190, MAX_TEXT_WIDTH, font_name, font_size)
-    if data.get("owner_name"): c.drawString(157, height - 212, data["owner_name"])
-    if data.get("owner_addr"): draw_fit_text(c, data["owner_addr"], 157, height - 230, MAX_TEXT_WIDTH, font_name, font_size)
-    if data.get("guarantee_type"): c.drawString(65, height - 343, data["guarantee_type"])
-    if data.get("claim_amount"): c.drawString(150, height - 535, data["claim_amount"])
-    c.showPage(); c.setFont(font_name, font_size)
-    if data.get("date"): c.drawString(180, height - 270, data["date"])
-    contract_type = data.get("contract_type", "3자담보")
-    if contract_type == "개인": 
-        if data.get("debtor_name"): c.drawString(450, height - 270, data["debtor_name"])
-    elif contract_type == "3자담보": 
-        if data.get("owner_name"): c.drawString(490, height - 270, data["owner_name"])
-    elif contract_type == "공동담보": 
-        if data.get("debtor_name"): c.drawString(450, height - 270, data["debtor_name"])
-        if data.get("owner_name"): c.drawString(490, height - 270, data["owner_name"])
-    c.showPage(); c.setFont(font_name, font_size)
-    base_x = 35; base_y = height - 80; gap = 16
-    for i, line in enumerate(data.get("estate_list", [])):
-        if line.strip(): c.drawString(base_x, base_y - (i * gap), line)
-    c.showPage(); c.save(); packet.seek(0)
-    return packet
+    """근저당권설정계약서 오버레이 (layouts/contract.json)"""
+    return render_layout("contract", data, font_path)
 
 def make_pdf(template_path, data):
-    overlay_packet = create_overlay_pdf(data, FONT_PATH)
-    overlay_pdf = PdfReader(overlay_packet); template_pdf = PdfReader(template_path); writer = PdfWriter()
-    output_buffer = BytesIO() 
-    for page_num in range(min(len(template_pdf.pages), len(overlay_pdf.pages))):
-        template_page = template_pdf.pages[page_num]; overlay_page = overlay_pdf.pages[page_num]
-        template_page.merge_page(overlay_page); writer.add_page(template_page)
-    writer.write(output_buffer)
-    output_buffer.seek(0)
-    return output_buffer
+    # 채권자 고정 레이어를 미리 찍은 템플릿(merge_layout)은 측정상 빠르지 않아 전체 오버레이를 병합
+    return merge_overlay(template_path, create_overlay_pdf(data, FONT_PATH))
 
 def make_signature_pdf(template_path, data):
-    packet = BytesIO(); c = canvas.Canvas(packet, pagesize=A4); width, height = A4
-    try: pdfmetrics.registerFont(TTFont('Korean', FONT_PATH)); font_name = 'Korean'
-    except: font_name = 'Helvetica'
-    c.setFont(font_name, 10); estate_x = 150; estate_y = height - 170; line_h = 14
-    if data.get("estate_text"):
-        for i, line in enumerate(str(data["estate_text"]).split("\n")[:17]):
-            c.drawString(estate_x, estate_y - (i * line_h), line)
-    # 등기원인 - 박스 좌표 (139.5, 557.5, 340.5, 581.0)
-    if data.get("purpose"):
-        c.setFont(font_name, 11)
-        c.drawString(145, 569, str(data["purpose"]))
-        c.setFont(font_name, 10)
-    if data.get("debtor_name"): c.drawString(250, 322, str(data["debtor_name"]))
-    if data.get("debtor_rrn"): c.drawString(250, 298, str(data["debtor_rrn"]))
-    if data.get("owner_name"): c.drawString(400, 322, str(data["owner_name"]))
-    if data.get("owner_rrn"): c.drawString(400, 298, str(data["owner_rrn"]))
-    if data.get("date"):
-        c.setFont(font_name, 11); text = str(data["date"]); tw = c.stringWidth(text, font_name, 11)
-        c.drawString((width - tw) / 2, 150, text)
-    c.showPage(); c.save(); packet.seek(0)
-    overlay_pdf = PdfReader(packet); template_pdf = PdfReader(template_path); writer = PdfWriter()
-    output_buffer = BytesIO()
-    template_page = template_pdf.pages[0]; overlay_page = overlay_pdf.pages[0]
-    template_page.merge_page(overlay_page); writer.add_page(template_page)
-    writer.write(output_buffer); output_buffer.seek(0)
-    return output_buffer
+    packet = render_layout("signature", data, FONT_PATH)
+    return merge_overlay(template_path, packet, max_pages=1)
 
 # =============================================================================
 # 1금융권 PDF 생성 함수들
 # =============================================================================
 
 def make_bank_estate_pdf(bank_name, doc_type, estate_text):
-    """1금융권 설정계약서/위임장 PDF 생성 (부동산표시만, 빈 PDF, 자동 크기 조절)"""
-    packet = BytesIO()
-    c = canvas.Canvas(packet, pagesize=A4)
-    width, height = A4
-    
-    try:
-        pdfmetrics.registerFont(TTFont('Korean', FONT_PATH))
-        font_name = 'Korean'
-    except:
-        font_name = 'Helvetica'
-    
-    coords = BANK_COORDS.get(bank_name, {}).get(doc_type, {})
-    x = coords.get("x", 50)
-    y_top = coords.get("y_top", 100)
-    box_height = coords.get("box_height", 200)
-    
-    # y 좌표 변환 (PDF 상단 기준 → reportlab 좌표)
-    y_start = height - y_top
-    
-    lines = [line for line in (estate_text.split("\n") if estate_text else []) if line.strip()]
-    num_lines = len(lines)
-    
-    if num_lines == 0:
-        c.showPage()
-        c.save()
-        packet.seek(0)
-        return packet
-    
-    # 폰트 크기와 줄 간격 자동 계산 (박스 높이 내에 맞추기)
-    # 기본: 폰트 9pt, 줄간격 12pt
-    # 텍스트가 많으면 폰트와 줄간격을 줄임
-    max_font = 9
-    min_font = 6
-    
-    # 필요한 총 높이 계산 (줄 수 * 줄간격)
-    # 줄간격은 폰트 크기의 약 1.3배
-    for font_size in [9, 8.5, 8, 7.5, 7, 6.5, 6]:
-        line_h = font_size * 1.35
-        total_height = num_lines * line_h
-        if total_height <= box_height:
-            break
-    else:
-        # 최소 폰트로도 안 맞으면 줄 간격 더 줄임
-        font_size = min_font
-        line_h = box_height / num_lines if num_lines > 0 else 10
-    
-    c.setFont(font_name, font_size)
-    
-    for i, line in enumerate(lines):
-        c.drawString(x, y_start - (i * line_h), line)
-    
-    c.showPage()
-    c.save()
-    packet.seek(0)
-    return packet
+    """1금융권 설정계약서/위임장 PDF 생성 (부동산표시만, 빈 PDF, 자동 크기 조절)
+
+    은행별 좌표는 layouts/banks/<은행명>.json
+    """
+    layout = get_bank_layout(bank_name, doc_type) or DEFAULT_BANK_LAYOUT
+    return layout.render({"estate_text": estate_text}, FONT_PATH)
 
 def make_bank_signature_pdf(template_path, data):
-    """1금융권 자필서명정보 PDF 생성"""
-    packet = BytesIO()
-    c = canvas.Canvas(packet, pagesize=A4)
-    width, height = A4
-    
-    try:
-        pdfmetrics.registerFont(TTFont('Korean', FONT_PATH))
-        font_name = 'Korean'
-    except:
-        font_name = 'Helvetica'
-    
-    # 부동산표시 (기존 템플릿 좌표 사용)
-    c.setFont(font_name, 10)
-    estate_x = 150
-    estate_y = height - 170
-    line_h = 14
-    
-    estate_text = data.get("estate_text", "")
-    if estate_text:
-        for i, line in enumerate(str(estate_text).split("\n")[:17]):
-            if line.strip():
-                c.drawString(estate_x, estate_y - (i * line_h), line)
-    
-    # 등기원인 - 박스 좌표 (139.5, 557.5, 340.5, 581.0)
-    if data.get("purpose"):
-        c.setFont(font_name, 11)
-        c.drawString(145, 569, str(data["purpose"]))
-    
-    # 채무자 정보
-    c.setFont(font_name, 10)
-    if data.get("debtor_name"):
-        c.drawString(250, 322, str(data["debtor_name"]))
-    if data.get("debtor_rrn"):
-        c.drawString(250, 298, str(data["debtor_rrn"]))
-    
-    # 소유자 정보
-    if data.get("owner_name"):
-        c.drawString(400, 322, str(data["owner_name"]))
-    if data.get("owner_rrn"):
-        c.drawString(400, 298, str(data["owner_rrn"]))
-    
-    # 날짜 (중앙)
-    if data.get("date"):
-        c.setFont(font_name, 11)
-        text = str(data["date"])
-        tw = c.stringWidth(text, font_name, 11)
-        c.drawString((width - tw) / 2, 150, text)
-    
-    c.showPage()
-    c.save()
-    packet.seek(0)
-    
-    # 템플릿과 병합
-    overlay_pdf = PdfReader(packet)
-    template_pdf = PdfReader(template_path)
-    writer = PdfWriter()
-    output_buffer = BytesIO()
-    
-    template_page = template_pdf.pages[0]
-    overlay_page = overlay_pdf.pages[0]
-    template_page.merge_page(overlay_page)
-    writer.add_page(template_page)
+    """1금융권 자필서명정보 PDF 생성 (근저당권설정 자필서명정보와 같은 레이아웃)"""
+    packet = render_layout("signature", data, FONT_PATH)
     
-    writer.write(output_buffer)
-    output_buffer.seek(0)
-    return output_buffer
+    # 템플릿과 병합 (캐시된 템플릿 사용)
+    return merge_overlay(template_path, packet, max_pages=1)
 
 # =============================================================================
 # 말소 문서 PDF 생성 함수들
@@ -812,158 +578,16 @@ def make_bank_signature_pdf(template_path, data):
 
 def make_malso_signature_pdf(template_path, data):
     """말소용 자필서명정보 PDF 생성 (탭2와 유사)"""
-    packet = BytesIO()
-    c = canvas.Canvas(packet, pagesize=A4)
-    width, height = A4
+    packet = render_layout("malso_signature", data, FONT_PATH)
     
-    try:
-        pdfmetrics.registerFont(TTFont('Korean', FONT_PATH))
-        font_name = 'Korean'
-    except:
-        font_name = 'Helvetica'
-    
-    c.setFont(font_name, 10)
-    
-    # 부동산 표시
-    estate_x = 150
-    estate_y = height - 170
-    line_h = 14
-    estate_list = data.get('estate_list', [])
-    for i, line in enumerate(estate_list[:17]):
-        if line.strip():
-            c.drawString(estate_x, estate_y - (i * line_h), line)
-    
-    # 등기원인 - 박스 좌표 (139.5, 557.5, 340.5, 581.0)
-    if data.get("purpose"):
-        c.setFont(font_name, 11)
-        c.drawString(145, 569, str(data["purpose"]))
-        c.setFont(font_name, 10)
-    
-    # 권리자 정보 (최대 2명)
-    holders = data.get('holders', [])
-    if len(holders) >= 1:
-        c.drawString(250, 322, str(holders[0].get('name', '')))
-        c.drawString(250, 298, str(holders[0].get('rrn', '')))
-    if len(holders) >= 2:
-        c.drawString(400, 322, str(holders[1].get('name', '')))
-        c.drawString(400, 298, str(holders[1].get('rrn', '')))
-    
-    # 날짜 (중앙)
-    if data.get("date"):
-        c.setFont(font_name, 11)
-        text = str(data["date"])
-        tw = c.stringWidth(text, font_name, 11)
-        c.drawString((width - tw) / 2, 150, text)
-    
-    c.showPage()
-    c.save()
-    packet.seek(0)
-    
-    # 템플릿과 병합
-    overlay_pdf = PdfReader(packet)
-    template_pdf = PdfReader(template_path)
-    writer = PdfWriter()
-    output_buffer = BytesIO()
-    
-    template_page = template_pdf.pages[0]
-    overlay_page = overlay_pdf.pages[0]
-    template_page.merge_page(overlay_page)
-    writer.add_page(template_page)
-    
-    writer.write(output_buffer)
-    output_buffer.seek(0)
-    return output_buffer
+    # 템플릿과 병합 (캐시된 템플릿 사용)
+    return merge_overlay(template_path, packet, max_pages=1)
 
 def make_malso_power_pdf(template_path, data):
-    """위임장 PDF 생성 (템플릿 오버레이)"""
-    packet = BytesIO()
-    c = canvas.Canvas(packet, pagesize=A4)
-    width, height = A4
-    
-    try:
-        pdfmetrics.registerFont(TTFont('Korean', FONT_PATH))
-        font_name = 'Korean'
-    except:
-        font_name = 'Helvetica'
-    
-    # 위임장 좌표 (분석 결과 기반)
-    # 부동산 표시: (102.9, 93.1) ~ (529.7, 344.6), RL Y: 497.4 ~ 748.9
-    # 등기원인/목적: X=172.0, RL Y: 450~491
-    # 말소할 사항: (172.0, 397.1) ~ (530.3, 455.4), RL Y: 386.6 ~ 444.9
-    # 의무자/권리자: (65.1, 590.3) ~ (415.4, 778.9), RL Y: 63.1 ~ 251.7
-    
-    c.setFont(font_name, 9)
-    
-    # 부동산 표시 (Box 1)
-    estate_x = 105
-    estate_y = 745
-    line_h = 12
-    estate_lines = data.get('estate_text', '').split('\n')
-    for i, line in enumerate(estate_lines[:20]):
-        if line.strip():
-            c.drawString(estate_x, estate_y - (i * line_h), line)
-    
-    # 등기원인과 그 년월일 (Box 2) - 상하 중앙정렬, RL Y: 470.6 ~ 491.1, 중앙 480.85
-    cause_date = data.get('date', '')
-    c.drawString(175, 478, f"{cause_date} 해지")
-    
-    # 등기목적 (Box 3) - 상하 중앙정렬, RL Y: 450.6 ~ 471.1, 중앙 460.85
-    malso_type = data.get('malso_type', '근저당권')
-    c.drawString(175, 458, f"{malso_type}말소")
-    
-    # 말소할 사항 (Box 4) - 상하 중앙정렬, RL Y: 386.6 ~ 444.9, 중앙 415.75
-    cancel_text = data.get('cancel_text', '')
-    c.setFont(font_name, 8)
-    # 긴 텍스트 줄바꿈 처리 (폭 넓힘)
-    if len(cancel_text) > 75:
-        c.drawString(175, 422, cancel_text[:75])
-        c.drawString(175, 410, cancel_text[75:])
-    else:
-        c.drawString(175, 416, cancel_text)
-    
-    c.setFont(font_name, 9)
-    
-    # 의무자 (소유자) - 왼쪽 상단 (Box 5 영역), RL Y: 63.1 ~ 251.7
-    holder1_name = data.get('holder1_name', '')
-    holder1_addr = data.get('holder1_addr', '')
-    holder2_name = data.get('holder2_name', '')
-    holder2_addr = data.get('holder2_addr', '')
-    
-    # 등기의무자 라벨
-    c.setFont(font_name, 8)
-    c.drawString(70, 248, "등기의무자")
-    c.setFont(font_name, 9)
-    
-    # 의무자 내용
-    c.drawString(70, 232, holder1_name)
-    # 주소 (여러 줄 처리)
-    addr_lines = holder1_addr.split('\n') if holder1_addr else []
-    for i, line in enumerate(addr_lines[:2]):
-        c.drawString(70, 217 - (i * 12), line)
-    
-    if holder2_name:
-        c.drawString(70, 180, holder2_name)
-        addr2_lines = holder2_addr.split('\n') if holder2_addr else []
-        for i, line in enumerate(addr2_lines[:2]):
-            c.drawString(70, 165 - (i * 12), line)
-    
-    # 권리자 (채권자) - 하단
-    obligor_name = data.get('obligor_name', '')
-    obligor_id = data.get('obligor_id', '')
-    obligor_addr = data.get('obligor_addr', '')
-    obligor_rep = data.get('obligor_rep', '')
-    obligor_branch = data.get('obligor_branch', '')
-    
-    # 등기권리자 라벨
-    c.setFont(font_name, 8)
-    c.drawString(70, 118, "등기권리자")
-    c.setFont(font_name, 9)
-    
-    # 위임장: 법인등록번호 없이 출력
-    c.drawString(70, 102, obligor_name)
-    c.drawString(70, 87, obligor_addr)
-    
+    """위임장 PDF 생성 (템플릿 오버레이, layouts/malso_power.json)"""
     # 취급지점 + 대표자 형식
+    obligor_branch = data.get('obligor_branch', '')
+    obligor_rep = data.get('obligor_rep', '')
     if obligor_branch and obligor_rep:
         rep_text = f"(취급지점:{obligor_branch}) {obligor_rep}"
     elif obligor_rep:
@@ -971,27 +595,10 @@ def make_malso_power_pdf(template_path, data):
     else:
         rep_text = ""
     
-    if rep_text:
-        c.drawString(70, 72, rep_text)
-    
-    c.showPage()
-    c.save()
-    packet.seek(0)
-    
-    # 템플릿과 병합 (1페이지만)
-    overlay_pdf = PdfReader(packet)
-    template_pdf = PdfReader(template_path)
-    writer = PdfWriter()
-    output_buffer = BytesIO()
+    packet = render_layout("malso_power", dict(data, obligor_rep_text=rep_text), FONT_PATH)
     
-    template_page = template_pdf.pages[0]
-    overlay_page = overlay_pdf.pages[0]
-    template_page.merge_page(overlay_page)
-    writer.add_page(template_page)
-    
-    writer.write(output_buffer)
-    output_buffer.seek(0)
-    return output_buffer
+    # 템플릿과 병합 (1페이지만, 캐시된 템플릿 사용)
+    return merge_overlay(template_path, packet, max_pages=1)
 
 def make_malso_termination_pdf(data):
     """해지증서 PDF 생성 (백지에서 생성)"""
@@ -999,11 +606,7 @@ def make_malso_termination_pdf(data):
     c = canvas.Canvas(packet, pagesize=A4)
     width, height = A4
     
-    try:
-        pdfmetrics.registerFont(TTFont('Korean', FONT_PATH))
-        font_name = 'Korean'
-    except:
-        font_name = 'Helvetica'
+    font_name = register_korean_font(FONT_PATH)
     
     # 페이지 설정: 좌측 X=50, 우측 X=545 (여백 줄임)
     left_x = 50
@@ -1014,13 +617,13 @@ def make_malso_termination_pdf(data):
     # 제목: 해 지 증 서 (중앙, 상단)
     c.setFont(font_name, 18)
     title = "해 지 증 서"
-    title_width = c.stringWidth(title, font_name, 18)
+    title_width = string_width(title, font_name, 18)
     c.drawString(center_x - title_width/2, 750, title)
     
     # 부제목: (부동산의표시) (중앙, 2줄)
     c.setFont(font_name, 11)
     subtitle = "(부동산의표시)"
-    subtitle_width = c.stringWidth(subtitle, font_name, 11)
+    subtitle_width = string_width(subtitle, font_name, 11)
     c.drawString(center_x - subtitle_width/2, 720, subtitle)
     
     # 부동산 표시 내용
@@ -1054,7 +657,7 @@ def make_malso_termination_pdf(data):
     # 작성일자 (중앙)
     date_text = data.get('date', '')
     c.setFont(font_name, 11)
-    date_width = c.stringWidth(date_text, font_name, 11)
+    date_width = string_width(date_text, font_name, 11)
     c.drawString(center_x - date_width/2, 320, date_text)
     
     # 의무자 영역 - 중앙정렬, 라벨 좌측
@@ -1076,11 +679,11 @@ def make_malso_termination_pdf(data):
     else:
         obligor_display = obligor_name
     
-    text_width = c.stringWidth(obligor_display, font_name, 10)
+    text_width = string_width(obligor_display, font_name, 10)
     c.drawString(center_x - text_width/2, 260, obligor_display)
     
     c.setFont(font_name, 9)
-    addr_width = c.stringWidth(obligor_addr, font_name, 9)
+    addr_width = string_width(obligor_addr, font_name, 9)
     c.drawString(center_x - addr_width/2, 245, obligor_addr)
     
     # 취급지점 + 대표자 형식
@@ -1092,7 +695,7 @@ def make_malso_termination_pdf(data):
         rep_text = ""
     
     if rep_text:
-        rep_width = c.stringWidth(rep_text, font_name, 10)
+        rep_width = string_width(rep_text, font_name, 10)
         c.setFont(font_name, 10)
         c.drawString(center_x - rep_width/2, 225, rep_text)
     
@@ -1106,7 +709,7 @@ def make_malso_termination_pdf(data):
     else:
         holder_text = f"{holder1_name} 귀하"
     
-    holder_width = c.stringWidth(holder_text, font_name, 10)
+    holder_width = string_width(holder_text, font_name, 10)
     c.drawString(right_x - holder_width, 160, holder_text)
     
     c.showPage()
@@ -1120,11 +723,7 @@ def make_malso_transfer_pdf(data):
     c = canvas.Canvas(packet, pagesize=A4)
     width, height = A4
     
-    try:
-        pdfmetrics.registerFont(TTFont('Korean', FONT_PATH))
-        font_name = 'Korean'
-    except:
-        font_name = 'Helvetica'
+    font_name = register_korean_font(FONT_PATH)
     
     # 페이지 설정: 좌측 X=50, 우측 X=545 (여백 줄임)
     left_x = 50
@@ -1134,13 +733,13 @@ def make_malso_transfer_pdf(data):
     # 제목: 이 관 증 명 서 (중앙)
     c.setFont(font_name, 18)
     title = "이 관 증 명 서"
-    title_width = c.stringWidth(title, font_name, 18)
+    title_width = string_width(title, font_name, 18)
     c.drawString(center_x - title_width/2, 750, title)
     
     # 부제목
     c.setFont(font_name, 11)
     subtitle = "(부동산의표시)"
-    subtitle_width = c.stringWidth(subtitle, font_name, 11)
+    subtitle_width = string_width(subtitle, font_name, 11)
     c.drawString(center_x - subtitle_width/2, 720, subtitle)
     
     # 부동산 표시
@@ -1178,7 +777,7 @@ def make_malso_transfer_pdf(data):
     # 작성일자 (중앙)
     date_text = data.get('date', '')
     c.setFont(font_name, 11)
-    date_width = c.stringWidth(date_text, font_name, 11)
+    date_width = string_width(date_text, font_name, 11)
     c.drawString(center_x - date_width/2, 320, date_text)
     
     # 의무자 (중앙, 라벨 좌측)
@@ -1198,11 +797,11 @@ def make_malso_transfer_pdf(data):
     else:
         obligor_display = obligor_name
     
-    text_width = c.stringWidth(obligor_display, font_name, 10)
+    text_width = string_width(obligor_display, font_name, 10)
     c.drawString(center_x - text_width/2, 260, obligor_display)
     
     c.setFont(font_name, 9)
-    addr_width = c.stringWidth(obligor_addr, font_name, 9)
+    addr_width = string_width(obligor_addr, font_name, 9)
     c.drawString(center_x - addr_width/2, 245, obligor_addr)
     
     # 취급지점 + 대표자 형식
@@ -1214,7 +813,7 @@ def make_malso_transfer_pdf(data):
         rep_text = ""
     
     if rep_text:
-        rep_width = c.stringWidth(rep_text, font_name, 10)
+        rep_width = string_width(rep_text, font_name, 10)
         c.setFont(font_name, 10)
         c.drawString(center_x - rep_width/2, 225, rep_text)
     
@@ -1223,6 +822,60 @@ def make_malso_transfer_pdf(data):
     packet.seek(0)
     return packet
 
+# 말소 서류 묶음: 문서명 → (생성 함수, 템플릿 파일명 또는 None)
+MALSO_BUNDLE_DOCS = {
+    "자필서명정보": (make_malso_signature_pdf, "자필서명정보_서면_템플릿.pdf"),
+    "위임장": (make_malso_power_pdf, "말소_위임장.pdf"),
+    "해지증서": (make_malso_termination_pdf, None),
+    "이관증명서": (make_malso_transfer_pdf, None),
+}
+
+def make_malso_bundle(docs, output="pdf", file_prefix="말소"):
+    """말소 서류 여러 개를 동시에 생성해서 PDF 1개(순서대로 병합) 또는 ZIP 1개로 반환
+
+    docs: {문서명: 데이터} (문서명은 MALSO_BUNDLE_DOCS 키, 넣은 순서대로 병합)
+    같은 프로세스의 스레드로 생성하므로 폰트/템플릿 캐시를 함께 사용
+    반환: (BytesIO 또는 None, {문서명: 오류 메시지})
+    """
+    def render(name, data):
+        func, template_name = MALSO_BUNDLE_DOCS[name]
+        if template_name is None:
+            return func(data).getvalue()
+        template_path = resource_path(template_name)
+        if not os.path.exists(template_path):
+            raise FileNotFoundError(f"템플릿 없음: {template_name}")
+        return func(template_path, data).getvalue()
+    
+    names = [name for name in docs if name in MALSO_BUNDLE_DOCS]
+    results = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(names))) as pool:
+        futures = {name: pool.submit(render, name, docs[name]) for name in names}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+    
+    if not results:
+        return None, errors
+    
+    output_buffer = BytesIO()
+    if output == "zip":
+        with zipfile.ZipFile(output_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name in names:
+                if name in results:
+                    zf.writestr(f"{file_prefix}_{name}.pdf", results[name])
+    else:
+        writer = PdfWriter()
+        for name in names:
+            if name in results:
+                for page in PdfReader(BytesIO(results[name])).pages:
+                    writer.add_page(page)
+        writer.write(output_buffer)
+    output_buffer.seek(0)
+    return output_buffer, errors
+
 # =============================================================================
 # 5. Streamlit UI 및 상태 관리
 # =============================================================================
@@ -1274,387 +927,6 @@ for key in manual_keys:
 # =============================================================================
 # 등기부 PDF 파싱 함수
 # =============================================================================
-def parse_registry_pdf(uploaded_file):
-    """집합건물 등기부 PDF에서 부동산표시 추출 - 삭선 감지 포함"""
-    
-    # 행정구역 변환
-    행정구역_변환 = {"전라북도": "전북특별자치도", "강원도": "강원특별자치도"}
-    def convert_region(text):
-        for old, new in 행정구역_변환.items():
-            text = text.replace(old, new)
-        return text
-    
-    def get_red_lines_from_page(page):
-        """페이지에서 빨간 삭선 y좌표 수집"""
-        red_ys = []
-        for line in page.lines:
-            color = line.get('stroking_color')
-            if color and isinstance(color, (list, tuple)) and len(color) >= 3:
-                r, g, b = color[0], color[1], color[2]
-                if r > 0.9 and g < 0.1 and b < 0.1:
-                    width = line['x1'] - line['x0']
-                    if width > 30:
-                        red_ys.append(line['top'])
-        return red_ys
-    
-    def is_번지_strikethrough(번지, page_words, red_ys):
-        """번지의 모든 위치에서 삭선 여부 확인"""
-        if not red_ys or not 번지:
-            return False
-        
-        found_positions = []
-        for word in page_words:
-            if 번지 in word['text']:
-                word_y = word['top']
-                # 삭선이 단어 위나 아래에 있을 수 있으므로 양방향 체크
-                has_strike = any(abs(word_y - ry) < 15 for ry in red_ys)
-                found_positions.append({'y': word_y, 'strike': has_strike})
-        
-        if not found_positions:
-            return False
-        
-        # 삭선 없는 위치가 하나라도 있으면 False
-        return all(pos['strike'] for pos in found_positions)
-    
-    result = {
-        "1동건물표시": "",
-        "아파트명": "",
-        "동명칭": "",
-        "도로명주소": "",
-        "건물번호": "",
-        "고유번호": "",
-        "구조": "",
-        "면적": "",
-        "토지": [],
-        "대지권종류": "",
-        "대지권비율": ""
-    }
-    
-    debug = {
-        "errors": [],
-        "warnings": [],
-        "info": []
-    }
-    
-    if not PDFPLUMBER_OK:
-        debug["errors"].append("pdfplumber 라이브러리가 설치되지 않았습니다.")
-        return result, debug
-    
-    try:
-        with pdfplumber.open(uploaded_file) as pdf:
-            debug["info"].append(f"PDF 페이지 수: {len(pdf.pages)}")
-            
-            # 고유번호 추출
-            first_page_text = pdf.pages[0].extract_text() or ""
-            고유번호_match = re.search(r'고유번호\s*(\d{4}-\d{4}-\d{6})', first_page_text)
-            if 고유번호_match:
-                result["고유번호"] = 고유번호_match.group(1)
-            
-            # 페이지별 빨간선/텍스트 정보 수집
-            page_info = {}
-            for page_idx, page in enumerate(pdf.pages):
-                page_info[page_idx] = {
-                    'red_ys': get_red_lines_from_page(page),
-                    'words': page.extract_words()
-                }
-            
-            # 컬러 PDF 여부
-            has_color = any(len(info['red_ys']) > 0 for info in page_info.values())
-            if has_color:
-                debug["info"].append("컬러 PDF 감지 - 삭선 기반 필터링")
-            else:
-                debug["info"].append("흑백 PDF - 번지 기반 필터링")
-            
-            # 페이지별 테이블 수집
-            all_tables = []
-            for page_idx, page in enumerate(pdf.pages):
-                for table in page.extract_tables():
-                    all_tables.append((page_idx, table))
-            
-            # 섹션별 데이터 행 수집
-            sections = {"1동건물": [], "토지": [], "전유부분": [], "대지권": []}
-            current_section = None
-            대지권_header = []
-            
-            for page_idx, table in all_tables:
-                if not table:
-                    continue
-                
-                for row in table:
-                    row_text = str(row[0]) if row[0] else ""
-                    
-                    # 섹션 헤더 감지
-                    if "1동의 건물의 표시" in row_text:
-                        current_section = "1동건물"
-                        continue
-                    elif "대지권의 목적인 토지의 표시" in row_text:
-                        current_section = "토지"
-                        continue
-                    elif "전유부분의 건물의 표시" in row_text:
-                        current_section = "전유부분"
-                        continue
-                    elif "대지권의 표시" in row_text and "목적인 토지" not in row_text:
-                        current_section = "대지권"
-                        continue
-                    elif "갑 구" in row_text or "을 구" in row_text:
-                        current_section = None
-                        continue
-                    
-                    # 대지권 헤더 저장
-                    if current_section == "대지권" and row_text.strip() == "표시번호":
-                        대지권_header = row
-                        continue
-                    
-                    # 컬럼 헤더 스킵
-                    if row_text.strip() in ["표시번호", "순위번호"]:
-                        continue
-                    
-                    # 현행 데이터: "1", "2" 또는 "1\n(전 1)" 형태
-                    if current_section and row[0]:
-                        row0_clean = str(row[0]).strip()
-                        if re.match(r'^\d+$', row0_clean) or re.match(r'^\d+\n\(전', row0_clean):
-                            
-                            # 토지 섹션: 삭선 감지 적용
-                            if current_section == "토지":
-                                소재지 = (row[1] or "") if len(row) > 1 else ""
-                                
-                                # 주소 패턴 체크
-                                if not re.search(r'(시|군|구|동|리|읍|면)\s', 소재지):
-                                    continue
-                                
-                                # 번지 추출
-                                소재지_clean = 소재지.replace('\n', ' ').strip()
-                                번지_match = re.search(r'(\d+(-\d+)?)$', 소재지_clean)
-                                번지 = 번지_match.group(1) if 번지_match else None
-                                
-                                # 컬러 PDF면 삭선 체크
-                                if has_color and 번지:
-                                    info = page_info[page_idx]
-                                    if is_번지_strikethrough(번지, info['words'], info['red_ys']):
-                                        continue  # 말소 스킵
-                                
-                                sections["토지"].append((번지, row))
-                            else:
-                                sections[current_section].append(row)
-            
-            # ===== 1동건물: 마지막 유효 행 =====
-            if sections["1동건물"]:
-                row = sections["1동건물"][-1]
-                col2 = (row[2] or "") if len(row) > 2 else ""
-                
-                # 워터마크 제거
-                col2 = re.sub(r'열\s*람\s*용', '', col2)
-                col2 = re.sub(r'(?<=[가-힣])(열|람|용)(?=[가-힣])', '', col2)
-                
-                lines = col2.split('\n')
-                
-                # [도로명주소] 위치 찾기
-                road_idx = -1
-                for i, line in enumerate(lines):
-                    if '[도로명주소]' in line:
-                        road_idx = i
-                        break
-                
-                # 도로명주소 추출
-                if road_idx > 0:
-                    road_lines = []
-                    for i in range(road_idx + 1, len(lines)):
-                        line = lines[i].strip()
-                        if line and line not in ['열', '람', '용']:
-                            road_lines.append(line)
-                    result["도로명주소"] = convert_region(' '.join(road_lines))
-                
-                # [도로명주소] 앞부분만 사용
-                content_lines = lines[:road_idx] if road_idx > 0 else lines
-                content_lines = [l.strip() for l in content_lines if l.strip() and l.strip() not in ['열', '람', '용']]
-                
-                if content_lines:
-                    # 번지(숫자)로 끝나는 마지막 줄 = 지번 끝
-                    지번_end_idx = -1
-                    for i, line in enumerate(content_lines):
-                        if re.search(r'\d+(-\d+)?$', line.strip()):
-                            지번_end_idx = i
-                    
-                    if 지번_end_idx >= 0:
-                        result["1동건물표시"] = convert_region(' '.join(content_lines[:지번_end_idx+1]))
-                        
-                        건물명_lines = content_lines[지번_end_idx+1:]
-                        if 건물명_lines:
-                            건물명_text = ' '.join(건물명_lines)
-                            동_match = re.search(r'(제[가-힣\d]+동)$', 건물명_text)
-                            if 동_match:
-                                result["동명칭"] = 동_match.group(1)
-                                result["아파트명"] = 건물명_text[:동_match.start()].strip()
-                            else:
-                                result["아파트명"] = 건물명_text
-                    else:
-                        result["1동건물표시"] = convert_region(' '.join(content_lines))
-            
-            # ===== 토지: 같은 번지면 마지막만 =====
-            토지_by_번지 = {}
-            for 번지, row in sections["토지"]:
-                토지_by_번지[번지] = row
-            
-            # 번지 숫자순 정렬
-            토지_items = sorted(토지_by_번지.items(), key=lambda x: (int(re.search(r'^(\d+)', x[0]).group(1)) if x[0] and re.search(r'^(\d+)', x[0]) else 0))
-            
-            for idx, (번지, row) in enumerate(토지_items, 1):
-                소재지_raw = (row[1] or "").replace('\n', ' ').strip()
-                
-                # 지목과 면적: row[2:]에서 패턴으로 찾기 (pdfplumber 파싱 차이 대응)
-                지목_raw = ""
-                면적_raw = ""
-                for col in row[2:]:
-                    col_str = (col or "").strip()
-                    if col_str:
-                        # 지목: 대, 전, 답 등으로만 구성
-                        if re.match(r'^(대|전|답|임야|잡종지|도로|하천)(\n(대|전|답|임야|잡종지|도로|하천))*$', col_str):
-                            지목_raw = col_str
-                        # 면적: ㎡ 포함
-                        elif '㎡' in col_str:
-                            면적_raw = col_str
-                
-                # 여러 필지가 한 행에 있는 경우 분리 (1. xxx 2. xxx 3. xxx 형태)
-                필지_matches = re.split(r'(?=\d+\.\s*[가-힣])', 소재지_raw)
-                필지_matches = [p.strip() for p in 필지_matches if p.strip()]
-                
-                if len(필지_matches) > 1:
-                    # 지목과 면적도 분리
-                    지목_list = re.findall(r'(대|전|답|임야|잡종지|도로|하천|공장용지|학교용지|주차장|창고용지|목장용지|광천지|염전|유지|양어장|수도용지|공원|체육용지|유원지|종교용지|사적지|묘지|주유소용지)', 지목_raw)
-                    면적_list = re.findall(r'([\d.]+㎡)', 면적_raw)
-                    
-                    for i, 필지 in enumerate(필지_matches):
-                        소재지 = re.sub(r'^\d+\.\s*', '', 필지).strip()
-                        지목 = 지목_list[i] if i < len(지목_list) else (지목_list[0] if 지목_list else "")
-                        면적 = 면적_list[i] if i < len(면적_list) else ""
-                        
-                        result["토지"].append({
-                            "번호": str(len(result["토지"]) + 1),
-                            "소재지": convert_region(소재지),
-                            "지목": 지목,
-                            "면적": 면적
-                        })
-                else:
-                    # 단일 필지
-                    소재지 = re.sub(r'^\d+\.\s*', '', 소재지_raw)
-                    지목_match = re.search(r'(대|전|답|임야|잡종지)', 지목_raw)
-                    지목 = 지목_match.group(1) if 지목_match else 지목_raw
-                    면적_match = re.search(r'([\d.]+㎡)', 면적_raw)
-                    면적 = 면적_match.group(1) if 면적_match else 면적_raw
-                    
-                    result["토지"].append({
-                        "번호": str(len(result["토지"]) + 1),
-                        "소재지": convert_region(소재지),
-                        "지목": 지목,
-                        "면적": 면적
-                    })
-            
-            # ===== 전유부분: 마지막 유효 행 =====
-            if sections["전유부분"]:
-                row = sections["전유부분"][-1]
-                건물번호 = (row[2] or "").replace('\n', ' ').strip() if len(row) > 2 else ""
-                건물내역 = (row[3] or "").replace('\n', ' ').strip() if len(row) > 3 else ""
-                
-                if result["동명칭"] and result["동명칭"] not in 건물번호:
-                    건물번호 = f"{result['동명칭']} {건물번호}"
-                
-                result["건물번호"] = 건물번호
-                
-                구조_match = re.search(r'([가-힣]+조|[가-힣]+구조)', 건물내역)
-                면적_match = re.search(r'([\d.]+㎡)', 건물내역)
-                result["구조"] = 구조_match.group(1) if 구조_match else ""
-                result["면적"] = 면적_match.group(1) if 면적_match else ""
-            
-            # ===== 대지권: 소유권/지상권/전세권이 있는 마지막 유효 행 =====
-            if sections["대지권"]:
-                # 대지권종류가 있는 행 찾기
-                valid_대지권_row = None
-                for row in sections["대지권"]:
-                    종류_raw = (row[1] or "").replace('\n', ' ').strip() if len(row) > 1 else ""
-                    if re.search(r'(소유권|지상권|전세권)', 종류_raw):
-                        valid_대지권_row = row
-                
-                if valid_대지권_row:
-                    row = valid_대지권_row
-                    
-                    종류_raw = (row[1] or "").replace('\n', ' ').strip() if len(row) > 1 else ""
-                    # "1, 2, 3 소유권대지권" → "소유권" 으로 단순화
-                    종류_match = re.search(r'(소유권|지상권|전세권)', 종류_raw)
-                    result["대지권종류"] = 종류_match.group(1) if 종류_match else 종류_raw
-                    
-                    # 대지권비율: "분의" 패턴이 있는 컬럼 찾기
-                    for col in row[2:]:
-                        col_str = (col or "").replace('\n', ' ').strip()
-                        if "분의" in col_str:
-                            result["대지권비율"] = col_str
-                            break
-            
-            # 아파트명 없으면 갑구에서 찾기
-            if not result["아파트명"]:
-                full_text = "\n".join([p.extract_text() or "" for p in pdf.pages])
-                갑구_match = re.search(r'【\s*갑\s*구\s*】(.+?)【\s*을\s*구\s*】', full_text, re.DOTALL)
-                if 갑구_match:
-                    아파트_match = re.search(r'([가-힣A-Za-z0-9]+(?:아파트|빌라|오피스텔|주상복합|타운|파크|힐스|뷰|애비뉴|타워|팰리스|하이츠))', 갑구_match.group(1))
-                    if 아파트_match:
-                        result["아파트명"] = 아파트_match.group(1)
-    
-    except Exception as e:
-        debug["errors"].append(f"PDF 파싱 오류: {str(e)}")
-        return result, debug
-    
-    return result, debug
-
-def format_estate_text(data):
-    """부동산 표시 포맷팅"""
-    # 행정구역 변환
-    행정구역_변환 = {"전라북도": "전북특별자치도", "강원도": "강원특별자치도"}
-    def convert_region(text):
-        for old, new in 행정구역_변환.items():
-            text = text.replace(old, new)
-        return text
-    
-    lines = []
-    
-    # 1동의 건물의 표시
-    lines.append("1동의 건물의 표시")
-    lines.append(f"   {data['1동건물표시']}")
-    
-    # 아파트명/동명칭
-    건물명칭_parts = []
-    if data["아파트명"]:
-        건물명칭_parts.append(data["아파트명"])
-    if data["동명칭"]:
-        건물명칭_parts.append(data["동명칭"])
-    if 건물명칭_parts:
-        lines.append(f"   {' '.join(건물명칭_parts)}")
-    
-    lines.append("")  # 빈 줄
-    
-    # 전유부분의 건물의 표시
-    lines.append("전유부분의 건물의 표시")
-    lines.append(f"  1. 건물의 번호 : {data['건물번호']}[고유번호:{data['고유번호']}]")
-    lines.append(f"      구조 및 면적 : {data['구조']} {data['면적']}")
-    
-    lines.append("")  # 빈 줄
-    
-    # 전유부분의 대지권의 표시
-    lines.append("전유부분의 대지권의 표시")
-    lines.append("      토지의 표시")
-    
-    # 토지는 최신 것만 (행정구역 변경된 경우 마지막 것만)
-    if data["토지"]:
-        # 마지막 토지만 사용 (최신)
-        t = data["토지"][-1]
-        소재지 = convert_region(t['소재지'])
-        lines.append(f"       1.{소재지}")
-        lines.append(f"           {t['지목']}  {t['면적']}")
-    
-    lines.append(f"          대지권의 종류: {data['대지권종류']}")
-    lines.append(f"          대지권의 비율: {data['대지권비율']}")
-    
-    return "\n".join(lines)
-
-
 def show_debug(debug):
     """디버깅 정보 표시 - 접이식"""
     total_errors = len(debug["errors"])
@@ -1684,6 +956,66 @@ def show_debug(debug):
                 st.markdown(f"- {i}")
 
 
+REGISTRY_POLL_SECONDS = 0.1   # 등기부 분석 진행 막대 갱신 간격
+
+
+def _request_registry_stop(stop_key):
+    """'여기서 중단' 버튼 콜백 - 작업 스레드의 분석을 CancelToken으로 취소 (표제부까지의 결과로 끝남)"""
+    job = st.session_state.get(f'{stop_key}_job')
+    if job is not None:
+        job[1].cancel()
+
+
+def extract_registry_with_progress(uploaded_registry, stop_key):
+    """등기부 분석을 작업 스레드에서 시작하고 끝날 때까지 진행 막대 표시
+
+    반환: (result, debug)
+    """
+    st.session_state[f'{stop_key}_job'] = (uploaded_registry.file_id, RegistryParseJob(uploaded_registry))
+    return wait_registry_job(uploaded_registry, stop_key)
+
+
+def wait_registry_job(uploaded_registry, stop_key):
+    """이 업로드 파일의 분석이 진행 중이면 끝날 때까지 진행 막대 표시 후 (result, debug), 없으면 None
+
+    표제부를 찾은 뒤 갑구를 더 읽어야 하면 '여기서 중단' 버튼 표시.
+    버튼(또는 다른 입력)으로 화면이 다시 실행되어도 분석은 작업 스레드에서 계속되므로
+    다시 실행된 화면에서 이 함수로 이어서 기다림 - 중단 결과는 파서가 직접 만듦
+    """
+    file_id, job = st.session_state.get(f'{stop_key}_job', (None, None))
+    if job is None:
+        return None
+    if file_id != uploaded_registry.file_id:
+        # 다른 파일로 바뀜 - 예전 분석은 버림
+        job.cancel()
+        del st.session_state[f'{stop_key}_job']
+        return None
+
+    progress = st.progress(0.0, text="📄 등기부 여는 중...")
+    stop_slot = st.empty()
+    stop_shown = False
+    while not job.wait(REGISTRY_POLL_SECONDS):
+        event = job.event
+        if event is None:
+            continue
+        fraction = min(event.page / event.page_count, 1.0) if event.page_count else 1.0
+        if event.stage == STAGE_PAGE:
+            progress.progress(fraction, text=f"📄 표제부 분석 중... {event.page}/{event.page_count}페이지")
+        elif event.stage in (STAGE_TITLE, STAGE_APT_PAGE):
+            if job.token.cancelled:
+                progress.progress(fraction, text="⏹ 중단하는 중...")
+            elif not event.result.건물.아파트명:
+                progress.progress(fraction, text=f"🔎 갑구에서 아파트명 찾는 중... {event.page}/{event.page_count}페이지")
+                if not stop_shown:
+                    stop_slot.button("⏹ 여기서 중단 (표제부 결과 사용)", key=stop_key,
+                                     on_click=_request_registry_stop, args=(stop_key,))
+                    stop_shown = True
+    progress.empty()
+    stop_slot.empty()
+    del st.session_state[f'{stop_key}_job']
+    return job.result()
+
+
 # =============================================================================
 # 위택스 API 호출 함수
 # =============================================================================
@@ -1714,7 +1046,7 @@ def call_wetax_api(cases, base_url=None):
 
 def parse_corp_num(corp_num_str):
     """법인번호 분리 (110111-4138560 → 앞6자리, 뒤7자리)"""
-    clean = re.sub(r'[^0-9]', '', str(corp_num_str))
+    clean = NON_DIGIT_RE.sub('', str(corp_num_str))
     if len(clean) >= 13:
         return clean[:6], clean[6:13]
     elif len(clean) >= 6:
@@ -1724,7 +1056,7 @@ def parse_corp_num(corp_num_str):
 
 def parse_rrn(rrn_str):
     """주민번호 분리 (800101-1234567 → 앞6자리, 뒤7자리)"""
-    clean = re.sub(r'[^0-9]', '', str(rrn_str))
+    clean = NON_DIGIT_RE.sub('', str(rrn_str))
     if len(clean) >= 13:
         return clean[:6], clean[6:13]
     elif len(clean) >= 6:
@@ -1743,7 +1075,7 @@ def extract_road_address(full_address):
         return parts[0].strip(), parts[1].strip()
     
     # 숫자 뒤 공백으로 분리 시도
-    match = re.match(r'(.+?(?:로|길)\s*\d+(?:-\d+)?)\s*(.*)$', full_address)
+    match = ROAD_ADDRESS_RE.match(full_address)
     if match:
         return match.group(1).strip(), match.group(2).strip()
     
@@ -1782,81 +1114,27 @@ def handle_creditor_change():
         st.session_state['cost_manual_주소변경'] = "0" # 주소변경은 체크박스로만 제어
     st.session_state.calc_data['creditor_key_check'] = creditor_key
 
-MANUAL_COST_NAMES = ["제증명", "교통비", "원인증서", "주소변경", "확인서면", "선순위 말소"]
-
 def calculate_all(data):
+    """화면 입력(data + session_state의 보수액 표시/금융사/주소변경/수기 공과금)으로 fee_engine.quote 계산 후 data에 채움"""
     amount = parse_int_input(data.get('채권최고액')) 
     parcels = parse_int_input(data.get('필지수'))
-    try: rate = float(remove_commas(data.get('채권할인율', '0'))) / 100
+    try: rate = float(remove_commas(data.get('채권할인율', '0')))
     except ValueError: rate = 0 
     
     # 원본 데이터 보존
     data['input_amount'] = data.get('채권최고액', '')
     
-    # 금융사 확인 (엘하비스트대부 체크)
-    creditor = st.session_state.get('tab3_creditor_select', '')
-    is_elharvest = (creditor == "㈜엘하비스트대부 대표이사 김상수")
-    
-    # 기본료 계산
-    if is_elharvest:
-        # 엘하비스트대부는 항상 70,000원 고정
-        base_fee = 70000
-        data['기본료_자동'] = 70000
-    else:
-        # 일반 금융사: 수기입력 우선, 없으면 자동계산
-        manual_base_fee = parse_int_input(data.get('기본료_val', 0))
-        if manual_base_fee > 0:
-            base_fee = manual_base_fee
-        else:
-            base_fee = lookup_base_fee(amount)
-        data['기본료_자동'] = lookup_base_fee(amount)
-    data['기본료'] = base_fee
-    
-    add_fee = parse_int_input(data.get('추가보수_val'))
-    etc_fee = parse_int_input(data.get('기타보수_val'))
-    disc_fee = parse_int_input(data.get('할인금액'))
-
-    fee_total = 0
-    if st.session_state['show_fee']:
-        supply_val = base_fee + add_fee + etc_fee - disc_fee
-        vat = math.floor(max(0, supply_val) * 0.1)
-        fee_total = supply_val + vat
-        data['공급가액'] = supply_val
-        data['부가세'] = vat
-        data['보수총액'] = fee_total
-    else:
-        data['공급가액'] = 0; data['부가세'] = 0; data['보수총액'] = 0
-    
-    # 공과금 계산
-    addr_count = int(st.session_state.get('address_change_count', 0))  # 계산 로직에서 미리 설정됨
-    
-    addr_reg = 0; addr_edu = 0; addr_jeungji = 0
-    if addr_count > 0:
-        addr_reg = 6000 * addr_count
-        addr_edu = 1200 * addr_count
-        addr_jeungji = 3000 * addr_count
-    
-    basic_reg = floor_10(amount * 0.002)
-    basic_edu = floor_10(basic_reg * 0.2)
-    final_reg = basic_reg + addr_reg
-    final_edu = basic_edu + addr_edu
-    jeungji = (18000 * parcels) + addr_jeungji 
-
-    bond = 0
-    if amount >= 20_000_000: bond = math.ceil(amount * 0.01 / 10000) * 10000
-    bond_disc = floor_10(bond * rate)
-    
-    data["등록면허세"] = final_reg
-    data["지방교육세"] = final_edu
-    data["증지대"] = jeungji
-    data["채권할인금액"] = bond_disc
-    
-    cost_total = final_reg + final_edu + jeungji + bond_disc
-    for k in MANUAL_COST_NAMES:
-        cost_total += parse_int_input(st.session_state.get('cost_manual_' + k, 0))
-    
-    data['공과금 총액'] = cost_total
-    data['총 합계'] = fee_total + cost_total
+    data.update(quote(
+        amount, parcels, rate,
+        address_changes=int(st.session_state.get('address_change_count', 0)),  # 계산 로직에서 미리 설정됨
+        creditor=st.session_state.get('tab3_creditor_select', ''),
+        base_fee=parse_int_input(data.get('기본료_val', 0)),
+        add_fee=parse_int_input(data.get('추가보수_val')),
+        etc_fee=parse_int_input(data.get('기타보수_val')),
+        discount=parse_int_input(data.get('할인금액')),
+        manual_costs={k: parse_int_input(st.session_state.get('cost_manual_' + k, 0)) for k in MANUAL_COST_NAMES},
+        show_fee=st.session_state['show_fee'],
+    ))
     return data
 
 def create_receipt_excel(data, template_path=None):
@@ -2198,7 +1476,7 @@ with tab2:
             if key in st.session_state:
                 val = st.session_state[key]
                 # 숫자만 추출
-                clean_val = re.sub(r'[^0-9]', '', str(val))
+                clean_val = NON_DIGIT_RE.sub('', str(val))
                 # 6자리 이상이면 하이픈 삽입
                 if len(clean_val) >= 6 and '-' not in val:
                     st.session_state[key] = f"{clean_val[:6]}-{clean_val[6:13]}"
@@ -2337,33 +1615,28 @@ with tab2:
     
     if uploaded_registry:
         if st.button("📋 부동산표시 추출", key='extract_estate_btn', use_container_width=True):
-            with st.spinner("등기부 분석 중..."):
-                data, debug = parse_registry_pdf(uploaded_registry)
+            extracted = extract_registry_with_progress(uploaded_registry, 'estate_stop_tab1')
+        else:
+            extracted = wait_registry_job(uploaded_registry, 'estate_stop_tab1')
+        if extracted:
+            data, debug = extracted
+            
+            # 디버그 정보를 session_state에 저장
+            st.session_state['estate_debug'] = debug
+            
+            if debug["errors"]:
+                pass  # 오류가 있으면 추출 결과 사용 안함
+            else:
+                formatted = format_estate_text(data)
+                st.session_state['estate_text'] = formatted
+                st.session_state['estate_text_area'] = formatted
                 
-                # 디버그 정보를 session_state에 저장
-                st.session_state['estate_debug'] = debug
+                # 위택스용 물건지 주소 자동 채움 (도로명주소 + 동 + 호)
+                물건지주소 = format_collateral_address(data)
+                if 물건지주소:
+                    st.session_state['_pending_collateral_addr'] = 물건지주소
                 
-                if debug["errors"]:
-                    pass  # 오류가 있으면 추출 결과 사용 안함
-                else:
-                    formatted = format_estate_text(data)
-                    st.session_state['estate_text'] = formatted
-                    st.session_state['estate_text_area'] = formatted
-                    
-                    # 위택스용 물건지 주소 자동 채움 (도로명주소 + 동 + 호)
-                    # 동명칭: 제1동 → 1동
-                    동 = data.get("동명칭", "").replace("제", "") if data.get("동명칭") else ""
-                    # 전유부분에서 호수 추출: 제5층 제507호 → 507호
-                    호_match = re.search(r'제(\d+)호', data.get("전유부분", ""))
-                    호 = f"{호_match.group(1)}호" if 호_match else ""
-                    
-                    if data["도로명주소"]:
-                        물건지주소 = f"{data['도로명주소']} {동} {호}".strip()
-                        # 연속 공백 제거
-                        물건지주소 = re.sub(r'\s+', ' ', 물건지주소)
-                        st.session_state['_pending_collateral_addr'] = 물건지주소
-                    
-                st.rerun()
+            st.rerun()
     
     # 디버깅 정보 표시 (session_state에서)
     if 'estate_debug' in st.session_state:
@@ -2407,6 +1680,55 @@ with tab2:
                     )
                 except Exception as e: st.error(f"오류: {e}")
     
+    # 일괄 생성 (CSV/XLSX)
+    with st.expander("📦 계약서 일괄 생성 (CSV/XLSX)", expanded=False):
+        st.caption("※ 1행 = 1건. 채권자는 등록된 금융사 이름이면 주소가 자동으로 들어갑니다. 작성일이 비어 있으면 위 작성일자를 사용합니다.")
+        st.download_button("📄 입력 양식 (CSV)", data=batch_contracts.sample_csv(), file_name="계약서_일괄생성_양식.csv", mime="text/csv", key="batch_sample_tab1")
+        batch_file = st.file_uploader("📤 건별 목록 업로드", type=['csv', 'xlsx'], key='batch_upload_tab1')
+        batch_output = st.radio("결과 형식", options=["ZIP (건별 PDF)", "병합 PDF 1개"], horizontal=True, key='batch_output_tab1')
+        if st.button("🚀 일괄 생성", key="batch_generate_tab1", disabled=batch_file is None or not LIBS_OK, use_container_width=True):
+            try:
+                cases = batch_contracts.read_cases(batch_file.getvalue(), batch_file.name)
+            except Exception as e:
+                cases = None
+                st.error(f"파일 읽기 오류: {e}")
+            if cases is not None and not cases:
+                st.warning("생성할 행이 없습니다.")
+            elif cases:
+                template_paths = {t: st.session_state['template_status'].get(t) for t in batch_contracts.CONTRACT_TYPES}
+                with st.spinner(f"{len(cases)}건 생성 중..."):
+                    result_bytes, report = batch_contracts.generate_contracts(
+                        cases, template_paths, FONT_PATH, creditors=CREDITORS,
+                        default_date=format_date_korean(st.session_state['input_date']),
+                        output="pdf" if batch_output.startswith("병합") else "zip"
+                    )
+                    # 병합 PDF: 건마다 반복되는 템플릿 폰트/이미지 중복 제거
+                    size_note = ""
+                    if result_bytes and batch_output.startswith("병합"):
+                        optimized, size_report = optimize_pdf(result_bytes)
+                        result_bytes = optimized.getvalue()
+                        size_note = format_saved(size_report)
+                st.session_state['batch_result_tab1'] = (result_bytes, report, batch_output, size_note)
+        
+        if st.session_state.get('batch_result_tab1'):
+            result_bytes, report, result_type, size_note = st.session_state['batch_result_tab1']
+            ok_count = sum(1 for r in report if r["결과"] == "성공")
+            if ok_count == len(report): st.success(f"✅ {ok_count}건 모두 생성")
+            else: st.warning(f"⚠️ {len(report)}건 중 {ok_count}건 성공, {len(report) - ok_count}건 실패")
+            st.dataframe(report, hide_index=True, use_container_width=True)
+            if result_bytes:
+                is_pdf = result_type.startswith("병합")
+                if size_note: st.caption(f"📉 파일 크기: {size_note}")
+                st.download_button(
+                    label="⬇️ 일괄 다운로드",
+                    data=result_bytes,
+                    file_name="근저당권설정_일괄.pdf" if is_pdf else "근저당권설정_일괄.zip",
+                    mime="application/pdf" if is_pdf else "application/zip",
+                    use_container_width=True,
+                    key="batch_download_tab1"
+                )
+            st.download_button("📋 결과표 (CSV)", data=batch_contracts.report_csv(report), file_name="일괄생성_결과.csv", mime="text/csv", key="batch_report_tab1")
+    
 # =============================================================================
 # Tab 4: 자필서명정보 작성
 # =============================================================================
@@ -2416,7 +1738,7 @@ with tab4:
         if key in st.session_state:
             val = st.session_state[key]
             # 숫자만 추출
-            clean_val = re.sub(r'[^0-9]', '', str(val))
+            clean_val = NON_DIGIT_RE.sub('', str(val))
             # 13자리(법인/주민)인 경우 6-7 포맷 적용
             if len(clean_val) == 13:
                 st.session_state[key] = f"{clean_val[:6]}-{clean_val[6:]}"
@@ -3255,6 +2577,42 @@ with tab5:
             else:
                 st.button("🏦 영수증 Excel 다운로드", disabled=True, use_container_width=True)
 
+    # =========================================================
+    # 4. 비용 조견표 (채권최고액 x 필지수 x 금융사, 전화 견적용)
+    # =========================================================
+    with st.expander("📊 비용 조견표 엑셀"):
+        col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+        with col_m1: matrix_start = st.number_input("채권최고액 시작 (만원)", min_value=100, value=1000, step=100, key='matrix_start')
+        with col_m2: matrix_stop = st.number_input("채권최고액 끝 (만원)", min_value=100, value=100000, step=100, key='matrix_stop')
+        with col_m3: matrix_step = st.number_input("간격 (만원)", min_value=100, value=500, step=100, key='matrix_step')
+        with col_m4: matrix_parcels = st.number_input("필지수 (최대)", min_value=1, max_value=10, value=5, key='matrix_parcels')
+        matrix_creditors = st.multiselect("금융사", list(CREDITORS.keys()), default=list(CREDITORS.keys()), key='matrix_creditors')
+        st.caption(f"채권할인율 {st.session_state['input_rate']}% · 보수액 {'포함' if st.session_state['show_fee'] else '제외'} (위 계산 설정 사용)")
+        
+        if st.button("📊 조견표 만들기", key='matrix_build_btn', use_container_width=True):
+            try:
+                matrix_rate = float(remove_commas(st.session_state['input_rate']))
+                matrix = build_fee_matrix(
+                    amount_steps(int(matrix_start) * 10000, int(matrix_stop) * 10000, int(matrix_step) * 10000),
+                    list(range(1, int(matrix_parcels) + 1)),
+                    {k: CREDITORS[k] for k in matrix_creditors},
+                    matrix_rate, show_fee=st.session_state['show_fee'],
+                )
+                st.session_state['fee_matrix_xlsx'] = write_fee_matrix_xlsx(matrix).getvalue()
+            except (ValueError, RuntimeError) as e:
+                st.session_state.pop('fee_matrix_xlsx', None)
+                st.error(f"❌ {e}")
+        
+        if st.session_state.get('fee_matrix_xlsx'):
+            st.download_button(
+                label="📥 조견표 Excel 다운로드",
+                data=st.session_state['fee_matrix_xlsx'],
+                file_name=f"비용조견표_{date.today():%Y%m%d}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True,
+                key="btn_matrix_download"
+            )
+
 
 # Tab 3: 말소문서
 # =============================================================================
@@ -3621,129 +2979,81 @@ with tab3:
     malso_prefix = {"근저당권": "근말", "질권": "질말", "전세권": "전말"}.get(malso_type, "말소")
     holder_name = st.session_state.get('malso_holder1_name', '고객') or '고객'
     
-    # 체크된 항목에 대해 바로 다운로드 버튼 표시
-    if chk_sig and PDF_OK:
-        try:
-            sig_template = resource_path("자필서명정보_서면_템플릿.pdf")
-            if os.path.exists(sig_template):
-                holders = []
-                if st.session_state.get('malso_holder1_name'):
-                    holders.append({
-                        'name': st.session_state.get('malso_holder1_name', ''),
-                        'rrn': st.session_state.get('malso_holder1_rrn', ''),
-                        'addr': st.session_state.get('malso_holder1_addr', '')
-                    })
-                if st.session_state.get('malso_holder2_name'):
-                    holders.append({
-                        'name': st.session_state.get('malso_holder2_name', ''),
-                        'rrn': st.session_state.get('malso_holder2_rrn', ''),
-                        'addr': st.session_state.get('malso_holder2_addr', '')
-                    })
-                sig_data = {
-                    'date': format_date_korean(st.session_state.get('malso_cause_date', datetime.now().date())),
-                    'estate_list': st.session_state.get('malso_estate_detail', '').strip().split('\n'),
-                    'holders': holders,
-                    'purpose': f"{malso_type}말소"
-                }
-                pdf_buffer = make_malso_signature_pdf(sig_template, sig_data)
-                st.download_button(
-                    label="⬇️ 자필서명정보 다운로드",
-                    data=pdf_buffer,
-                    file_name=f"{malso_prefix}_{holder_name}_자필서명정보.pdf",
-                    mime="application/pdf",
-                    use_container_width=True,
-                    key="dl_malso_sig"
-                )
-        except Exception as e:
-            st.error(f"자필서명정보 생성 오류: {e}")
-    
-    if chk_power and PDF_OK:
-        try:
-            power_template_path = resource_path("말소_위임장.pdf")
-            if os.path.exists(power_template_path):
-                power_data = {
-                    'date': format_date_korean(st.session_state.get('malso_cause_date', datetime.now().date())),
-                    'malso_type': malso_type,
-                    'obligor_label': obligor_label,
-                    'obligor_name': st.session_state.get('malso_obligor_name', ''),
-                    'obligor_id': st.session_state.get('malso_obligor_id', ''),
-                    'obligor_addr': st.session_state.get('malso_obligor_addr', ''),
-                    'obligor_rep': st.session_state.get('malso_obligor_rep', ''),
-                    'obligor_branch': st.session_state.get('malso_obligor_branch', ''),
-                    'holder1_name': st.session_state.get('malso_holder1_name', ''),
-                    'holder1_addr': st.session_state.get('malso_holder1_addr', ''),
-                    'holder2_name': st.session_state.get('malso_holder2_name', ''),
-                    'holder2_addr': st.session_state.get('malso_holder2_addr', ''),
-                    'estate_text': st.session_state.get('malso_estate_detail', ''),
-                    'cancel_text': st.session_state.get('malso_cancel_text', '')
-                }
-                pdf_buffer = make_malso_power_pdf(power_template_path, power_data)
-                st.download_button(
-                    label="⬇️ 위임장 다운로드",
-                    data=pdf_buffer,
-                    file_name=f"{malso_prefix}_{holder_name}_위임장.pdf",
-                    mime="application/pdf",
-                    use_container_width=True,
-                    key="dl_malso_power"
-                )
-        except Exception as e:
-            st.error(f"위임장 생성 오류: {e}")
-    
-    if chk_term and PDF_OK:
-        try:
-            term_data = {
-                'date': format_date_korean(st.session_state.get('malso_cause_date', datetime.now().date())),
-                'malso_type': malso_type,
-                'obligor_label': obligor_label,
-                'obligor_name': st.session_state.get('malso_obligor_name', ''),
-                'obligor_id': st.session_state.get('malso_obligor_id', ''),
-                'obligor_addr': st.session_state.get('malso_obligor_addr', ''),
-                'obligor_rep': st.session_state.get('malso_obligor_rep', ''),
-                'obligor_branch': st.session_state.get('malso_obligor_branch', ''),
-                'holder1_name': st.session_state.get('malso_holder1_name', ''),
-                'holder2_name': st.session_state.get('malso_holder2_name', ''),
-                'estate_text': st.session_state.get('malso_estate_detail', ''),
-                'cancel_text': st.session_state.get('malso_cancel_text', '')
-            }
-            pdf_buffer = make_malso_termination_pdf(term_data)
-            st.download_button(
-                label="⬇️ 해지증서 다운로드",
-                data=pdf_buffer,
-                file_name=f"{malso_prefix}_{holder_name}_해지증서.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-                key="dl_malso_term"
-            )
-        except Exception as e:
-            st.error(f"해지증서 생성 오류: {e}")
+    # 체크된 문서를 한 번에 생성 (병렬) → 다운로드 1개
+    malso_date = format_date_korean(st.session_state.get('malso_cause_date', datetime.now().date()))
+    malso_common = {
+        'date': malso_date,
+        'malso_type': malso_type,
+        'obligor_label': obligor_label,
+        'obligor_name': st.session_state.get('malso_obligor_name', ''),
+        'obligor_id': st.session_state.get('malso_obligor_id', ''),
+        'obligor_addr': st.session_state.get('malso_obligor_addr', ''),
+        'obligor_rep': st.session_state.get('malso_obligor_rep', ''),
+        'obligor_branch': st.session_state.get('malso_obligor_branch', ''),
+        'estate_text': st.session_state.get('malso_estate_detail', ''),
+        'cancel_text': st.session_state.get('malso_cancel_text', '')
+    }
+    malso_docs = {}
+    if chk_sig:
+        holders = []
+        if st.session_state.get('malso_holder1_name'):
+            holders.append({
+                'name': st.session_state.get('malso_holder1_name', ''),
+                'rrn': st.session_state.get('malso_holder1_rrn', ''),
+                'addr': st.session_state.get('malso_holder1_addr', '')
+            })
+        if st.session_state.get('malso_holder2_name'):
+            holders.append({
+                'name': st.session_state.get('malso_holder2_name', ''),
+                'rrn': st.session_state.get('malso_holder2_rrn', ''),
+                'addr': st.session_state.get('malso_holder2_addr', '')
+            })
+        malso_docs['자필서명정보'] = {
+            'date': malso_date,
+            'estate_list': st.session_state.get('malso_estate_detail', '').strip().split('\n'),
+            'holders': holders,
+            'purpose': f"{malso_type}말소"
+        }
+    if chk_power:
+        malso_docs['위임장'] = dict(
+            malso_common,
+            holder1_name=st.session_state.get('malso_holder1_name', ''),
+            holder1_addr=st.session_state.get('malso_holder1_addr', ''),
+            holder2_name=st.session_state.get('malso_holder2_name', ''),
+            holder2_addr=st.session_state.get('malso_holder2_addr', '')
+        )
+    if chk_term:
+        malso_docs['해지증서'] = dict(
+            malso_common,
+            holder1_name=st.session_state.get('malso_holder1_name', ''),
+            holder2_name=st.session_state.get('malso_holder2_name', '')
+        )
+    if chk_transfer:
+        malso_docs['이관증명서'] = dict(
+            malso_common,
+            from_branch=st.session_state.get('malso_from_branch', ''),
+            to_branch=st.session_state.get('malso_to_branch', '')
+        )
     
-    if chk_transfer and PDF_OK:
-        try:
-            transfer_data = {
-                'date': format_date_korean(st.session_state.get('malso_cause_date', datetime.now().date())),
-                'malso_type': malso_type,
-                'obligor_label': obligor_label,
-                'obligor_name': st.session_state.get('malso_obligor_name', ''),
-                'obligor_id': st.session_state.get('malso_obligor_id', ''),
-                'obligor_addr': st.session_state.get('malso_obligor_addr', ''),
-                'obligor_rep': st.session_state.get('malso_obligor_rep', ''),
-                'obligor_branch': st.session_state.get('malso_obligor_branch', ''),
-                'estate_text': st.session_state.get('malso_estate_detail', ''),
-                'cancel_text': st.session_state.get('malso_cancel_text', ''),
-                'from_branch': st.session_state.get('malso_from_branch', ''),
-                'to_branch': st.session_state.get('malso_to_branch', '')
-            }
-            pdf_buffer = make_malso_transfer_pdf(transfer_data)
+    if malso_docs and PDF_OK:
+        bundle_format = st.radio("받을 형식", options=["PDF 1개로 합치기", "ZIP (문서별 PDF)"], horizontal=True, key="malso_bundle_format")
+        as_zip = bundle_format.startswith("ZIP")
+        bundle_buffer, bundle_errors = make_malso_bundle(
+            malso_docs, output="zip" if as_zip else "pdf",
+            file_prefix=f"{malso_prefix}_{holder_name}"
+        )
+        for doc_name, err in bundle_errors.items():
+            st.error(f"{doc_name} 생성 오류: {err}")
+        if bundle_buffer is not None:
+            made = [name for name in malso_docs if name not in bundle_errors]
             st.download_button(
-                label="⬇️ 이관증명서 다운로드",
-                data=pdf_buffer,
-                file_name=f"{malso_prefix}_{holder_name}_이관증명서.pdf",
-                mime="application/pdf",
+                label=f"⬇️ {' · '.join(made)} 다운로드",
+                data=bundle_buffer,
+                file_name=f"{malso_prefix}_{holder_name}_말소서류.{'zip' if as_zip else 'pdf'}",
+                mime="application/zip" if as_zip else "application/pdf",
                 use_container_width=True,
-                key="dl_malso_transfer"
+                key="dl_malso_bundle"
             )
-        except Exception as e:
-            st.error(f"이관증명서 생성 오류: {e}")
     
     # 안내 메시지
     st.info("💡 **사용 방법**: '📥 대부업(전자설정)내용 가져오기' 버튼을 눌러 소유자 정보와 부동산 표시를 자동으로 불러올 수 있습니다.")
@@ -3799,8 +3109,8 @@ with tab1:
     
     # 거래은행 선택
     st.markdown("#### 🏛️ 거래은행 선택")
-    bank_cols = st.columns(3)
-    bank_list = ["하나은행", "신한은행", "우리은행"]
+    bank_list = BANK_LIST or ["하나은행", "신한은행", "우리은행"]
+    bank_cols = st.columns(len(bank_list))
     current_bank = st.session_state.get('tab5_bank', '하나은행')
     
     for i, bank in enumerate(bank_list):
@@ -3851,21 +3161,24 @@ with tab1:
     
     # PDF 업로드 시 추출 버튼
     if uploaded_registry is not None:
-        if st.button("📋 부동산표시 추출", key='extract_estate_btn_tab5', use_container_width=True):
-            with st.spinner("등기부 분석 중..."):
-                try:
-                    data, debug = parse_registry_pdf(uploaded_registry)
-                    
-                    if debug["errors"]:
-                        for err in debug["errors"]:
-                            st.error(f"❌ {err}")
-                    else:
-                        formatted = format_estate_text(data)
-                        st.session_state['tab5_estate_input'] = formatted
-                        st.session_state['_tab5_extract_done'] = True
-                        st.rerun()
-                except Exception as e:
-                    st.error(f"❌ PDF 파싱 오류: {e}")
+        try:
+            if st.button("📋 부동산표시 추출", key='extract_estate_btn_tab5', use_container_width=True):
+                extracted = extract_registry_with_progress(uploaded_registry, 'estate_stop_tab5')
+            else:
+                extracted = wait_registry_job(uploaded_registry, 'estate_stop_tab5')
+            if extracted:
+                data, debug = extracted
+                
+                if debug["errors"]:
+                    for err in debug["errors"]:
+                        st.error(f"❌ {err}")
+                else:
+                    formatted = format_estate_text(data)
+                    st.session_state['tab5_estate_input'] = formatted
+                    st.session_state['_tab5_extract_done'] = True
+                    st.rerun()
+        except Exception as e:
+            st.error(f"❌ PDF 파싱 오류: {e}")
     
     # 추출 완료 메시지
     if st.session_state.get('_tab5_extract_done'):
@@ -3903,7 +3216,7 @@ with tab1:
         """6자리 입력 시 자동으로 '-' 삽입"""
         if key in st.session_state:
             val = st.session_state[key]
-            clean_val = re.sub(r'[^0-9]', '', str(val))
+            clean_val = NON_DIGIT_RE.sub('', str(val))
             if len(clean_val) >= 6 and '-' not in val:
                 st.session_state[key] = f"{clean_val[:6]}-{clean_val[6:13]}"
             elif len(clean_val) > 13:
@@ -4045,7 +3358,41 @@ with tab1:
                 )
         
         st.session_state['_tab5_sig_ready'] = False
-    
+
+    # 부동산표시 일괄 생성 (여러 건 × 은행 × 설정계약서/위임장 → PDF 1개)
+    with st.expander("📦 부동산표시 일괄 생성 (여러 건)", expanded=False):
+        st.caption("※ 건과 건 사이는 빈 줄 1개로 구분합니다. 선택한 은행·문서 조합마다 1페이지씩, 전체를 PDF 1개로 만듭니다.")
+        bulk_text = st.text_area("부동산표시 목록", height=200, key="tab5_bulk_estates")
+        bulk_cols = st.columns(2)
+        bulk_banks = bulk_cols[0].multiselect("은행", options=bank_list, default=[selected_bank] if selected_bank in bank_list else [], key="tab5_bulk_banks")
+        bulk_docs = bulk_cols[1].multiselect("문서", options=["설정계약서", "위임장"], default=["설정계약서", "위임장"], key="tab5_bulk_docs")
+        if st.button("🚀 일괄 생성", key="tab5_bulk_generate", use_container_width=True, disabled=not PDF_OK):
+            estates = [e.strip() for e in re.split(r'\n\s*\n', bulk_text or '') if e.strip()]
+            if not estates or not bulk_banks or not bulk_docs:
+                st.warning("⚠️ 부동산표시, 은행, 문서를 1개 이상 선택하세요.")
+            else:
+                items = [(bank, doc, estate) for estate in estates for bank in bulk_banks for doc in bulk_docs]
+                try:
+                    bulk_pdf, bulk_report = render_bank_estates(items, FONT_PATH)
+                    for row, estate in zip(bulk_report, [item[2] for item in items]):
+                        row["부동산표시"] = estate.split('\n')[0]
+                    st.session_state['_tab5_bulk_result'] = (bulk_pdf.getvalue() if bulk_pdf else None, bulk_report)
+                except Exception as e:
+                    st.error(f"❌ PDF 생성 오류: {e}")
+
+        if st.session_state.get('_tab5_bulk_result'):
+            bulk_bytes, bulk_report = st.session_state['_tab5_bulk_result']
+            st.dataframe(bulk_report, hide_index=True, use_container_width=True)
+            if bulk_bytes:
+                st.download_button(
+                    label=f"⬇️ 일괄 다운로드 ({sum(1 for r in bulk_report if r['페이지'])}페이지)",
+                    data=bulk_bytes,
+                    file_name="시중은행_부동산표시_일괄.pdf",
+                    mime="application/pdf",
+                    use_container_width=True,
+                    key="dl_bulk_tab5"
+                )
+
     # 입력된 등기의무자 수 카운트
     owner_count = sum(1 for i in range(1, 4) if st.session_state.get(f'tab5_owner{i}_name_input', '').strip())
     
@@ -4447,7 +3794,7 @@ with tab6:
                 def auto_format_manual_rrn(key):
                     if key in st.session_state:
                         val = st.session_state[key]
-                        clean_val = re.sub(r'[^0-9]', '', str(val))
+                        clean_val = NON_DIGIT_RE.sub('', str(val))
                         if len(clean_val) >= 6 and '-' not in val:
                             st.session_state[key] = f"{clean_val[:6]}-{clean_val[6:13]}"
                 
@@ -4787,28 +4134,7 @@ with tab6:
 with tab7:
     st.markdown("### 🏢 법인등기 비용계산기")
     
-    # 법인등기 종류별 비용 데이터
-    CORP_REGISTRY_FEES = {
-        "대표자 주소변경": {"fee": 55000, "tax": 52240, "note": "", "docs": "초본 / 법인인감도장 / 대표자 금융인증서"},
-        "임원변경": {"fee": 55000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원, 사/취임원) / 법인인감도장 / 사/취 초본 / 전자증명서"},
-        "본점이전(관내)": {"fee": 99000, "tax": 156000, "note": "서울의 경우 산업단지에서 관내인지 확인", "docs": "정관 / 등기부등본 / 전자증명서 / 공증서류(필요시)"},
-        "상호변경": {"fee": 99000, "tax": 52240, "note": "공증 여부 확인, 관할내 동일상호 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
-        "목적변경": {"fee": 99000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
-        "지점설치": {"fee": 99000, "tax": 52240, "note": "타관할: 148,720원", "docs": "정관 / 등기부등본 / 전자증명서"},
-        "공고방법변경": {"fee": 99000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
-        "주식매수선택권 규정": {"fee": 154000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
-        "본점이전(타관)": {"fee": 154000, "tax": 0, "note": "이전 지역에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 전자증명서 / 공증서류(필요시)"},
-        "법인설립": {"fee": 165000, "tax": 0, "note": "자본금/본점에 따라 공과금 상이 (과밀:550,000 / 비과밀:280,000)", "docs": "전원 인증서 / 초본 / 잔고증명서"},
-        "법인설립(제휴)": {"fee": 99000, "tax": 0, "note": "자본금/본점에 따라 공과금 상이", "docs": "전원 인증서 / 초본 / 잔고증명서"},
-        "주식매수선택권 행사": {"fee": 165000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 청구인 정보 / 전자증명서(OTP 포함) / 잔고증명서"},
-        "유상증자(보통주)": {"fee": 209000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 신주인수인 정보 / 금융인증서(주주전원) / 전자증명서(OTP 포함) / 잔고증명서 / 공증서류(필요시)"},
-        "유상증자(우선주)": {"fee": 275000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 투자계약서(워드 또는 한글) / 금융인증서(주주전원) / 전자증명서(OTP 포함) / 잔고증명서 / 공증서류(필요시)"},
-        "유상증자(가수금)": {"fee": 220000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 전자증명서(OTP 포함) / 계정별원장(가수금) / 공증서류(필요시)"},
-        "감자등기": {"fee": 275000, "tax": 52240, "note": "공증 여부 확인 / 공고 별도", "docs": "-"},
-        "사채발행": {"fee": 275000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 투자계약서(워드 또는 한글) / 금융인증서(주주전원) / 전자증명서(OTP 포함)"},
-        "무상증자": {"fee": 363000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이, 공증 여부 확인", "docs": "-"},
-        "해산/청산": {"fee": 660000, "tax": 156720, "note": "공증 여부 확인", "docs": "-"},
-    }
+    # 법인등기 종류별 비용 데이터: fee_engine.CORP_REGISTRY_FEES
     
     # 3컬럼 레이아웃
     col_sec1, col_sec2, col_sec3 = st.columns([1.2, 1, 1])
@@ -4834,22 +4160,20 @@ with tab7:
         st.markdown("#### ➕ 추가 옵션")
         
         add_notary = st.checkbox("공증료 추가", key="corp_add_notary")
+        notary_kind = None
         if add_notary:
             notary_type = st.radio("", ["일반 (30,000원)", "특별 (60,000원)"], key="corp_notary_type", horizontal=True, label_visibility="collapsed")
-            notary_tax = 30000 if "30,000" in notary_type else 60000
-        else:
-            notary_tax = 0
+            notary_kind = "일반" if "30,000" in notary_type else "특별"
         
         add_cert = st.checkbox("전자증명서 발급대행 (+55,000원)", key="corp_add_cert")
         
         # 목적 추가 (법인설립 시)
-        extra_purpose_fee = 0
+        purpose_count = 10
         if "법인설립" in selected_type:
             st.markdown("---")
             purpose_count = st.number_input("목적 개수 (기본 10개)", min_value=10, value=10, step=10, key="corp_purpose_count")
-            if purpose_count > 10:
-                extra_sets = (purpose_count - 10) // 10
-                extra_purpose_fee = extra_sets * 22000
+            extra_purpose_fee = corp_extra_purpose_fee(selected_type, purpose_count)
+            if extra_purpose_fee:
                 st.caption(f"※ 추가 +{extra_purpose_fee:,}원")
         
         # 공과금 직접 입력 (변동 항목용)
@@ -4870,13 +4194,10 @@ with tab7:
         st.markdown("#### 💰 비용 계산")
         
         # 자동 계산값
-        auto_base_fee = selected_info["fee"]
-        auto_notary_fee = 110000 if add_notary else 0
-        auto_cert_fee = 55000 if add_cert else 0
-        auto_total_fee = auto_base_fee + auto_notary_fee + auto_cert_fee + extra_purpose_fee
-        auto_base_tax = manual_tax
-        auto_notary_tax = notary_tax if add_notary else 0
-        auto_total_tax = auto_base_tax + auto_notary_tax
+        auto_quote = quote_corp_registry(selected_type, notary=notary_kind, cert=add_cert,
+                                         purpose_count=purpose_count, manual_tax=manual_tax)
+        auto_total_fee = auto_quote["대행료"]
+        auto_total_tax = auto_quote["공과금"]
         
         # 세션 상태 초기화 (등기 종류 변경 시)
         if st.session_state.get('corp_last_type') != selected_type:
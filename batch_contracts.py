@@ -0,0 +1,368 @@
+"""
+근저당권설정계약서 일괄 생성 (Batch Contracts)
+- CSV/XLSX 한 장(건별 1행)으로 계약서를 한 번에 생성
+- 건별 작업을 프로세스 풀로 나눠서 처리 (작업 프로세스마다 템플릿/폰트/레이아웃/채권자 고정 레이어 캐시 사용)
+- 결과는 ZIP(건별 PDF + 결과표) 또는 병합 PDF 1개, 행별 성공/실패 결과표 함께 반환
+
+열 이름 (한글/영문 모두 인식)
+  채권자(creditor), 채권자주소(creditor_addr), 채무자(debtor), 채무자주소(debtor_addr),
+  소유자(owner), 소유자주소(owner_addr), 채권최고액(amount), 부동산표시(estate),
+  계약유형(contract_type: 개인/3자담보/공동담보), 담보유형(guarantee: 한정근담보/포괄근담보), 작성일(date)
+"""
+
+import csv
+import io
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+
+try:
+    import openpyxl
+    EXCEL_OK = True
+except Exception:
+    openpyxl = None
+    EXCEL_OK = False
+
+try:
+    from PyPDF2 import PdfReader, PdfWriter
+    PDF_OK = True
+except Exception:
+    PdfReader = None
+    PdfWriter = None
+    PDF_OK = False
+
+from korean_amount import convert_amounts_to_korean, convert_multiple_amounts_to_korean
+
+
+CONTRACT_TYPES = ("개인", "3자담보", "공동담보")
+GUARANTEE_TYPES = ("한정근담보", "포괄근담보")
+
+# 표준 열 이름 → 인식할 머리글
+COLUMN_ALIASES = {
+    "creditor": ["채권자", "근저당권자", "creditor"],
+    "creditor_addr": ["채권자주소", "채권자 주소", "creditor_addr"],
+    "debtor": ["채무자", "debtor", "debtor_name"],
+    "debtor_addr": ["채무자주소", "채무자 주소", "debtor_addr"],
+    "owner": ["소유자", "설정자", "owner", "owner_name"],
+    "owner_addr": ["소유자주소", "소유자 주소", "설정자주소", "owner_addr"],
+    "amount": ["채권최고액", "금액", "amount"],
+    "estate": ["부동산표시", "부동산 표시", "estate", "estate_text"],
+    "contract_type": ["계약유형", "계약서유형", "contract_type"],
+    "guarantee": ["담보유형", "담보종류", "guarantee", "guarantee_type"],
+    "date": ["작성일", "작성일자", "date"],
+}
+
+SAMPLE_HEADER = ["채권자", "채무자", "채무자주소", "소유자", "소유자주소", "채권최고액", "부동산표시", "계약유형", "담보유형"]
+
+# 이보다 적으면 프로세스를 띄우지 않고 바로 처리
+MIN_ROWS_FOR_POOL = 4
+INVALID_FILENAME_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]')   # 경로 구분자 + Windows에서 파일 이름에 못 쓰는 문자
+
+
+# =========================================================
+# 입력 파일 읽기
+# =========================================================
+def _normalize_header(name):
+    return str(name or "").replace("﻿", "").strip().lower()
+
+
+def _build_column_map(header):
+    """머리글 목록 → {표준 열 이름: 열 번호}"""
+    lookup = {}
+    for key, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            lookup[_normalize_header(alias)] = key
+    column_map = {}
+    for idx, name in enumerate(header):
+        key = lookup.get(_normalize_header(name))
+        if key and key not in column_map:
+            column_map[key] = idx
+    return column_map
+
+
+def _cell_to_str(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (datetime, date)):
+        return f"{value.year}년 {value.month:02d}월 {value.day:02d}일"
+    return str(value).strip()
+
+
+def _rows_to_cases(rows):
+    rows = [list(r) for r in rows]
+    if not rows:
+        return []
+    column_map = _build_column_map(rows[0])
+    if "debtor" not in column_map and "owner" not in column_map:
+        raise ValueError("머리글에 채무자 또는 소유자 열이 없습니다.")
+    cases = []
+    for line_no, row in enumerate(rows[1:], start=2):
+        case = {key: _cell_to_str(row[idx]) if idx < len(row) else "" for key, idx in column_map.items()}
+        if not any(case.values()):
+            continue
+        case["row"] = line_no
+        cases.append(case)
+    return cases
+
+
+def read_cases(file_bytes, filename):
+    """CSV/XLSX 바이트 → 건별 dict 목록 (row = 원본 파일의 행 번호)"""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        if not EXCEL_OK:
+            raise RuntimeError("openpyxl이 설치되지 않아 엑셀 파일을 읽을 수 없습니다.")
+        wb = openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+        try:
+            return _rows_to_cases(wb.active.iter_rows(values_only=True))
+        finally:
+            wb.close()
+
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            text = file_bytes.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError("CSV 인코딩을 알 수 없습니다. (UTF-8 또는 CP949)")
+    return _rows_to_cases(csv.reader(io.StringIO(text)))
+
+
+def sample_csv():
+    """입력 양식 CSV (엑셀에서 바로 열리도록 BOM 포함)"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(SAMPLE_HEADER)
+    writer.writerow(["(주)티플레인대부", "홍길동", "서울특별시 강남구 테헤란로 1", "홍길동", "서울특별시 강남구 테헤란로 1",
+                     "120,000,000", "[집합건물] 서울특별시 강남구 역삼동 1 제101동 제1001호", "개인", "한정근담보"])
+    return ("﻿" + buf.getvalue()).encode("utf-8")
+
+
+# =========================================================
+# 건별 데이터
+# =========================================================
+def _find_creditor(name, creditors):
+    """채권자 이름 → (계약서 표기명, 주소) - CREDITORS 키와 일치 또는 앞부분 일치"""
+    if not name:
+        return "", ""
+    if name in creditors:
+        return name, creditors[name].get("addr", "")
+    compact = name.replace(" ", "")
+    for key, info in creditors.items():
+        if key.replace(" ", "").startswith(compact):
+            return key, info.get("addr", "")
+    return name, ""
+
+
+def _case_amount(case):
+    return case.get("amount", "").replace(",", "")
+
+
+def build_contract_data(case, creditors=None, default_date="", claim_amount=None):
+    """입력 1행 → make_pdf 데이터 (탭2 계약서 생성과 같은 형식)
+
+    claim_amount: 미리 변환한 채권최고액 한글 표기 (없으면 여기서 변환)
+    """
+    creditors = creditors or {}
+    contract_type = case.get("contract_type") or "개인"
+    if contract_type not in CONTRACT_TYPES:
+        raise ValueError(f"계약유형 오류: {contract_type} (개인/3자담보/공동담보)")
+    guarantee = case.get("guarantee") or "한정근담보"
+    if guarantee not in GUARANTEE_TYPES:
+        raise ValueError(f"담보유형 오류: {guarantee} (한정근담보/포괄근담보)")
+
+    creditor_name, creditor_addr = _find_creditor(case.get("creditor", ""), creditors)
+    if case.get("creditor_addr"):
+        creditor_addr = case["creditor_addr"]
+
+    debtor = case.get("debtor", "")
+    owner = case.get("owner", "")
+    # 개인: 채무자 = 소유자
+    if contract_type == "개인":
+        debtor = debtor or owner
+        owner = owner or debtor
+    debtor_addr = case.get("debtor_addr", "")
+    owner_addr = case.get("owner_addr", "") or (debtor_addr if owner == debtor else "")
+
+    if claim_amount is None:
+        claim_amount = convert_multiple_amounts_to_korean(_case_amount(case))
+    if not claim_amount:
+        raise ValueError("채권최고액이 비어 있거나 숫자가 아닙니다.")
+
+    estate = case.get("estate", "").strip()
+    return {
+        "date": case.get("date") or default_date,
+        "creditor_name": creditor_name, "creditor_addr": creditor_addr,
+        "debtor_name": debtor, "debtor_addr": debtor_addr,
+        "owner_name": owner, "owner_addr": owner_addr,
+        "guarantee_type": guarantee, "claim_amount": claim_amount,
+        "estate_list": estate.split("\n"), "contract_type": contract_type,
+    }
+
+
+# =========================================================
+# 생성 (작업 프로세스)
+# =========================================================
+def _render_case(job):
+    """작업 프로세스에서 실행: (row, 데이터, 템플릿, 폰트) → (row, PDF 바이트, 오류)"""
+    row, data, template_path, font_path = job
+    try:
+        from overlay_layout import render_layout
+        from template_cache import merge_overlay
+        return row, merge_overlay(template_path, render_layout("contract", data, font_path)).getvalue(), ""
+    except Exception as e:
+        return row, None, f"{type(e).__name__}: {e}"
+
+
+def _error_result(job, error):
+    """작업 프로세스가 결과를 돌려주지 못한 건 (프로세스 비정상 종료 등)"""
+    return job[0], None, f"{type(error).__name__}: {error}"
+
+
+def _run_jobs(jobs, max_workers=None):
+    """건별 결과 (row, PDF 바이트, 오류) 목록 - row 순서"""
+    if len(jobs) < MIN_ROWS_FOR_POOL or max_workers == 1:
+        return [_render_case(job) for job in jobs]
+    try:
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    except Exception:
+        # 프로세스를 띄울 수 없는 환경(실행파일 등)에서는 순서대로 처리
+        return [_render_case(job) for job in jobs]
+    # 작업 프로세스 하나가 죽으면 풀 전체가 깨져서 끝나지 않은 건이 모두 BrokenProcessPool로 끝남
+    # → 끝난 결과는 그대로 두고 남은 건만 따로 다시 처리
+    results = []
+    unfinished = []
+    with pool:
+        futures = {pool.submit(_render_case, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results.append(future.result())
+            except BrokenProcessPool:
+                unfinished.append(job)
+            except Exception as e:
+                results.append(_error_result(job, e))
+    if unfinished:
+        print(f"⚠️ 작업 프로세스가 비정상 종료됨 - 남은 {len(unfinished)}건은 하나씩 다시 처리", file=sys.stderr)
+        results.extend(_run_isolated(sorted(unfinished, key=lambda job: job[0])))
+    results.sort(key=lambda result: result[0])
+    return results
+
+
+def _run_isolated(jobs):
+    """건마다 작업 프로세스 1개에서 차례로 처리 - 프로세스가 죽은 건만 오류 기록 후 새 프로세스로 계속"""
+    results = []
+    pool = None
+    try:
+        for job in jobs:
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=1)
+            try:
+                results.append(pool.submit(_render_case, job).result())
+            except BrokenProcessPool as e:
+                pool.shutdown(wait=False)
+                pool = None
+                results.append(_error_result(job, e))
+            except Exception as e:
+                results.append(_error_result(job, e))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results
+
+
+def _safe_name(name):
+    """CSV 값으로 만든 파일 이름 → ZIP 항목으로 안전한 이름 (경로 구분자, .., 파일 이름에 못 쓰는 문자 제거)"""
+    name = INVALID_FILENAME_RE.sub("_", name)
+    name = re.sub(r"\.{2,}", ".", name).strip(" .")
+    return name or "이름없음"
+
+
+def _unique_name(name, used):
+    base, ext = os.path.splitext(name)
+    candidate = name
+    n = 2
+    while candidate in used:
+        candidate = f"{base}_{n}{ext}"
+        n += 1
+    used.add(candidate)
+    return candidate
+
+
+def report_csv(report):
+    """결과표 → CSV 바이트"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["행", "채무자", "계약유형", "결과", "파일명", "오류"])
+    for r in report:
+        writer.writerow([r["행"], r["채무자"], r["계약유형"], r["결과"], r["파일명"], r["오류"]])
+    return ("﻿" + buf.getvalue()).encode("utf-8")
+
+
+def generate_contracts(cases, template_paths, font_path, creditors=None, default_date="",
+                       output="zip", max_workers=None):
+    """일괄 생성
+
+    cases: read_cases 결과, template_paths: {"개인": 1.pdf 경로, ...}
+    output: "zip" (건별 PDF + 결과.csv) 또는 "pdf" (성공 건 병합)
+    반환: (결과 바이트 또는 None, 결과표 list[dict])
+    """
+    report = []
+    jobs = []
+    # 채권최고액 한글 표기는 전체 행을 한 번에 (같은 금액은 한 번만 변환)
+    claim_amounts = convert_amounts_to_korean([_case_amount(case) for case in cases])
+    for case, claim_amount in zip(cases, claim_amounts):
+        entry = {"행": case.get("row", ""), "채무자": case.get("debtor") or case.get("owner", ""),
+                 "계약유형": case.get("contract_type") or "개인", "결과": "", "파일명": "", "오류": ""}
+        report.append(entry)
+        try:
+            data = build_contract_data(case, creditors, default_date, claim_amount)
+            template_path = template_paths.get(data["contract_type"])
+            if not template_path or not os.path.exists(template_path):
+                raise FileNotFoundError(f"{data['contract_type']} 템플릿 없음")
+        except Exception as e:
+            entry["결과"] = "실패"
+            entry["오류"] = str(e)
+            continue
+        jobs.append((len(report) - 1, data, template_path, font_path))
+
+    names = {}
+    used = set()
+    for idx, data, _, _ in jobs:
+        names[idx] = _unique_name(_safe_name(f"근저당권설정_{data['debtor_name'] or data['owner_name']}.pdf"), used)
+
+    results = _run_jobs(jobs, max_workers)
+
+    pdfs = []
+    for idx, pdf_bytes, error in results:
+        entry = report[idx]
+        if pdf_bytes is None:
+            entry["결과"] = "실패"
+            entry["오류"] = error
+        else:
+            entry["결과"] = "성공"
+            entry["파일명"] = names[idx]
+            pdfs.append((names[idx], pdf_bytes))
+
+    if not pdfs:
+        return None, report
+
+    out = io.BytesIO()
+    if output == "pdf":
+        writer = PdfWriter()
+        for _, pdf_bytes in pdfs:
+            for page in PdfReader(io.BytesIO(pdf_bytes)).pages:
+                writer.add_page(page)
+        writer.write(out)
+    else:
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, pdf_bytes in pdfs:
+                zf.writestr(name, pdf_bytes)
+            zf.writestr("결과.csv", report_csv(report))
+    return out.getvalue(), report
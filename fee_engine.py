@@ -0,0 +1,396 @@
+"""
+등기 비용 계산 (Fee Engine)
+- 근저당 설정 보수액(기본료/공급가액/부가세)과 공과금(등록면허세/지방교육세/증지대/채권할인금액) 계산
+- Streamlit session_state 없이 입력값만으로 계산 - app.py calculate_all, 금융사 요율표 일괄 견적에서 함께 사용
+- quote: 1건, quote_batch: NumPy 배열로 여러 건 한 번에 (결과 항목은 quote와 같음)
+- quote_corp_registry: 법인등기 (CORP_REGISTRY_FEES) 대행료/공과금
+- 보수표/공과금 요율은 fee_schedules/<시행일>.json 파일로 관리, 계산 기준일(as_of)의 요율 사용
+- 보수표 개정 = fee_schedules/ 에 새 시행일 파일 추가 (바뀐 항목만 적으면 나머지는 이전 판 값)
+
+요율 파일 형식
+{
+  "name": "법무사 보수표 (2024.9.12 시행)",
+  "effective": "2024-09-12",                       # 시행일 (이 날부터 다음 판 시행일 전날까지 적용)
+  "base_fee": [[상한, 기본 금액, 구간 시작, 초과분 1만원당 가산액], ...],   # 마지막 구간 상한은 null
+  "vat_rate": 0.1,
+  "reg_tax_rate": 0.002,        # 등록면허세: 채권최고액 x
+  "edu_tax_rate": 0.2,          # 지방교육세: 등록면허세 x
+  "stamp_per_parcel": 18000,    # 증지대: 필지당
+  "bond_min_amount": 20000000,  # 국민주택채권 매입 대상 채권최고액 (이상)
+  "bond_rate": 0.01,            # 채권 매입액: 채권최고액 x (1만원 단위 올림)
+  "addr_change_reg": 6000, "addr_change_edu": 1200, "addr_change_stamp": 3000   # 주소변경 1건당
+}
+"""
+
+import bisect
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+try:
+    import numpy as np
+    NUMPY_OK = True
+except Exception:
+    np = None
+    NUMPY_OK = False
+
+
+FEE_SCHEDULE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fee_schedules")
+
+# 기본료 고정 금융사 (수기입력/보수표 대신 항상 이 금액)
+FIXED_BASE_FEES = {
+    "㈜엘하비스트대부 대표이사 김상수": 70_000,
+}
+
+# 수기입력 공과금 항목 (cost_manual_*)
+MANUAL_COST_NAMES = ["제증명", "교통비", "원인증서", "주소변경", "확인서면", "선순위 말소"]
+
+# quote/quote_batch 결과 항목 (calculate_all이 data에 채우는 키)
+QUOTE_FIELDS = ["기본료", "기본료_자동", "공급가액", "부가세", "보수총액",
+                "등록면허세", "지방교육세", "증지대", "채권할인금액", "공과금 총액", "총 합계"]
+
+# 법인등기 종류별 대행료(fee)/공과금(tax) - tax 0은 사건마다 달라 직접 입력
+CORP_REGISTRY_FEES = {
+    "대표자 주소변경": {"fee": 55000, "tax": 52240, "note": "", "docs": "초본 / 법인인감도장 / 대표자 금융인증서"},
+    "임원변경": {"fee": 55000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원, 사/취임원) / 법인인감도장 / 사/취 초본 / 전자증명서"},
+    "본점이전(관내)": {"fee": 99000, "tax": 156000, "note": "서울의 경우 산업단지에서 관내인지 확인", "docs": "정관 / 등기부등본 / 전자증명서 / 공증서류(필요시)"},
+    "상호변경": {"fee": 99000, "tax": 52240, "note": "공증 여부 확인, 관할내 동일상호 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
+    "목적변경": {"fee": 99000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
+    "지점설치": {"fee": 99000, "tax": 52240, "note": "타관할: 148,720원", "docs": "정관 / 등기부등본 / 전자증명서"},
+    "공고방법변경": {"fee": 99000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
+    "주식매수선택권 규정": {"fee": 154000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 공증서류(필요시) / 전자증명서"},
+    "본점이전(타관)": {"fee": 154000, "tax": 0, "note": "이전 지역에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 전자증명서 / 공증서류(필요시)"},
+    "법인설립": {"fee": 165000, "tax": 0, "note": "자본금/본점에 따라 공과금 상이 (과밀:550,000 / 비과밀:280,000)", "docs": "전원 인증서 / 초본 / 잔고증명서"},
+    "법인설립(제휴)": {"fee": 99000, "tax": 0, "note": "자본금/본점에 따라 공과금 상이", "docs": "전원 인증서 / 초본 / 잔고증명서"},
+    "주식매수선택권 행사": {"fee": 165000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 청구인 정보 / 전자증명서(OTP 포함) / 잔고증명서"},
+    "유상증자(보통주)": {"fee": 209000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 신주인수인 정보 / 금융인증서(주주전원) / 전자증명서(OTP 포함) / 잔고증명서 / 공증서류(필요시)"},
+    "유상증자(우선주)": {"fee": 275000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 투자계약서(워드 또는 한글) / 금융인증서(주주전원) / 전자증명서(OTP 포함) / 잔고증명서 / 공증서류(필요시)"},
+    "유상증자(가수금)": {"fee": 220000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이", "docs": "정관 / 주주명부 / 등기부등본 / 금융인증서(주주전원) / 전자증명서(OTP 포함) / 계정별원장(가수금) / 공증서류(필요시)"},
+    "감자등기": {"fee": 275000, "tax": 52240, "note": "공증 여부 확인 / 공고 별도", "docs": "-"},
+    "사채발행": {"fee": 275000, "tax": 52240, "note": "공증 여부 확인", "docs": "정관 / 주주명부 / 등기부등본 / 투자계약서(워드 또는 한글) / 금융인증서(주주전원) / 전자증명서(OTP 포함)"},
+    "무상증자": {"fee": 363000, "tax": 0, "note": "설립연도/지역/증자금액에 따라 공과금 상이, 공증 여부 확인", "docs": "-"},
+    "해산/청산": {"fee": 660000, "tax": 156720, "note": "공증 여부 확인", "docs": "-"},
+}
+CORP_NOTARY_FEE = 110_000                          # 공증 대행료
+CORP_NOTARY_TAX = {"일반": 30_000, "특별": 60_000}  # 공증료 (공과금)
+CORP_CERT_FEE = 55_000                             # 전자증명서 발급대행
+CORP_PURPOSE_INCLUDED = 10                         # 법인설립 기본 목적 개수
+CORP_PURPOSE_FEE = 22_000                          # 목적 10개 추가마다
+
+# quote_corp_registry 결과 항목
+CORP_QUOTE_FIELDS = ["대행료", "부가세", "공과금", "총 합계"]
+
+
+def floor_10(v): return math.floor(v / 10) * 10
+
+
+# =============================================================================
+# 요율표
+# =============================================================================
+@dataclass(frozen=True, slots=True)
+class FeeSchedule:
+    """보수표/공과금 요율 1판 (effective 시행)"""
+    effective: date
+    name: str
+    base_fee: tuple
+    vat_rate: float
+    reg_tax_rate: float
+    edu_tax_rate: float
+    stamp_per_parcel: int
+    bond_min_amount: int
+    bond_rate: float
+    addr_change_reg: int
+    addr_change_edu: int
+    addr_change_stamp: int
+    _uppers: list = field(init=False, repr=False, compare=False)
+    _columns: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        uppers = [upper for upper, _, _, _ in self.base_fee[:-1]]
+        if not self.base_fee or self.base_fee[-1][0] is not None or uppers != sorted(uppers):
+            raise ValueError(f"{self.name}: base_fee 구간은 상한 오름차순, 마지막 상한은 null이어야 합니다.")
+        object.__setattr__(self, "_uppers", uppers)
+        columns = None
+        if NUMPY_OK:
+            columns = tuple(np.array([b[i] for b in self.base_fee], dtype=np.int64) for i in (1, 2, 3))
+        object.__setattr__(self, "_columns", columns)
+
+    def lookup_base_fee(self, amount):
+        """보수표 기본료 - 구간은 bisect로 찾음"""
+        _, base, start, per_10000 = self.base_fee[bisect.bisect_left(self._uppers, amount)]
+        return base + (amount - start) * per_10000 // 10000
+
+    def lookup_base_fee_batch(self, amounts):
+        """lookup_base_fee의 배열판 (int64 배열)"""
+        amounts = np.asarray(amounts, dtype=np.int64)
+        index = np.searchsorted(self._uppers, amounts, side="left")
+        bases, starts, per_10000 = (column[index] for column in self._columns)
+        return bases + (amounts - starts) * per_10000 // 10000
+
+
+SCHEDULE_KEYS = ["base_fee", "vat_rate", "reg_tax_rate", "edu_tax_rate", "stamp_per_parcel",
+                 "bond_min_amount", "bond_rate", "addr_change_reg", "addr_change_edu", "addr_change_stamp"]
+
+
+def load_schedules(folder=FEE_SCHEDULE_DIR):
+    """요율 파일을 시행일 순으로 읽어 [FeeSchedule, ...] - 파일에 없는 항목은 이전 판 값"""
+    specs = []
+    for name in os.listdir(folder):
+        if name.endswith(".json"):
+            with open(os.path.join(folder, name), "r", encoding="utf-8") as f:
+                spec = json.load(f)
+            spec["effective"] = date.fromisoformat(spec["effective"])
+            spec.setdefault("name", os.path.splitext(name)[0])
+            specs.append(spec)
+    specs.sort(key=lambda spec: spec["effective"])
+
+    schedules = []
+    previous = {}
+    for spec in specs:
+        values = {**previous, **{k: spec[k] for k in SCHEDULE_KEYS if k in spec}}
+        missing = [k for k in SCHEDULE_KEYS if k not in values]
+        if missing:
+            raise ValueError(f"{spec['name']}: 요율 항목 없음 ({', '.join(missing)})")
+        values["base_fee"] = tuple(tuple(b) for b in values["base_fee"])
+        schedules.append(FeeSchedule(spec["effective"], spec["name"], **values))
+        previous = values
+    if not schedules:
+        raise FileNotFoundError(f"요율 파일이 없습니다: {folder}")
+    return schedules
+
+
+_schedules = None
+_effective_dates = None
+_schedules_lock = threading.Lock()
+
+
+def reload_schedules(folder=FEE_SCHEDULE_DIR):
+    """요율 파일 다시 읽기 (실행 중에 새 시행일 파일을 추가했을 때)"""
+    global _schedules, _effective_dates
+    schedules = load_schedules(folder)
+    with _schedules_lock:
+        _schedules = schedules
+        _effective_dates = [s.effective for s in schedules]
+    return schedules
+
+
+def get_schedules():
+    """시행일 순 요율표 목록 (처음 한 번만 파일에서 읽음)"""
+    if _schedules is None:
+        reload_schedules()
+    return _schedules
+
+
+def _to_date(as_of):
+    if as_of is None:
+        return date.today()
+    if isinstance(as_of, datetime):
+        return as_of.date()
+    if isinstance(as_of, str):
+        return date.fromisoformat(as_of)
+    return as_of
+
+
+def schedule_for(as_of=None):
+    """as_of(date, 'YYYY-MM-DD', None=오늘)에 시행 중인 요율표"""
+    schedules = get_schedules()
+    as_of = _to_date(as_of)
+    index = bisect.bisect_right(_effective_dates, as_of) - 1
+    if index < 0:
+        raise ValueError(f"{as_of} 기준 요율표가 없습니다 (가장 이른 시행일 {schedules[0].effective})")
+    return schedules[index]
+
+
+def lookup_base_fee(amount, as_of=None):
+    """법무사 보수표 기준 기본료 계산 (as_of 기준 보수표, 기본 오늘)"""
+    return schedule_for(as_of).lookup_base_fee(amount)
+
+
+# =============================================================================
+# 1건 계산
+# =============================================================================
+def quote(amount, parcels, rate, address_changes=0, *, creditor="", base_fee=0, add_fee=0,
+          etc_fee=0, discount=0, manual_costs=None, show_fee=True, as_of=None):
+    """근저당 설정 비용 1건
+
+    amount: 채권최고액, parcels: 필지수, rate: 채권할인율(%, 화면 입력과 같은 단위),
+    address_changes: 주소변경 건수, creditor: 금융사 (FIXED_BASE_FEES면 기본료 고정),
+    base_fee: 수기입력 기본료 (0이면 보수표), manual_costs: {MANUAL_COST_NAMES 항목: 금액},
+    show_fee: False면 보수액 0 (공과금만), as_of: 요율 기준일 (기본 오늘)
+    반환: {QUOTE_FIELDS 항목: 금액}
+    """
+    schedule = schedule_for(as_of)
+    fixed_fee = FIXED_BASE_FEES.get(creditor)
+    if fixed_fee is not None:
+        base = auto_fee = fixed_fee
+    else:
+        auto_fee = schedule.lookup_base_fee(amount)
+        base = base_fee if base_fee > 0 else auto_fee
+
+    supply_val = vat = fee_total = 0
+    if show_fee:
+        supply_val = base + add_fee + etc_fee - discount
+        vat = math.floor(max(0, supply_val) * schedule.vat_rate)
+        fee_total = supply_val + vat
+
+    basic_reg = floor_10(amount * schedule.reg_tax_rate)
+    basic_edu = floor_10(basic_reg * schedule.edu_tax_rate)
+    final_reg = basic_reg + schedule.addr_change_reg * address_changes
+    final_edu = basic_edu + schedule.addr_change_edu * address_changes
+    jeungji = schedule.stamp_per_parcel * parcels + schedule.addr_change_stamp * address_changes
+
+    bond = 0
+    if amount >= schedule.bond_min_amount: bond = math.ceil(amount * schedule.bond_rate / 10000) * 10000
+    bond_disc = floor_10(bond * (rate / 100))
+
+    cost_total = final_reg + final_edu + jeungji + bond_disc
+    cost_total += sum((manual_costs or {}).get(k, 0) for k in MANUAL_COST_NAMES)
+
+    return {
+        "기본료": base,
+        "기본료_자동": auto_fee,
+        "공급가액": supply_val,
+        "부가세": vat,
+        "보수총액": fee_total,
+        "등록면허세": final_reg,
+        "지방교육세": final_edu,
+        "증지대": jeungji,
+        "채권할인금액": bond_disc,
+        "공과금 총액": cost_total,
+        "총 합계": fee_total + cost_total,
+    }
+
+
+def corp_extra_purpose_fee(kind, purpose_count):
+    """법인설립 목적 추가 대행료 (기본 10개 초과분, 10개마다)"""
+    if "법인설립" not in kind or purpose_count <= CORP_PURPOSE_INCLUDED:
+        return 0
+    return (purpose_count - CORP_PURPOSE_INCLUDED) // 10 * CORP_PURPOSE_FEE
+
+
+def quote_corp_registry(kind, notary=None, cert=False, purpose_count=CORP_PURPOSE_INCLUDED, manual_tax=0):
+    """법인등기 비용 1건 (법인등기 탭 자동 계산과 같음)
+
+    kind: CORP_REGISTRY_FEES 종류, notary: None/"일반"/"특별" (공증료 추가), cert: 전자증명서 발급대행,
+    purpose_count: 법인설립 목적 개수, manual_tax: 공과금이 정해지지 않은 종류(tax 0)의 공과금
+    반환: {CORP_QUOTE_FIELDS 항목: 금액}
+    """
+    info = CORP_REGISTRY_FEES.get(kind)
+    if info is None:
+        raise ValueError(f"알 수 없는 법인등기 종류: {kind}")
+    if notary is not None and notary not in CORP_NOTARY_TAX:
+        raise ValueError(f"공증 구분 오류: {notary} ({'/'.join(CORP_NOTARY_TAX)})")
+
+    fee = info["fee"] + corp_extra_purpose_fee(kind, purpose_count)
+    tax = info["tax"] or manual_tax
+    if notary is not None:
+        fee += CORP_NOTARY_FEE
+        tax += CORP_NOTARY_TAX[notary]
+    if cert:
+        fee += CORP_CERT_FEE
+    vat = int(fee * 0.1)
+    return {"대행료": fee, "부가세": vat, "공과금": tax, "총 합계": fee + vat + tax}
+
+
+# =============================================================================
+# 일괄 계산 (NumPy)
+# =============================================================================
+def _floor_10_array(v):
+    return (np.floor(v / 10) * 10).astype(np.int64)
+
+
+def _quote_arrays(schedule, amounts, parcels, rates, address_changes, base_fee, add_fee, etc_fee,
+                  discount, manual_cost, fixed_fee, show_fee):
+    """요율표 1판으로 배열 계산 (quote와 같은 순서/같은 부동소수 연산), fixed_fee -1 = 고정 기본료 없음"""
+    auto_fee = schedule.lookup_base_fee_batch(amounts)
+    base = np.where(base_fee > 0, base_fee, auto_fee)
+    fixed = fixed_fee >= 0
+    if fixed.any():
+        auto_fee = np.where(fixed, fixed_fee, auto_fee)
+        base = np.where(fixed, fixed_fee, base)
+
+    supply_val = np.where(show_fee, base + add_fee + etc_fee - discount, 0)
+    vat = np.floor(np.maximum(0, supply_val) * schedule.vat_rate).astype(np.int64)
+    fee_total = supply_val + vat
+
+    basic_reg = _floor_10_array(amounts * schedule.reg_tax_rate)
+    basic_edu = _floor_10_array(basic_reg * schedule.edu_tax_rate)
+    final_reg = basic_reg + schedule.addr_change_reg * address_changes
+    final_edu = basic_edu + schedule.addr_change_edu * address_changes
+    jeungji = schedule.stamp_per_parcel * parcels + schedule.addr_change_stamp * address_changes
+
+    bond = np.where(amounts >= schedule.bond_min_amount,
+                    np.ceil(amounts * schedule.bond_rate / 10000).astype(np.int64) * 10000, 0)
+    bond_disc = _floor_10_array(bond * (rates / 100))
+
+    cost_total = final_reg + final_edu + jeungji + bond_disc + manual_cost
+
+    return {
+        "기본료": base,
+        "기본료_자동": auto_fee,
+        "공급가액": supply_val,
+        "부가세": vat,
+        "보수총액": fee_total,
+        "등록면허세": final_reg,
+        "지방교육세": final_edu,
+        "증지대": jeungji,
+        "채권할인금액": bond_disc,
+        "공과금 총액": cost_total,
+        "총 합계": fee_total + cost_total,
+    }
+
+
+def schedule_index_batch(as_of):
+    """기준일 배열(date/'YYYY-MM-DD'/datetime64) → get_schedules() 위치 배열"""
+    schedules = get_schedules()
+    dates = np.asarray(as_of, dtype="datetime64[D]")
+    effective = np.array(_effective_dates, dtype="datetime64[D]")
+    index = np.searchsorted(effective, dates, side="right") - 1
+    if (index < 0).any():
+        earliest = dates[index < 0].min()
+        raise ValueError(f"{earliest} 기준 요율표가 없습니다 (가장 이른 시행일 {schedules[0].effective})")
+    return index
+
+
+def quote_batch(amounts, parcels, rates, address_changes=0, *, creditor="", base_fee=0, add_fee=0,
+                etc_fee=0, discount=0, manual_cost=0, show_fee=True, as_of=None):
+    """quote를 여러 건 한 번에 - 행마다 (채권최고액, 필지수, 채권할인율%, 주소변경 건수)
+
+    배열/스칼라 모두 가능 (길이가 다르면 NumPy 브로드캐스트), 나머지 인자도 행별 배열 가능
+    creditor: 금융사 하나(전체 공통) 또는 행별 목록, manual_cost: 수기입력 공과금 합계
+    as_of: 요율 기준일 - 하나(전체 공통) 또는 행별 배열 (예전 건 재계산: 건별 접수일), 기본 오늘
+    반환: {QUOTE_FIELDS 항목: int64 배열} - i번째 값은 quote(행 i)와 같음
+    """
+    if not NUMPY_OK:
+        raise RuntimeError("numpy 라이브러리가 설치되지 않아 일괄 계산을 할 수 없습니다.")
+    if isinstance(creditor, str):
+        fixed_fee = FIXED_BASE_FEES.get(creditor, -1)
+    else:
+        fixed_fee = [FIXED_BASE_FEES.get(c, -1) for c in creditor]
+    amounts, parcels, address_changes, base_fee, add_fee, etc_fee, discount, manual_cost, fixed_fee = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.int64) for v in
+          (amounts, parcels, address_changes, base_fee, add_fee, etc_fee, discount, manual_cost, fixed_fee)))
+    rates = np.broadcast_to(np.asarray(rates, dtype=np.float64), amounts.shape)
+    show_fee = np.broadcast_to(np.asarray(show_fee, dtype=bool), amounts.shape)
+    columns = (amounts, parcels, rates, address_changes, base_fee, add_fee, etc_fee, discount, manual_cost,
+               fixed_fee, show_fee)
+
+    schedules = get_schedules()
+    if as_of is None or np.ndim(as_of) == 0:
+        return _quote_arrays(schedule_for(as_of), *columns)
+
+    # 행별 기준일: 요율표 판마다 해당 행만 모아서 계산
+    index = np.broadcast_to(schedule_index_batch(as_of), amounts.shape)
+    present = np.unique(index)
+    if len(present) == 1:
+        return _quote_arrays(schedules[present[0]], *columns)
+    result = {name: np.zeros(amounts.shape, dtype=np.int64) for name in QUOTE_FIELDS}
+    for k in present:
+        mask = index == k
+        part = _quote_arrays(schedules[k], *(column[mask] for column in columns))
+        for name in QUOTE_FIELDS:
+            result[name][mask] = part[name]
+    return result
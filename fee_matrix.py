@@ -0,0 +1,186 @@
+"""
+비용 조견표 (Fee Matrix)
+- 채권최고액 구간 x 필지수 x 금융사 비용(CREDITORS[...]["fee"]) 전체를 quote_batch 한 번으로 계산
+- 결과를 금융사별 시트의 엑셀 조견표로 저장 - 전화 견적은 표에서 바로 찾기
+- 시트: 채권최고액 행마다 기본료/보수총액/공과금 항목 + 필지수별 총 합계 열
+"""
+
+import re
+from copy import copy
+from datetime import date
+from io import BytesIO
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+try:
+    import openpyxl
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    EXCEL_OK = True
+except Exception:
+    openpyxl = None
+    EXCEL_OK = False
+
+from fee_engine import MANUAL_COST_NAMES, NUMPY_OK, quote_batch, schedule_for
+
+
+# 필지수와 상관없는 항목 (조견표 왼쪽 열)
+MATRIX_FIELDS = ["기본료", "보수총액", "등록면허세", "지방교육세", "채권할인금액"]
+MANUAL_COST_LABEL = "제비용"   # 금융사별 수기 공과금(제증명/교통비/원인증서 ...) 합계
+
+HEADER_FILL = "DDEBF7"
+TOTAL_FILL = "FFF2CC"
+SHEET_NAME_MAX = 31
+
+
+def amount_steps(start, stop, step):
+    """채권최고액 구간 [start, start+step, ..., stop] (stop 포함)"""
+    if step <= 0:
+        raise ValueError("채권최고액 간격은 0보다 커야 합니다.")
+    if stop < start:
+        raise ValueError("채권최고액 끝이 시작보다 작습니다.")
+    return list(range(start, stop + 1, step))
+
+
+def creditor_manual_cost(info):
+    """CREDITORS 항목의 "fee" → 수기 공과금 합계"""
+    fee = info.get("fee", {})
+    return sum(fee.get(k, 0) for k in MANUAL_COST_NAMES)
+
+
+def build_fee_matrix(amounts, parcels, creditors, rate, address_changes=0, show_fee=True, as_of=None):
+    """조견표 계산 - 금융사 x 채권최고액 x 필지수 격자를 quote_batch 한 번으로
+
+    amounts: 채권최고액 목록, parcels: 필지수 목록, creditors: {금융사: {"fee": {...}}} (app.CREDITORS 모양)
+    rate: 채권할인율(%), as_of: 요율 기준일 (기본 오늘)
+    반환: {"creditors", "amounts", "parcels", "rate", "as_of", "schedule",
+           "manual_costs": 금융사별 합계, "values": {항목: (금융사, 채권최고액, 필지수) 배열}}
+    """
+    if not NUMPY_OK:
+        raise RuntimeError("numpy 라이브러리가 설치되지 않아 조견표를 계산할 수 없습니다.")
+    names = list(creditors)
+    if not names or not amounts or not parcels:
+        raise ValueError("금융사, 채권최고액, 필지수가 하나 이상 있어야 합니다.")
+    as_of = as_of or date.today()
+    manual_costs = np.array([creditor_manual_cost(creditors[name]) for name in names], dtype=np.int64)
+
+    creditor_index, amount_grid, parcel_grid = np.meshgrid(
+        np.arange(len(names)), np.asarray(amounts, dtype=np.int64), np.asarray(parcels, dtype=np.int64),
+        indexing="ij")
+    shape = creditor_index.shape
+    creditor_index = creditor_index.ravel()
+    values = quote_batch(
+        amount_grid.ravel(), parcel_grid.ravel(), rate, address_changes,
+        creditor=[names[i] for i in creditor_index],
+        manual_cost=manual_costs[creditor_index],
+        show_fee=show_fee, as_of=as_of,
+    )
+    return {
+        "creditors": names,
+        "amounts": list(amounts),
+        "parcels": list(parcels),
+        "rate": rate,
+        "as_of": as_of,
+        "schedule": schedule_for(as_of).name,
+        "manual_costs": manual_costs.tolist(),
+        "values": {name: column.reshape(shape) for name, column in values.items()},
+    }
+
+
+# =============================================================================
+# 엑셀
+# =============================================================================
+def _sheet_title(name, used):
+    """엑셀 시트 이름 (금지 문자 제거, 31자, 중복 시 번호)"""
+    base = re.sub(r'[\[\]:*?/\\]', '', name).strip() or "시트"
+    title = base[:SHEET_NAME_MAX]
+    n = 2
+    while title in used:
+        suffix = f" ({n})"
+        title = base[:SHEET_NAME_MAX - len(suffix)] + suffix
+        n += 1
+    used.add(title)
+    return title
+
+
+def write_fee_matrix_xlsx(matrix, output=None):
+    """build_fee_matrix 결과 → 엑셀 조견표 (금융사별 시트), output 없으면 BytesIO 반환
+
+    셀이 많아서 write_only 모드로 한 줄씩 기록
+    """
+    if not EXCEL_OK:
+        raise RuntimeError("openpyxl이 설치되지 않아 엑셀 파일을 만들 수 없습니다.")
+    workbook = openpyxl.Workbook(write_only=True)
+
+    thin = Side(style="thin", color="999999")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_fill = PatternFill("solid", fgColor=HEADER_FILL)
+    total_fill = PatternFill("solid", fgColor=TOTAL_FILL)
+    center = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    bold = Font(bold=True)
+
+    headers = (["채권최고액"] + MATRIX_FIELDS + [MANUAL_COST_LABEL]
+               + [f"총 합계\n({p}필지)" for p in matrix["parcels"]])
+    total_start = len(headers) - len(matrix["parcels"])
+    values = matrix["values"]
+    used = set()
+    for c, creditor in enumerate(matrix["creditors"]):
+        sheet = workbook.create_sheet(_sheet_title(creditor, used))
+        sheet.freeze_panes = "B5"
+        sheet.column_dimensions["A"].width = 16
+        for col in range(2, len(headers) + 1):
+            sheet.column_dimensions[get_column_letter(col)].width = 13
+
+        title = WriteOnlyCell(sheet, value=f"비용 조견표 - {creditor}")
+        title.font = Font(size=14, bold=True)
+        note = WriteOnlyCell(sheet, value=(
+            f"기준일 {matrix['as_of']}  /  {matrix['schedule']}  /  채권할인율 {matrix['rate']}%  /  "
+            f"{MANUAL_COST_LABEL} {matrix['manual_costs'][c]:,}원"))
+        note.font = Font(size=9, color="666666")
+        sheet.append([title])
+        sheet.append([note])
+        sheet.append([])
+
+        header_cells = []
+        for col, text in enumerate(headers):
+            cell = WriteOnlyCell(sheet, value=text)
+            cell.font = bold
+            cell.fill = total_fill if col >= total_start else header_fill
+            cell.alignment = center
+            cell.border = border
+            header_cells.append(cell)
+        sheet.append(header_cells)
+
+        # 필지수와 상관없는 항목은 첫 번째 필지수 열 값
+        columns = [np.asarray(matrix["amounts"])] + [values[f][c, :, 0] for f in MATRIX_FIELDS]
+        columns.append(np.full(len(matrix["amounts"]), matrix["manual_costs"][c]))
+        columns += [values["총 합계"][c, :, p] for p in range(len(matrix["parcels"]))]
+        # 셀마다 스타일을 지정하면 openpyxl이 매번 스타일 객체를 해시해서 느림 - 견본 셀 스타일 복사
+        plain = WriteOnlyCell(sheet)
+        plain.number_format = "#,##0"
+        plain.border = border
+        strong = WriteOnlyCell(sheet)
+        strong.number_format = "#,##0"
+        strong.border = border
+        strong.font = bold
+        styles = [strong._style if col == 0 or col >= total_start else plain._style
+                  for col in range(len(headers))]
+        for row in zip(*(column.tolist() for column in columns)):
+            cells = []
+            for value, style in zip(row, styles):
+                cell = WriteOnlyCell(sheet, value=value)
+                cell._style = copy(style)
+                cells.append(cell)
+            sheet.append(cells)
+
+    if output is None:
+        output = BytesIO()
+        workbook.save(output)
+        output.seek(0)
+        return output
+    workbook.save(output)
+    return output
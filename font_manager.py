@@ -0,0 +1,168 @@
+"""
+한글 폰트 관리자 (Font Manager)
+- Malgun.ttf를 프로세스당 한 번만 읽어서 reportlab('Korean')에 등록
+- FPDF(PDFConverter)도 처음 한 번 읽은 글꼴 정보(글자 폭 표 등)를 다음 문서부터 그대로 재사용
+- 문자열 폭(stringWidth) 계산 결과를 캐시, 글자별 폭 누적합(prefix sum) 제공
+- 폰트 파일이 바뀌면(수정시각 변경) 다시 등록
+"""
+
+import os
+import threading
+from functools import lru_cache
+
+try:
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    REPORTLAB_OK = True
+except Exception:
+    pdfmetrics = None
+    TTFont = None
+    REPORTLAB_OK = False
+
+
+KOREAN_FONT_NAME = "Korean"
+FALLBACK_FONT_NAME = "Helvetica"
+
+_lock = threading.Lock()
+
+# reportlab: (절대경로, 수정시각) → 등록된 폰트 이름
+_registered = {}
+
+# FPDF: (fontkey, 절대경로, 수정시각) → (fonts 항목, font_files 항목)
+_fpdf_fonts = {}
+
+# 폰트가 다시 등록될 때마다 1씩 증가 (폭 계산 결과를 캐시하는 쪽에서 키로 사용)
+_generation = 0
+
+
+def _font_key(font_path):
+    """(절대경로, 수정시각) - 파일이 없으면 None"""
+    if not font_path:
+        return None
+    path = os.path.abspath(font_path)
+    try:
+        return path, os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+# =========================================================
+# reportlab
+# =========================================================
+def register_korean_font(font_path):
+    """reportlab에 한글 폰트를 등록하고 사용할 폰트 이름을 반환 (실패 시 Helvetica)"""
+    if not REPORTLAB_OK:
+        return FALLBACK_FONT_NAME
+    key = _font_key(font_path)
+    if key is None:
+        return FALLBACK_FONT_NAME
+
+    font_name = _registered.get(key)
+    if font_name is not None:
+        return font_name
+
+    with _lock:
+        font_name = _registered.get(key)
+        if font_name is None:
+            try:
+                pdfmetrics.registerFont(TTFont(KOREAN_FONT_NAME, key[0]))
+                font_name = KOREAN_FONT_NAME
+            except Exception:
+                font_name = FALLBACK_FONT_NAME
+            # 같은 경로의 예전 버전 기록은 지움
+            for old_key in [k for k in _registered if k[0] == key[0]]:
+                del _registered[old_key]
+            _registered[key] = font_name
+            _clear_width_caches()
+    return font_name
+
+
+@lru_cache(maxsize=8192)
+def string_width(text, font_name, font_size):
+    """문자열 폭 (pt) - canvas.stringWidth와 같은 값, 결과를 캐시"""
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+
+@lru_cache(maxsize=4096)
+def char_width(ch, font_name):
+    """글자 1개의 폭 (1000pt 기준 = 글리프 폭 단위)"""
+    return pdfmetrics.stringWidth(ch, font_name, 1000)
+
+
+@lru_cache(maxsize=1024)
+def prefix_widths(text, font_name):
+    """글자별 폭 누적합 (1000pt 기준) - [0, w0, w0+w1, ...], 길이 len(text)+1
+
+    stringWidth는 글자 폭을 더한 값에 크기를 곱하므로 text[:n]의 폭 = prefix[n] * size / 1000
+    """
+    widths = [0]
+    total = 0
+    for ch in text:
+        total += char_width(ch, font_name)
+        widths.append(total)
+    return tuple(widths)
+
+
+def font_generation():
+    """폰트 재등록 횟수 (캐시 키용)"""
+    return _generation
+
+
+def _clear_width_caches():
+    global _generation
+    _generation += 1
+    string_width.cache_clear()
+    char_width.cache_clear()
+    prefix_widths.cache_clear()
+
+
+# =========================================================
+# FPDF
+# =========================================================
+def add_fpdf_font(pdf, family, font_path, style=""):
+    """FPDF 문서에 유니코드 TTF 폰트 추가 (처음 한 번만 파일에서 읽음)
+
+    fpdf 1.7은 add_font 때마다 글꼴 정보(.pkl 또는 TTF)를 다시 읽는다.
+    처음 읽은 항목을 보관했다가 다음 문서에는 문서별 값(번호 i, 사용 글자 subset)만 새로 만들어 넣는다.
+    형식이 다른 버전(fpdf2 등)은 원래 add_font를 그대로 호출한다.
+    """
+    fontkey = family.lower() + style.upper()
+    if fontkey in pdf.fonts:
+        return
+
+    key = _font_key(font_path)
+    if key is None:
+        raise RuntimeError("TTF Font file not found: %s" % font_path)
+
+    cached = _fpdf_fonts.get((fontkey,) + key)
+    if cached is None:
+        pdf.add_font(family, style, font_path, uni=True)
+        font = pdf.fonts.get(fontkey)
+        if isinstance(font, dict) and "cw" in font and "subset" in font:
+            shared = {k: v for k, v in font.items() if k not in ("i", "subset")}
+            files = {fontkey: pdf.font_files.get(fontkey), font_path: pdf.font_files.get(font_path)}
+            with _lock:
+                _fpdf_fonts[(fontkey,) + key] = (shared, files)
+        return
+
+    shared, files = cached
+    # fpdf 1.7 add_font과 같은 초기 subset (alias_nb_pages 사용 시 숫자 포함)
+    if hasattr(pdf, "str_alias_nb_pages"):
+        subset = list(range(0, 57))
+    else:
+        subset = list(range(0, 32))
+    font = dict(shared)
+    font["i"] = len(pdf.fonts) + 1
+    font["subset"] = subset
+    pdf.fonts[fontkey] = font
+    for name, info in files.items():
+        if info is not None:
+            pdf.font_files[name] = dict(info)
+
+
+def clear_font_cache():
+    """등록 기록/폭 캐시 비우기 (다음 호출 때 다시 읽음)"""
+    with _lock:
+        _registered.clear()
+        _fpdf_fonts.clear()
+        _clear_width_caches()
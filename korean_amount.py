@@ -0,0 +1,65 @@
+"""
+금액 한글 변환 (Korean Amount)
+- 채권최고액 등 숫자 금액을 "금일억이천만원정" 식의 한글 표기로 변환
+- app.py(Streamlit)와 일괄 생성 작업 프로세스에서 함께 사용
+- 같은 금액이 다시 들어오는 경우가 대부분이라 결과를 LRU 캐시 (입력 문자열 / 숫자 값 두 단계)
+- convert_amounts_to_korean: 금액 목록을 한 번에 (같은 금액은 한 번만 변환)
+"""
+
+import re
+from functools import lru_cache
+
+
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_DIGITS = ('', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구')
+_UNITS = ('', '만', '억', '조')
+# 네 자리 묶음 안의 자리 (천/백/십/일)
+_PLACES = ((1000, '천'), (100, '백'), (10, '십'))
+
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _spell_number(num):
+    """정수 → "...원정" """
+    if num == 0: return "영원정"
+    parts = []
+    unit_idx = 0
+    while num > 0:
+        num, part = divmod(num, 10000)
+        if part > 0:
+            words = []
+            for place, name in _PLACES:
+                if part >= place:
+                    words.append(_DIGITS[part // place] + name)
+                    part %= place
+            words.append(_DIGITS[part])
+            words.append(_UNITS[unit_idx])
+            parts.append(''.join(words))
+        unit_idx += 1
+    parts.reverse()
+    parts.append("원정")
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def number_to_korean(num_str):
+    if not num_str: return ""
+    try: num = int(_NON_DIGIT_RE.sub('', num_str))
+    except (TypeError, ValueError): return ""
+    return _spell_number(num)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def convert_multiple_amounts_to_korean(amount_str):
+    if not amount_str: return ""
+    if '/' in amount_str:
+        spelled = [number_to_korean(p.strip()) for p in amount_str.split('/')]
+        return ', '.join([s for s in spelled if s])
+    return number_to_korean(amount_str)
+
+
+def convert_amounts_to_korean(amounts):
+    """금액 문자열 목록 → 한글 표기 목록 (convert_multiple_amounts_to_korean, 같은 금액은 한 번만)"""
+    spelled = {amount: convert_multiple_amounts_to_korean(amount) for amount in set(amounts)}
+    return [spelled[amount] for amount in amounts]
@@ -0,0 +1,199 @@
+"""
+PDF 병합 방식 비교 (Merge Benchmark)
+- 실제 템플릿(1.pdf, 2.pdf, 3.pdf, 위임장.pdf)에 실제 레이아웃 오버레이를 병합해서 방식별 시간/크기 측정
+- 정확성: PyPDF2 merge_page(예전 방식)로 만든 결과와 페이지별 글자(문자, 위치)가 같은지 확인
+- 속도: 사용 가능한 방식 전부 (pypdf2 = 지금까지 쓰던 merge_page 병합, 나머지는 pypdf2 대비 비율도 출력)
+- --layers: 고정 레이어(채권자) 효과만 따로 - 오버레이 전체를 그려 병합 vs merge_layout(미리 찍은 템플릿)
+- 사용법: python merge_benchmark.py [-n 반복횟수] [--layers] [템플릿 ...]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import time
+from collections import Counter
+from io import BytesIO
+
+try:
+    import pdfplumber
+    PDFPLUMBER_OK = True
+except Exception:
+    pdfplumber = None
+    PDFPLUMBER_OK = False
+
+from PyPDF2 import PdfReader, PdfWriter
+
+import template_cache
+from batch_contracts import build_contract_data
+from overlay_layout import get_layout, merge_layout, render_layout
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_PATH = os.path.join(BASE_DIR, "Malgun.ttf")
+
+SAMPLE_ESTATE = "[집합건물] 서울특별시 강남구 역삼동 123-45 역삼아파트 제101동 제12층 제1203호"
+
+# 템플릿 파일명 → (레이아웃 이름, 샘플 데이터)
+BENCH_TEMPLATES = {
+    "1.pdf": ("contract", build_contract_data({
+        "creditor": "(주)티플레인대부", "debtor": "홍길동", "debtor_addr": "서울특별시 강남구 테헤란로 1",
+        "amount": "120,000,000", "estate": SAMPLE_ESTATE, "contract_type": "개인",
+    }, default_date="2025년 01월 02일")),
+    "2.pdf": ("contract", build_contract_data({
+        "creditor": "(주)티플레인대부", "debtor": "홍길동", "debtor_addr": "서울특별시 강남구 테헤란로 1",
+        "owner": "김소유", "owner_addr": "서울특별시 서초구 서초대로 2",
+        "amount": "80,000,000", "estate": SAMPLE_ESTATE, "contract_type": "3자담보",
+    }, default_date="2025년 01월 02일")),
+    "3.pdf": ("contract", build_contract_data({
+        "creditor": "(주)티플레인대부", "debtor": "홍길동", "debtor_addr": "서울특별시 강남구 테헤란로 1",
+        "owner": "김소유", "owner_addr": "서울특별시 서초구 서초대로 2",
+        "amount": "80,000,000/40,000,000", "estate": SAMPLE_ESTATE + "\n" + SAMPLE_ESTATE,
+        "contract_type": "공동담보",
+    }, default_date="2025년 01월 02일")),
+    "위임장.pdf": ("malso_power", {
+        "date": "2025년 01월 02일", "estate_text": SAMPLE_ESTATE,
+        "cancel_text": "2020년 3월 4일 접수 제12345호로 경료한 근저당권설정등기",
+        "holder1_name": "홍길동", "holder1_addr": "서울특별시 강남구 테헤란로 1",
+        "obligor_name": "(주)티플레인대부", "obligor_addr": "서울특별시 중구 세종대로 3",
+    }),
+}
+
+
+def _reference_merge(template_path, overlay_bytes):
+    """PyPDF2 merge_page (캐시 없이, 예전 방식) - 정확성 기준"""
+    template = PdfReader(template_path)
+    overlay = PdfReader(BytesIO(overlay_bytes))
+    writer = PdfWriter()
+    for page_num in range(min(len(template.pages), len(overlay.pages))):
+        page = template.pages[page_num]
+        page.merge_page(overlay.pages[page_num])
+        writer.add_page(page)
+    out = BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def _page_chars(pdf_bytes):
+    """페이지별 (글자, x, y) 개수 - 그리는 순서와 무관하게 비교"""
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        return [
+            Counter((c["text"], round(c["x0"], 1), round(c["top"], 1)) for c in page.chars)
+            for page in pdf.pages
+        ]
+
+
+def bench_template(template_name, repeat):
+    """템플릿 1개에 대해 방식별 {"ms": 건당 ms(중앙값), "bytes": 결과 크기, "ok": 정확성}"""
+    template_path = os.path.join(BASE_DIR, template_name)
+    layout_name, data = BENCH_TEMPLATES[template_name]
+    overlay_bytes = render_layout(layout_name, data, FONT_PATH).getvalue()
+    expected = _page_chars(_reference_merge(template_path, overlay_bytes)) if PDFPLUMBER_OK else None
+
+    results = {}
+    for backend in template_cache.available_merge_backends():
+        # 첫 호출(템플릿 파싱)은 제외하고 캐시가 찬 상태에서 측정
+        output = template_cache.merge_overlay(template_path, BytesIO(overlay_bytes), backend=backend).getvalue()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            template_cache.merge_overlay(template_path, BytesIO(overlay_bytes), backend=backend)
+            timings.append(time.perf_counter() - start)
+        results[backend] = {
+            "ms": statistics.median(timings) * 1000,
+            "bytes": len(output),
+            "ok": None if expected is None else _page_chars(output) == expected,
+        }
+    return results
+
+
+def _median_ms(func, repeat):
+    func()  # 첫 호출(템플릿 파싱, 고정 레이어 찍기)은 제외
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def bench_layers(template_name, repeat):
+    """고정 레이어 효과 - 방식별 {"full": 전체 오버레이 ms, "layered": merge_layout ms}
+
+    두 경로 모두 오버레이 그리기(reportlab)부터 병합까지 요청 1건 시간
+    """
+    template_path = os.path.join(BASE_DIR, template_name)
+    layout_name, data = BENCH_TEMPLATES[template_name]
+    results = {}
+    for backend in template_cache.available_merge_backends():
+        results[backend] = {
+            "full": _median_ms(lambda: template_cache.merge_overlay(
+                template_path, render_layout(layout_name, data, FONT_PATH), backend=backend), repeat),
+            "layered": _median_ms(lambda: merge_layout(
+                template_path, layout_name, data, FONT_PATH, backend=backend), repeat),
+        }
+    return results
+
+
+def run_layers(templates=None, repeat=20):
+    """고정 레이어가 있는 레이아웃의 템플릿만 비교 출력"""
+    templates = [t for t in (templates or list(BENCH_TEMPLATES)) if get_layout(BENCH_TEMPLATES[t][0]).layers]
+    all_results = {}
+    print(f"{'템플릿':<12}{'방식':<10}{'전체(ms)':>10}{'레이어(ms)':>12}{'차이':>8}")
+    for template_name in templates:
+        results = bench_layers(template_name, repeat)
+        all_results[template_name] = results
+        for backend, r in results.items():
+            print(f"{template_name:<12}{backend:<10}{r['full']:>10.1f}{r['layered']:>12.1f}"
+                  f"{r['layered'] - r['full']:>+8.1f}")
+    return all_results
+
+
+def run(templates=None, repeat=20):
+    """방식별 결과 출력 후 {템플릿: {방식: 결과}} 반환"""
+    templates = templates or list(BENCH_TEMPLATES)
+    all_results = {}
+    print(f"{'템플릿':<12}{'방식':<10}{'ms/건':>9}{'pypdf2 대비':>12}{'크기(KB)':>10}  정확성")
+    for template_name in templates:
+        results = bench_template(template_name, repeat)
+        all_results[template_name] = results
+        baseline = results.get("pypdf2")
+        for backend, r in results.items():
+            ok = "-" if r["ok"] is None else ("OK" if r["ok"] else "불일치")
+            ratio = f"{r['ms'] / baseline['ms']:.2f}x" if baseline else "-"
+            print(f"{template_name:<12}{backend:<10}{r['ms']:>9.1f}{ratio:>12}{r['bytes'] / 1024:>10.0f}  {ok}")
+
+    # 모든 템플릿에서 정확한 방식 중 합계 시간이 가장 짧은 것
+    totals = {}
+    for results in all_results.values():
+        for backend, r in results.items():
+            if r["ok"] is False:
+                totals[backend] = None
+            elif backend not in totals or totals[backend] is not None:
+                totals[backend] = totals.get(backend, 0) + r["ms"]
+    candidates = {b: t for b, t in totals.items() if t is not None}
+    if candidates:
+        best = min(candidates, key=candidates.get)
+        print(f"\n가장 빠른 방식: {best} (현재 기본값: {template_cache.DEFAULT_MERGE_BACKEND})")
+    return all_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 병합 방식 비교")
+    parser.add_argument("templates", nargs="*", help="템플릿 파일명 (기본: 1.pdf 2.pdf 3.pdf 위임장.pdf)")
+    parser.add_argument("-n", "--repeat", type=int, default=20, help="방식별 반복 횟수")
+    parser.add_argument("--layers", action="store_true", help="고정 레이어(채권자) 효과만 비교")
+    args = parser.parse_args()
+    # pdfminer가 템플릿 폰트마다 출력하는 FontBBox 경고 숨김
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)
+    unknown = [t for t in args.templates if t not in BENCH_TEMPLATES]
+    if unknown:
+        parser.error(f"지원하지 않는 템플릿: {', '.join(unknown)}")
+    if args.layers:
+        run_layers(args.templates, args.repeat)
+    else:
+        run(args.templates, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
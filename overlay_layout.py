@@ -0,0 +1,519 @@
+"""
+오버레이 레이아웃 엔진 (Overlay Layout)
+- 템플릿별 필드 좌표/폰트 크기/맞춤 규칙을 layouts/*.json 스펙 파일로 관리
+- 스펙은 (경로, 수정시각) 기준으로 한 번만 읽어서 그리기 함수 목록으로 컴파일
+- 문서 생성은 공통 렌더러 하나가 컴파일된 목록을 순서대로 실행
+- "layer"를 지정한 고정 필드(채권자 등)는 템플릿에 미리 찍어서 캐시 (merge_layout)
+- 1금융권 은행 추가 = layouts/banks/<은행명>.json 파일 추가 ("order"로 목록 순서 지정)
+
+스펙 형식
+{
+  "font_size": 11,                          # 기본 폰트 크기
+  "defaults": {"contract_type": "3자담보"},  # 데이터에 값이 없을 때 사용할 기본값
+  "pages": [[ 필드, 필드, ... ], ...]        # 페이지별 필드 목록
+}
+
+필드 (type 생략 시 "text")
+- text     : {"field": "debtor_name", "x": 157, "y_top": 172}
+             y_top = 페이지 상단 기준 Y (y 를 쓰면 reportlab 좌표 그대로)
+             "text": 고정 문구, "format": "{} 해지", "size": 9, "always": true (빈 값도 출력)
+             "align": "center" (x 생략 시 페이지 중앙), "fit": {"max_width": 380, "min_size": 5}
+             "wrap_chars": 75 + "wrap_y" : 글자 수를 넘으면 wrap_y부터 여러 줄로 출력
+- lines    : {"type": "lines", "field": "estate_list", "x": 35, "y_top": 80, "line_height": 16, "max_lines": 17}
+             문자열이면 줄바꿈으로 나눔, 빈 줄은 건너뛰되 줄 위치는 유지
+- box_lines: {"type": "box_lines", "field": "estate_text", "x": 42, "y_top": 114, "box_height": 140}
+             빈 줄을 빼고 박스 높이에 들어가도록 폰트 크기/줄간격 자동 선택
+- layer    : "creditor" 처럼 이름을 붙이면 고정 레이어 (값이 같은 요청끼리 미리 찍은 템플릿 공유)
+- when     : {"contract_type": ["개인", "공동담보"]} 값이 목록 중 하나일 때만 / {"holder2_name": true} 값이 있을 때만
+- field 는 "holders.0.name" 처럼 점(.)으로 하위 항목 지정 가능
+"""
+
+import bisect
+import json
+import os
+import threading
+from functools import lru_cache
+from io import BytesIO
+
+try:
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    REPORTLAB_OK = True
+except Exception:
+    canvas = None
+    A4 = (595.2755905511812, 841.8897637795277)
+    REPORTLAB_OK = False
+
+from font_manager import register_korean_font, string_width
+from text_fit import fit_text
+from template_cache import merge_overlay, merge_overlay_stamped
+
+
+LAYOUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "layouts")
+BANK_LAYOUT_DIR = os.path.join(LAYOUT_DIR, "banks")
+
+# 1금융권 부동산표시 기본값 (스펙에 값이 없을 때)
+BOX_DEFAULT_SIZES = [9, 8.5, 8, 7.5, 7, 6.5, 6]
+BOX_LINE_RATIO = 1.35
+
+# 경로 → (수정시각, CompiledLayout)
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+# =========================================================
+# 텍스트 맞춤
+# =========================================================
+def draw_fit_text(canvas_obj, text, x, y, max_width, font_name, font_size, min_font_size=5):
+    """텍스트를 max_width에 맞춰 폰트 크기 자동 조절 (1줄로 맞춤, 계산은 text_fit)"""
+    if not text:
+        return
+    size, display = fit_text(text, font_name, font_size, max_width, min_font_size)
+    canvas_obj.setFont(font_name, size)
+    canvas_obj.drawString(x, y, display)
+    canvas_obj.setFont(font_name, font_size)  # 원래 폰트 크기로 복원
+
+
+@lru_cache(maxsize=64)
+def _ascending_sizes(sizes):
+    return tuple(sorted(set(sizes)))
+
+
+def fit_box_lines(num_lines, box_height, sizes=None, line_ratio=BOX_LINE_RATIO):
+    """박스 높이에 num_lines 줄이 들어가는 (폰트 크기, 줄간격)
+
+    들어가는 최대 크기 = box_height / (num_lines * line_ratio) 를 바로 계산해서
+    sizes 중 그 이하인 가장 큰 값을 고름 (큰 크기부터 하나씩 시도하던 것과 같은 결과)
+    """
+    sizes = sizes or BOX_DEFAULT_SIZES
+    ascending = _ascending_sizes(tuple(sizes))
+    if num_lines <= 0:
+        return ascending[-1], ascending[-1] * line_ratio
+
+    i = bisect.bisect_right(ascending, box_height / (num_lines * line_ratio)) - 1
+    # 부동소수 경계 보정 (기존 조건 num_lines * line_h <= box_height 기준)
+    while i >= 0 and num_lines * (ascending[i] * line_ratio) > box_height:
+        i -= 1
+    while i + 1 < len(ascending) and num_lines * (ascending[i + 1] * line_ratio) <= box_height:
+        i += 1
+    if i >= 0:
+        return ascending[i], ascending[i] * line_ratio
+    # 최소 폰트로도 안 맞으면 줄 간격 더 줄임
+    return ascending[0], box_height / num_lines
+
+
+# =========================================================
+# 컴파일
+# =========================================================
+def _compile_getter(field, defaults):
+    """"holders.0.name" → data에서 값을 꺼내는 함수 (없으면 None)"""
+    keys = tuple(int(k) if k.isdigit() else k for k in str(field).split("."))
+    default = defaults.get(keys[0]) if len(keys) == 1 else None
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get(data):
+            value = data.get(key)
+            return default if value is None else value
+        return get
+
+    def get(data):
+        value = data
+        for key in keys:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return value
+    return get
+
+
+def _compile_when(when, defaults):
+    """조건 → data를 받아 True/False를 돌려주는 함수 (조건 없으면 None)"""
+    if not when:
+        return None
+    checks = []
+    for field, expected in when.items():
+        get = _compile_getter(field, defaults)
+        if expected is True:
+            checks.append(lambda data, get=get: bool(get(data)))
+        else:
+            allowed = frozenset(expected if isinstance(expected, list) else [expected])
+            checks.append(lambda data, get=get, allowed=allowed: get(data) in allowed)
+    return lambda data: all(check(data) for check in checks)
+
+
+def _resolve_y(spec, page_height):
+    if "y_top" in spec:
+        return page_height - spec["y_top"]
+    return spec.get("y", 0)
+
+
+def _compile_text(spec, defaults, base_size, page_size):
+    width, height = page_size
+    size = spec.get("size", base_size)
+    x = spec.get("x")
+    y = _resolve_y(spec, height)
+    literal = spec.get("text")
+    get = None if literal is not None else _compile_getter(spec["field"], defaults)
+    fmt = spec.get("format")
+    always = spec.get("always", False)
+    center = spec.get("align") == "center"
+    center_x = width / 2 if x is None else x
+    fit = spec.get("fit")
+    wrap_chars = spec.get("wrap_chars")
+
+    def value_of(data):
+        if literal is not None:
+            return literal
+        value = get(data)
+        if not value and not always:
+            return None
+        text = "" if value is None else str(value)
+        return fmt.format(text) if fmt else text
+
+    if fit:
+        max_width = fit["max_width"]
+        min_size = fit.get("min_size", 5)
+
+        def draw(c, data, font_name):
+            text = value_of(data)
+            if text is not None:
+                draw_fit_text(c, text, x, y, max_width, font_name, size, min_size)
+        return draw
+
+    if wrap_chars:
+        wrap_y = spec.get("wrap_y", y)
+        line_h = spec.get("line_height", size * 1.5)
+        max_lines = spec.get("max_lines", 2)
+
+        def draw(c, data, font_name):
+            text = value_of(data)
+            if text is None:
+                return
+            c.setFont(font_name, size)
+            if len(text) <= wrap_chars:
+                c.drawString(x, y, text)
+                return
+            # 마지막 줄에는 남은 글자를 모두 출력
+            for i in range(max_lines):
+                start = i * wrap_chars
+                end = None if i == max_lines - 1 else start + wrap_chars
+                c.drawString(x, wrap_y - (i * line_h), text[start:end])
+        return draw
+
+    if center:
+        def draw(c, data, font_name):
+            text = value_of(data)
+            if text is not None:
+                c.setFont(font_name, size)
+                c.drawString(center_x - string_width(text, font_name, size) / 2, y, text)
+        return draw
+
+    def draw(c, data, font_name):
+        text = value_of(data)
+        if text is not None:
+            c.setFont(font_name, size)
+            c.drawString(x, y, text)
+    return draw
+
+
+def _split_lines(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        return value.split("\n")
+    return [str(line) for line in value]
+
+
+def _compile_lines(spec, defaults, base_size, page_size):
+    size = spec.get("size", base_size)
+    x = spec["x"]
+    y = _resolve_y(spec, page_size[1])
+    line_h = spec["line_height"]
+    max_lines = spec.get("max_lines")
+    get = _compile_getter(spec["field"], defaults)
+
+    def draw(c, data, font_name):
+        lines = _split_lines(get(data))[:max_lines]
+        if not lines:
+            return
+        c.setFont(font_name, size)
+        for i, line in enumerate(lines):
+            if line.strip():
+                c.drawString(x, y - (i * line_h), line)
+    return draw
+
+
+def _compile_box_lines(spec, defaults, base_size, page_size):
+    x = spec.get("x", 50)
+    y = page_size[1] - spec.get("y_top", 100)
+    box_height = spec.get("box_height", 200)
+    sizes = spec.get("sizes") or BOX_DEFAULT_SIZES
+    line_ratio = spec.get("line_ratio", BOX_LINE_RATIO)
+    get = _compile_getter(spec["field"], defaults)
+
+    def draw(c, data, font_name):
+        lines = [line for line in _split_lines(get(data)) if line.strip()]
+        if not lines:
+            return
+        font_size, line_h = fit_box_lines(len(lines), box_height, sizes, line_ratio)
+        c.setFont(font_name, font_size)
+        for i, line in enumerate(lines):
+            c.drawString(x, y - (i * line_h), line)
+    return draw
+
+
+_COMPILERS = {
+    "text": _compile_text,
+    "lines": _compile_lines,
+    "box_lines": _compile_box_lines,
+}
+
+
+def _compile_op(spec, defaults, base_size, page_size):
+    kind = spec.get("type", "text")
+    compiler = _COMPILERS.get(kind)
+    if compiler is None:
+        raise ValueError(f"알 수 없는 필드 type: {kind}")
+    draw = compiler(spec, defaults, base_size, page_size)
+    when = _compile_when(spec.get("when"), defaults)
+    if when is None:
+        return draw
+
+    def draw_when(c, data, font_name):
+        if when(data):
+            draw(c, data, font_name)
+    return draw_when
+
+
+class CompiledLayout:
+    """컴파일된 레이아웃 (페이지별 그리기 함수 목록)
+
+    "layer"가 지정된 필드(예: 채권자 이름/주소)는 고정 레이어로 따로 모아 두고,
+    merge_layout()에서 템플릿에 미리 찍어 캐시한 뒤 나머지 필드만 요청마다 그린다.
+    """
+
+    def __init__(self, spec, name=""):
+        self.name = name
+        self.spec = spec
+        self.version = None
+        self.page_size = A4
+        self.font_size = spec.get("font_size", 11)
+        defaults = spec.get("defaults", {})
+        # 페이지별 [(레이어, 그리기 함수), ...]
+        self._ops = [
+            [(op.get("layer"), _compile_op(op, defaults, self.font_size, self.page_size)) for op in page]
+            for page in spec.get("pages", [])
+        ]
+        self.pages = [[draw for _, draw in ops] for ops in self._ops]
+        # 레이어별 값 꺼내기 함수 (고정 레이어 캐시 키용)
+        self._layer_getters = {}
+        for page in spec.get("pages", []):
+            for op in page:
+                layer = op.get("layer")
+                if layer:
+                    getters = self._layer_getters.setdefault(layer, [])
+                    if "field" in op:
+                        getters.append(_compile_getter(op["field"], defaults))
+        self.layers = tuple(self._layer_getters)
+        self._selected = {}
+
+    def _select(self, only=None, exclude=()):
+        """레이어 선택 결과 (페이지별 그리기 함수 목록, 한 번 만들면 재사용)"""
+        key = (frozenset(only) if only is not None else None, frozenset(exclude))
+        pages = self._selected.get(key)
+        if pages is None:
+            pages = [
+                [draw for layer, draw in ops
+                 if (only is None or layer in only) and layer not in exclude]
+                for ops in self._ops
+            ]
+            self._selected[key] = pages
+        return pages
+
+    def layer_key(self, layer, data):
+        """레이어에 들어가는 값들 (값이 바뀌면 키도 바뀜)"""
+        return tuple(str(get(data) or "") for get in self._layer_getters.get(layer, []))
+
+    def render(self, data, font_path, only=None, exclude=()):
+        """오버레이 PDF(BytesIO) 생성 (only/exclude: 그릴/뺄 레이어)"""
+        pages = self.pages if only is None and not exclude else self._select(only, exclude)
+        packet = BytesIO()
+        c = canvas.Canvas(packet, pagesize=self.page_size)
+        self.draw_pages(c, data, register_korean_font(font_path), pages)
+        c.save()
+        packet.seek(0)
+        return packet
+
+    def draw_pages(self, c, data, font_name, pages=None):
+        """열린 캔버스에 이어서 페이지를 그림 (그린 페이지 수 반환)"""
+        pages = self.pages if pages is None else pages
+        for ops in pages:
+            c.setPageSize(self.page_size)
+            c.setFont(font_name, self.font_size)
+            c.setFillColorRGB(0, 0, 0)
+            for draw in ops:
+                draw(c, data, font_name)
+            c.showPage()
+        return len(pages)
+
+
+# =========================================================
+# 스펙 로드
+# =========================================================
+def compile_layout(spec, name=""):
+    """dict 스펙을 바로 컴파일"""
+    return CompiledLayout(spec, name)
+
+
+def load_layout_file(path, factory=None):
+    """스펙 파일을 읽어서 컴파일 (파일이 바뀌지 않았으면 캐시 사용)"""
+    factory = factory or CompiledLayout
+    path = os.path.abspath(path)
+    mtime = os.path.getmtime(path)
+    cached = _compiled.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with _compiled_lock:
+        cached = _compiled.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                spec = json.load(f)
+            name = os.path.splitext(os.path.basename(path))[0]
+            layout = factory(spec, name)
+            layout.version = mtime
+            cached = (mtime, layout)
+            _compiled[path] = cached
+    return cached[1]
+
+
+def get_layout(name):
+    """layouts/<name>.json"""
+    return load_layout_file(os.path.join(LAYOUT_DIR, f"{name}.json"))
+
+
+def render_layout(name, data, font_path):
+    """레이아웃 이름으로 오버레이 PDF 생성"""
+    return get_layout(name).render(data, font_path)
+
+
+def merge_layout(template_path, name, data, font_path, max_pages=None, backend=None):
+    """레이아웃으로 오버레이를 만들어 템플릿과 병합 (BytesIO)
+
+    고정 레이어가 있으면 (템플릿, 레이어 값)별로 미리 찍은 템플릿을 캐시해 두고
+    요청마다 나머지 필드만 그려서 병합한다.
+    backend: template_cache 병합 방식 (없으면 기본 방식)
+    """
+    layout = get_layout(name)
+    if not layout.layers:
+        return merge_overlay(template_path, layout.render(data, font_path), max_pages, backend)
+
+    stamp_key = (name, layout.version, font_path) + tuple(
+        (layer, layout.layer_key(layer, data)) for layer in layout.layers
+    )
+    overlay = layout.render(data, font_path, exclude=layout.layers)
+    return merge_overlay_stamped(
+        template_path, stamp_key,
+        lambda: layout.render(data, font_path, only=layout.layers),
+        overlay, max_pages, backend
+    )
+
+
+# =========================================================
+# 1금융권
+# =========================================================
+def list_bank_layouts():
+    """layouts/banks/*.json 의 은행명 목록 (스펙의 "order", 같으면 파일명 순)"""
+    try:
+        names = [os.path.splitext(n)[0] for n in os.listdir(BANK_LAYOUT_DIR) if n.endswith(".json")]
+    except OSError:
+        return []
+    banks = []
+    for name in names:
+        try:
+            layout = load_layout_file(os.path.join(BANK_LAYOUT_DIR, f"{name}.json"), CompiledBankLayout)
+        except Exception:
+            continue
+        banks.append((layout.order, name))
+    return [name for _, name in sorted(banks)]
+
+
+def get_bank_layout(bank_name, doc_type):
+    """은행별 스펙 파일에서 문서(설정계약서/위임장) 레이아웃 (없으면 None)"""
+    path = os.path.join(BANK_LAYOUT_DIR, f"{bank_name}.json")
+    if not os.path.exists(path):
+        return None
+    return load_layout_file(path, CompiledBankLayout).documents.get(doc_type)
+
+
+class CompiledBankLayout:
+    """은행 스펙 1개 = 문서 종류별 CompiledLayout"""
+
+    def __init__(self, spec, name=""):
+        self.name = name
+        self.spec = spec
+        self.order = spec.get("order", 999)
+        self.documents = {
+            doc_type: CompiledLayout(doc_spec, f"{name}_{doc_type}")
+            for doc_type, doc_spec in spec.get("documents", {}).items()
+        }
+
+
+# 은행 스펙이 없을 때 쓰는 부동산표시 박스
+DEFAULT_BANK_LAYOUT = CompiledLayout(
+    {"pages": [[{"type": "box_lines", "field": "estate_text"}]]}, "bank_default"
+)
+
+
+def render_many(jobs, font_path):
+    """여러 문서를 캔버스 하나에 이어서 그려 PDF 1개로 반환
+
+    jobs: [(CompiledLayout, data), ...]
+    반환: (BytesIO, 문서별 (시작 페이지 번호, 페이지 수) 목록)
+    """
+    packet = BytesIO()
+    c = canvas.Canvas(packet, pagesize=A4)
+    font_name = register_korean_font(font_path)
+    ranges = []
+    page_no = 0
+    for layout, data in jobs:
+        count = layout.draw_pages(c, data, font_name)
+        ranges.append((page_no, count))
+        page_no += count
+    c.save()
+    packet.seek(0)
+    return packet, ranges
+
+
+def render_bank_estates(items, font_path):
+    """1금융권 부동산표시 페이지 일괄 생성 (캔버스 1개, 모든 페이지를 한 번에)
+
+    items: [(은행명, 문서 종류("설정계약서"/"위임장"), 부동산표시), ...]
+    반환: (BytesIO 또는 None, 항목별 {"은행", "문서", "페이지", "오류"} 목록)
+    은행 스펙에 없는 문서는 기본 박스(DEFAULT_BANK_LAYOUT)로 그림, 부동산표시가 비면 건너뜀
+    """
+    jobs = []
+    report = []
+    for bank_name, doc_type, estate_text in items:
+        entry = {"은행": bank_name, "문서": doc_type, "페이지": "", "오류": ""}
+        report.append(entry)
+        if not str(estate_text or "").strip():
+            entry["오류"] = "부동산표시 없음"
+            continue
+        layout = get_bank_layout(bank_name, doc_type) or DEFAULT_BANK_LAYOUT
+        jobs.append((entry, layout, {"estate_text": estate_text}))
+
+    if not jobs:
+        return None, report
+    packet, ranges = render_many([(layout, data) for _, layout, data in jobs], font_path)
+    for (entry, _, _), (start, count) in zip(jobs, ranges):
+        entry["페이지"] = str(start + 1) if count == 1 else f"{start + 1}-{start + count}"
+    return packet, report
+
+
+def clear_layout_cache():
+    """컴파일 캐시 비우기"""
+    with _compiled_lock:
+        _compiled.clear()
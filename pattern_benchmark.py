@@ -0,0 +1,249 @@
+"""
+정규식 방식 비교 (Pattern Benchmark)
+- 등기부 토지/1동 건물 행 파싱, 표제부 행 판별, 주소/번호 처리를 예전 방식(반복문 안 인라인 정규식)과
+  registry_patterns(미리 컴파일 + 토지 칸 scan_cell) 방식으로 각각 돌려 행당 시간 측정
+- 정확성: 두 방식의 결과가 같은지 확인 (예전 방식의 dict 결과는 RegistryResult로 바꿔서 비교)
+- 사용법: python pattern_benchmark.py [-n 반복횟수]
+"""
+
+import argparse
+import re
+import statistics
+import time
+
+from registry_parser import _parse_1동건물, _parse_토지, convert_region
+from registry_result import RegistryResult
+from registry_patterns import (
+    ADDRESS_UNIT_RE, NON_DIGIT_RE, REGION_MARKER_RE, ROAD_ADDRESS_RE, ROW_NUMBER_RE, 번지_END_RE,
+)
+
+
+# =========================================================
+# 샘플 행 (pdfplumber extract_tables 결과 형태)
+# =========================================================
+SAMPLE_토지_ROWS = [
+    ("123-4", ["1", "1. 서울특별시 강남구 역삼동 123-4", "대", "1234.5㎡", "2010년5월1일\n등기"]),
+    ("55", ["2\n(전 1)", "2. 경기도 성남시 분당구 정자동 55", "대\n대", "812㎡", None]),
+    ("7", ["3", "1. 부산광역시 해운대구 우동 7 2. 부산광역시 해운대구 우동 8",
+           "대\n도로", "450.2㎡\n120㎡", "2015년3월2일"]),
+    ("301-12", ["4", "서울특별시 서초구 서초동 301-12", "잡종지", "98.7㎡", ""]),
+    ("9", ["5", "인천광역시 연수구 송도동 9", "", "대 3000㎡", "합병"]),
+]
+
+SAMPLE_1동_ROWS = [
+    ["1", "2010년5월1일", "서울특별시 강남구 역삼동 123-4\n역삼래미안\n제101동\n[도로명주소]\n서울특별시 강남구 테헤란로 1", ""],
+    ["2", "2012년1월2일", "경기도 성남시 분당구 정자동 55\n열람용\n정자동파\n크뷰 제2동", ""],
+    ["3", "2015년3월2일", "부산광역시 해운대구 우동 7, 8\n해운대열아이파크\n[도로명주소]\n부산광역시 해운대구\n마린시티2로 33\n용", ""],
+]
+
+SAMPLE_ADDRESSES = [
+    "서울특별시 강남구 테헤란로 123-4 101동 1203호",
+    "경기도 성남시 분당구 정자일로 95 2층",
+    "부산광역시 해운대구 마린시티2로 33",
+    "서울특별시 마포구 삼개로16, 2신관1층103호(도화동,근신빌딩)",
+]
+SAMPLE_NUMBERS = ["800101-1234567", "110111-4138560", "1801111452175", "12,000,000원"]
+SAMPLE_ESTATE = ("1동의 건물의 표시\n서울특별시 강남구 역삼동 123-4\n[도로명주소] 서울특별시 강남구 테헤란로 1\n"
+                 "대 1234.5㎡\n서울특별시 강남구 역삼동 123-4 역삼래미안 제101동")
+
+
+# =========================================================
+# 예전 방식 (반복문 안 인라인 정규식) - 비교 기준
+# =========================================================
+def _legacy_parse_토지(rows, result):
+    토지_by_번지 = {}
+    for 번지, row in rows:
+        토지_by_번지[번지] = row
+    토지_items = sorted(토지_by_번지.items(), key=lambda x: (int(re.search(r'^(\d+)', x[0]).group(1)) if x[0] and re.search(r'^(\d+)', x[0]) else 0))
+
+    for idx, (번지, row) in enumerate(토지_items, 1):
+        소재지_raw = (row[1] or "").replace('\n', ' ').strip()
+        지목_raw = ""
+        면적_raw = ""
+        for col in row[2:]:
+            col_str = (col or "").strip()
+            if col_str:
+                if re.match(r'^(대|전|답|임야|잡종지|도로|하천)(\n(대|전|답|임야|잡종지|도로|하천))*$', col_str):
+                    지목_raw = col_str
+                elif '㎡' in col_str:
+                    면적_raw = col_str
+
+        필지_matches = re.split(r'(?=\d+\.\s*[가-힣])', 소재지_raw)
+        필지_matches = [p.strip() for p in 필지_matches if p.strip()]
+
+        if len(필지_matches) > 1:
+            지목_list = re.findall(r'(대|전|답|임야|잡종지|도로|하천|공장용지|학교용지|주차장|창고용지|목장용지|광천지|염전|유지|양어장|수도용지|공원|체육용지|유원지|종교용지|사적지|묘지|주유소용지)', 지목_raw)
+            면적_list = re.findall(r'([\d.]+㎡)', 면적_raw)
+            for i, 필지 in enumerate(필지_matches):
+                소재지 = re.sub(r'^\d+\.\s*', '', 필지).strip()
+                지목 = 지목_list[i] if i < len(지목_list) else (지목_list[0] if 지목_list else "")
+                면적 = 면적_list[i] if i < len(면적_list) else ""
+                result["토지"].append({"번호": str(len(result["토지"]) + 1), "소재지": convert_region(소재지),
+                                     "지목": 지목, "면적": 면적})
+        else:
+            소재지 = re.sub(r'^\d+\.\s*', '', 소재지_raw)
+            지목_match = re.search(r'(대|전|답|임야|잡종지)', 지목_raw)
+            지목 = 지목_match.group(1) if 지목_match else 지목_raw
+            면적_match = re.search(r'([\d.]+㎡)', 면적_raw)
+            면적 = 면적_match.group(1) if 면적_match else 면적_raw
+            result["토지"].append({"번호": str(len(result["토지"]) + 1), "소재지": convert_region(소재지),
+                                 "지목": 지목, "면적": 면적})
+
+
+def _legacy_parse_1동건물(row, result):
+    col2 = (row[2] or "") if len(row) > 2 else ""
+    col2 = re.sub(r'열\s*람\s*용', '', col2)
+    col2 = re.sub(r'(?<=[가-힣])(열|람|용)(?=[가-힣])', '', col2)
+    lines = col2.split('\n')
+    road_idx = -1
+    for i, line in enumerate(lines):
+        if '[도로명주소]' in line:
+            road_idx = i
+            break
+    if road_idx > 0:
+        road_lines = []
+        for i in range(road_idx + 1, len(lines)):
+            line = lines[i].strip()
+            if line and line not in ['열', '람', '용']:
+                road_lines.append(line)
+        result["도로명주소"] = convert_region(' '.join(road_lines))
+    content_lines = lines[:road_idx] if road_idx > 0 else lines
+    content_lines = [l.strip() for l in content_lines if l.strip() and l.strip() not in ['열', '람', '용']]
+    if not content_lines:
+        return
+    지번_end_idx = -1
+    for i, line in enumerate(content_lines):
+        if re.search(r'\d+(-\d+)?$', line.strip()):
+            지번_end_idx = i
+    if 지번_end_idx >= 0:
+        result["1동건물표시"] = convert_region(' '.join(content_lines[:지번_end_idx+1]))
+        건물명_lines = content_lines[지번_end_idx+1:]
+        if 건물명_lines:
+            건물명_text = ' '.join(건물명_lines)
+            동_match = re.search(r'(제[가-힣\d]+동)$', 건물명_text)
+            if 동_match:
+                result["동명칭"] = 동_match.group(1)
+                result["아파트명"] = 건물명_text[:동_match.start()].strip()
+            else:
+                result["아파트명"] = 건물명_text
+    else:
+        result["1동건물표시"] = convert_region(' '.join(content_lines))
+
+
+def _legacy_classify_row(row):
+    """표제부 행 판별: 현행 행인지, 토지면 번지"""
+    row0_clean = str(row[0]).strip()
+    if not (re.match(r'^\d+$', row0_clean) or re.match(r'^\d+\n\(전', row0_clean)):
+        return None
+    소재지 = row[1] or ""
+    if not re.search(r'(시|군|구|동|리|읍|면)\s', 소재지):
+        return None
+    번지_match = re.search(r'(\d+(-\d+)?)$', 소재지.replace('\n', ' ').strip())
+    return 번지_match.group(1) if 번지_match else ""
+
+
+def _classify_row(row):
+    row0_clean = str(row[0]).strip()
+    if not ROW_NUMBER_RE.match(row0_clean):
+        return None
+    소재지 = row[1] or ""
+    if not ADDRESS_UNIT_RE.search(소재지):
+        return None
+    번지_match = 번지_END_RE.search(소재지.replace('\n', ' ').strip())
+    return 번지_match.group(1) if 번지_match else ""
+
+
+# app.py는 import 하면 화면을 그리므로 주소/번호 함수의 정규식 부분만 같은 모양으로 옮겨서 비교
+def _legacy_address(address, number, estate_text):
+    clean = re.sub(r'[^0-9]', '', str(number))
+    match = re.match(r'(.+?(?:로|길)\s*\d+(?:-\d+)?)\s*(.*)$', address)
+    road = (match.group(1).strip(), match.group(2).strip()) if match else (address, "")
+    line = next((l for l in estate_text.split('\n')
+                 if any(region in l for region in ['특별시', '광역시', '시 ', '군 ', '구 '])), "")
+    return clean, road, line
+
+
+def _address(address, number, estate_text):
+    clean = NON_DIGIT_RE.sub('', str(number))
+    match = ROAD_ADDRESS_RE.match(address)
+    road = (match.group(1).strip(), match.group(2).strip()) if match else (address, "")
+    line = next((l for l in estate_text.split('\n') if REGION_MARKER_RE.search(l)), "")
+    return clean, road, line
+
+
+# =========================================================
+# 측정
+# =========================================================
+def _legacy_토지_case():
+    result = {"토지": []}
+    _legacy_parse_토지(SAMPLE_토지_ROWS, result)
+    return result
+
+
+def _legacy_1동_case():
+    results = []
+    for row in SAMPLE_1동_ROWS:
+        result = {}
+        _legacy_parse_1동건물(row, result)
+        results.append(result)
+    return results
+
+
+def _row_case(classify):
+    return [classify(row) for _, row in SAMPLE_토지_ROWS] + [classify(row) for row in SAMPLE_1동_ROWS]
+
+
+def _address_case(helper):
+    return [helper(a, n, SAMPLE_ESTATE) for a, n in zip(SAMPLE_ADDRESSES, SAMPLE_NUMBERS)]
+
+
+# 항목 이름 → (행 수, 예전 방식, 새 방식[, 예전 결과 → 새 결과 모양])
+BENCH_CASES = {
+    "토지 행": (len(SAMPLE_토지_ROWS), _legacy_토지_case, lambda: _parse_토지(SAMPLE_토지_ROWS),
+              lambda legacy: RegistryResult.from_dict(legacy).토지),
+    "1동 건물 행": (len(SAMPLE_1동_ROWS), _legacy_1동_case, lambda: [_parse_1동건물(row) for row in SAMPLE_1동_ROWS],
+                lambda legacy: [RegistryResult.from_dict(result).건물 for result in legacy]),
+    "표제부 행 판별": (len(SAMPLE_토지_ROWS) + len(SAMPLE_1동_ROWS),
+                  lambda: _row_case(_legacy_classify_row), lambda: _row_case(_classify_row)),
+    "주소/번호": (len(SAMPLE_ADDRESSES), lambda: _address_case(_legacy_address), lambda: _address_case(_address)),
+}
+
+
+def _time_per_row(func, rows, repeat):
+    """행당 μs (반복별 중앙값)"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(100):
+            func()
+        timings.append((time.perf_counter() - start) / 100)
+    return statistics.median(timings) / rows * 1e6
+
+
+def run(repeat=50):
+    """항목별 결과 출력 후 {항목: {"legacy", "compiled", "ok"}} 반환"""
+    all_results = {}
+    print(f"{'항목':<14}{'예전(μs/행)':>12}{'새(μs/행)':>12}{'배속':>8}  정확성")
+    for name, (rows, legacy, compiled, *convert) in BENCH_CASES.items():
+        to_current = convert[0] if convert else (lambda value: value)
+        r = {
+            "legacy": _time_per_row(legacy, rows, repeat),
+            "compiled": _time_per_row(compiled, rows, repeat),
+            "ok": to_current(legacy()) == compiled(),
+        }
+        all_results[name] = r
+        print(f"{name:<14}{r['legacy']:>12.2f}{r['compiled']:>12.2f}{r['legacy'] / r['compiled']:>7.2f}x  "
+              f"{'OK' if r['ok'] else '불일치'}")
+    return all_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정규식 방식 비교 (예전 인라인 정규식 vs registry_patterns)")
+    parser.add_argument("-n", "--repeat", type=int, default=50, help="항목별 반복 횟수 (1회 = 100번 실행)")
+    args = parser.parse_args()
+    run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+PDF 용량 최적화 (PDF Optimize)
+- 병합이 끝난 PDF를 한 번 더 정리해서 용량을 줄임
+  1) 같은 내용의 객체(템플릿 폰트/이미지 등) 중복 제거 → 문서를 여러 건 합친 PDF에서 효과가 큼
+  2) 압축 안 된 내용 스트림(content stream) Flate 압축
+  3) 어디에서도 참조하지 않는 객체 제거
+- 오버레이 한글 폰트는 reportlab이 이미 사용한 글자만 담아(subset) 넣으므로 글리프를 다시 줄이지는 않음
+- pypdf(requirements.txt)가 있으면 사용, 없으면 PyPDF2로 내용 스트림 압축만 수행
+"""
+
+from io import BytesIO
+
+try:
+    import pypdf
+    PYPDF_OK = True
+except Exception:
+    pypdf = None
+    PYPDF_OK = False
+
+try:
+    import PyPDF2
+    PYPDF2_OK = True
+except Exception:
+    PyPDF2 = None
+    PYPDF2_OK = False
+
+
+def _to_bytes(pdf):
+    if isinstance(pdf, (bytes, bytearray)):
+        return bytes(pdf)
+    if hasattr(pdf, "getvalue"):
+        return pdf.getvalue()
+    return pdf.read()
+
+
+def _compress_pages(writer):
+    for page in writer.pages:
+        try:
+            page.compress_content_streams()
+        except Exception:
+            # 손상된 내용 스트림은 원본 그대로 둠
+            pass
+
+
+def _optimize_pypdf(data):
+    reader = pypdf.PdfReader(BytesIO(data))
+    writer = pypdf.PdfWriter(clone_from=reader)
+    _compress_pages(writer)
+    if hasattr(writer, "compress_identical_objects"):
+        writer.compress_identical_objects()
+    out = BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def _optimize_pypdf2(data):
+    reader = PyPDF2.PdfReader(BytesIO(data))
+    writer = PyPDF2.PdfWriter()
+    for page in reader.pages:
+        writer.add_page(page)
+    _compress_pages(writer)
+    out = BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def optimize_pdf(pdf):
+    """PDF(bytes 또는 BytesIO) 최적화 → (BytesIO, 결과)
+
+    결과: {"before": 원래 바이트, "after": 최적화 후 바이트, "saved": 줄어든 바이트,
+           "engine": 사용한 라이브러리 (원본을 그대로 돌려주면 None)}
+    최적화 결과가 더 크거나 실패하면 원본을 그대로 돌려줌
+    """
+    data = _to_bytes(pdf)
+    report = {"before": len(data), "after": len(data), "saved": 0, "engine": None}
+
+    optimized = None
+    for engine, ok, func in (("pypdf", PYPDF_OK, _optimize_pypdf), ("PyPDF2", PYPDF2_OK, _optimize_pypdf2)):
+        if not ok:
+            continue
+        try:
+            optimized = func(data)
+            break
+        except Exception:
+            continue
+
+    if optimized is None or len(optimized) >= len(data):
+        return BytesIO(data), report
+
+    report["engine"] = engine
+    report["after"] = len(optimized)
+    report["saved"] = len(data) - len(optimized)
+    return BytesIO(optimized), report
+
+
+def format_saved(report):
+    """"1.2MB → 340KB (72% 감소)" 형식"""
+    def size(n):
+        if n >= 1024 * 1024:
+            return f"{n / 1024 / 1024:.1f}MB"
+        return f"{n / 1024:.0f}KB"
+    if not report.get("saved"):
+        return size(report.get("before", 0))
+    percent = report["saved"] * 100 // max(1, report["before"])
+    return f"{size(report['before'])} → {size(report['after'])} ({percent}% 감소)"
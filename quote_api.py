@@ -0,0 +1,260 @@
+"""
+등기 비용 일괄 견적 API (Quote API)
+- fee_engine을 JSON으로: 근저당 설정 비용(calculate_all과 같은 항목), 법인등기 비용(CORP_REGISTRY_FEES)
+- 요청 1번에 여러 건 - 근저당 설정은 quote_batch로 한 번에 계산
+- 위택스 서버(main.py, 8000번)와 별도 프로세스: 브라우저 작업 Lock 없이 동시 요청 처리
+- 응답 시간은 최근 요청 기준 p50/p99를 /stats에서 확인, LATENCY_BUDGET_MS를 넘은 요청은 로그 출력
+- 입력 검증: 금액/건수는 0 이상 (금액 MAX_AMOUNT 이하), manual_costs는 MANUAL_COST_NAMES 항목만 → 어긋나면 {"error": ...}
+- 실행: python quote_api.py [--port 8001]  /  응답 시간 점검: python quote_api.py --bench [-n 건수] [-r 반복]
+
+POST /quote/batch
+{"as_of": "2025-03-01",                     # (선택) 요율 기준일, 건별 as_of가 우선, 없으면 오늘
+ "cases": [{"amount": 120000000, "parcels": 1, "rate": 9.1346, "address_changes": 0,
+            "creditor": "", "base_fee": 0, "add_fee": 0, "etc_fee": 0, "discount": 0,
+            "manual_costs": {"제증명": 50000}, "show_fee": true}]}
+→ {"results": [{"기본료": ..., "등록면허세": ..., ..., "총 합계": ...}]}
+
+POST /quote/corp
+{"cases": [{"kind": "임원변경", "notary": "일반", "cert": false, "purpose_count": 10, "manual_tax": 0}]}
+→ {"results": [{"대행료": ..., "부가세": ..., "공과금": ..., "총 합계": ..., "note": ..., "docs": ...}]}
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import deque
+from datetime import date
+from typing import Annotated, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, field_validator
+
+from fee_engine import (CORP_QUOTE_FIELDS, CORP_REGISTRY_FEES, MANUAL_COST_NAMES, QUOTE_FIELDS,
+                        get_schedules, quote_batch, quote_corp_registry)
+
+app = FastAPI()
+
+DEFAULT_PORT = 8001
+LATENCY_BUDGET_MS = 50   # 견적 요청 p99 목표 (500건 기준)
+LATENCY_WINDOW = 1000    # p50/p99 계산에 쓰는 최근 요청 수
+MAX_AMOUNT = 10 ** 15    # 금액 상한 (1,000조원) - fee_engine int64 계산이 넘치지 않는 범위
+MAX_COUNT = 100_000      # 필지수/주소변경 건수/목적 개수 상한
+
+_latencies = deque(maxlen=LATENCY_WINDOW)
+_latency_lock = threading.Lock()
+
+
+Money = Annotated[int, Field(ge=0, le=MAX_AMOUNT)]
+Count = Annotated[int, Field(ge=0, le=MAX_COUNT)]
+
+
+class QuoteCase(BaseModel):
+    amount: Money                        # 채권최고액
+    parcels: Count = 1                   # 필지수
+    rate: float = Field(ge=0, le=100)    # 채권할인율 (%)
+    address_changes: Count = 0           # 주소변경 건수
+    creditor: str = ""                   # 금융사 (기본료 고정 금융사 구분)
+    base_fee: Money = 0                  # 수기입력 기본료 (0이면 보수표)
+    add_fee: Money = 0                   # 추가보수
+    etc_fee: Money = 0                   # 기타보수
+    discount: Money = 0                  # 할인금액
+    manual_costs: Dict[str, Money] = {}  # 수기입력 공과금 {제증명, 교통비, 원인증서, ...}
+    show_fee: bool = True                # False면 보수액 0 (공과금만)
+    as_of: Optional[date] = None         # 요율 기준일
+
+    @field_validator("manual_costs")
+    @classmethod
+    def _known_manual_costs(cls, value):
+        unknown = [k for k in value if k not in MANUAL_COST_NAMES]
+        if unknown:
+            raise ValueError(f"알 수 없는 공과금 항목: {', '.join(unknown)} (가능: {', '.join(MANUAL_COST_NAMES)})")
+        return value
+
+
+class QuoteRequest(BaseModel):
+    as_of: Optional[date] = None
+    cases: List[QuoteCase]
+
+
+class CorpQuoteCase(BaseModel):
+    kind: str                            # CORP_REGISTRY_FEES 종류
+    notary: Optional[str] = None         # 공증료: None / "일반" / "특별"
+    cert: bool = False                   # 전자증명서 발급대행
+    purpose_count: Count = 10            # 법인설립 목적 개수
+    manual_tax: Money = 0                # 공과금이 정해지지 않은 종류의 공과금
+
+
+class CorpQuoteRequest(BaseModel):
+    cases: List[CorpQuoteCase]
+
+
+# =============================================================================
+# 계산
+# =============================================================================
+def price_cases(request):
+    """QuoteRequest → 건별 {QUOTE_FIELDS 항목: 금액} 목록 (quote_batch 한 번)"""
+    cases = request.cases
+    if not cases:
+        return []
+    dates = [case.as_of or request.as_of for case in cases]
+    if all(d == dates[0] for d in dates):
+        as_of = dates[0]
+    else:
+        today = date.today()
+        as_of = [d or today for d in dates]
+    creditors = [case.creditor for case in cases]
+    columns = quote_batch(
+        [case.amount for case in cases],
+        [case.parcels for case in cases],
+        [case.rate for case in cases],
+        [case.address_changes for case in cases],
+        creditor=creditors[0] if len(set(creditors)) == 1 else creditors,
+        base_fee=[case.base_fee for case in cases],
+        add_fee=[case.add_fee for case in cases],
+        etc_fee=[case.etc_fee for case in cases],
+        discount=[case.discount for case in cases],
+        manual_cost=[sum(case.manual_costs.get(k, 0) for k in MANUAL_COST_NAMES) for case in cases],
+        show_fee=[case.show_fee for case in cases],
+        as_of=as_of,
+    )
+    values = [columns[name].tolist() for name in QUOTE_FIELDS]
+    return [dict(zip(QUOTE_FIELDS, row)) for row in zip(*values)]
+
+
+def price_corp_cases(request):
+    """CorpQuoteRequest → 건별 {CORP_QUOTE_FIELDS 항목, note, docs} 목록"""
+    results = []
+    for case in request.cases:
+        result = quote_corp_registry(case.kind, notary=case.notary, cert=case.cert,
+                                     purpose_count=case.purpose_count, manual_tax=case.manual_tax)
+        info = CORP_REGISTRY_FEES[case.kind]
+        result["note"] = info["note"]
+        result["docs"] = info["docs"]
+        results.append(result)
+    return results
+
+
+def _record_latency(ms):
+    with _latency_lock:
+        _latencies.append(ms)
+
+
+def latency_stats(samples):
+    """[ms, ...] → {"count", "p50_ms", "p99_ms", "budget_ms"}"""
+    if not samples:
+        return {"count": 0, "p50_ms": 0.0, "p99_ms": 0.0, "budget_ms": LATENCY_BUDGET_MS}
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return {"count": len(ordered), "p50_ms": round(statistics.median(ordered), 2),
+            "p99_ms": round(p99, 2), "budget_ms": LATENCY_BUDGET_MS}
+
+
+# =============================================================================
+# API
+# =============================================================================
+@app.exception_handler(RequestValidationError)
+async def validation_error(request: Request, exc: RequestValidationError):
+    # 다른 오류와 같은 {"error": ...} 형태로 (어느 건의 어느 항목인지 포함)
+    messages = [f"{'.'.join(str(p) for p in err['loc'][1:])}: {err['msg']}" for err in exc.errors()]
+    return JSONResponse(status_code=422, content={"error": "; ".join(messages)})
+
+
+@app.middleware("http")
+async def measure_latency(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    response.headers["X-Elapsed-Ms"] = f"{elapsed_ms:.2f}"
+    if request.url.path.startswith("/quote/") and request.method == "POST":
+        _record_latency(elapsed_ms)
+        if elapsed_ms > LATENCY_BUDGET_MS:
+            print(f"⚠️ 견적 응답 지연 {elapsed_ms:.1f}ms (목표 {LATENCY_BUDGET_MS}ms): {request.url.path}")
+    return response
+
+
+@app.get("/")
+def root():
+    schedules = [{"name": s.name, "effective": s.effective.isoformat()} for s in get_schedules()]
+    return {"status": "ok", "message": "Quote Server Running", "schedules": schedules}
+
+
+@app.post("/quote/batch")
+def quote_cases(request: QuoteRequest):
+    try:
+        return {"results": price_cases(request)}
+    except (ValueError, OverflowError) as e:
+        return {"error": str(e)}
+
+
+@app.post("/quote/corp")
+def quote_corp_cases(request: CorpQuoteRequest):
+    try:
+        return {"results": price_corp_cases(request)}
+    except (ValueError, OverflowError) as e:
+        return {"error": str(e)}
+
+
+@app.get("/quote/corp/kinds")
+def corp_kinds():
+    return {"kinds": CORP_REGISTRY_FEES, "fields": CORP_QUOTE_FIELDS}
+
+
+@app.get("/stats")
+def stats():
+    with _latency_lock:
+        samples = list(_latencies)
+    return latency_stats(samples)
+
+
+# =============================================================================
+# 실행 / 응답 시간 점검
+# =============================================================================
+def _random_payload(rnd, count):
+    return {"cases": [
+        {"amount": rnd.randrange(10, 3000) * 1_000_000, "parcels": rnd.randrange(1, 4),
+         "rate": round(rnd.uniform(8, 13), 5), "address_changes": rnd.choice([0, 0, 0, 1]),
+         "manual_costs": {"제증명": 50000, "교통비": 100000, "원인증서": 50000}}
+        for _ in range(count)]}
+
+
+def bench(count=500, repeat=200, seed=0):
+    """요청 검증 + 계산 시간 (HTTP 전송 제외) p50/p99 출력, 목표 이내면 True"""
+    rnd = random.Random(seed)
+    payloads = [_random_payload(rnd, count) for _ in range(10)]
+    price_cases(QuoteRequest.model_validate(payloads[0]))  # 요율 파일 읽기 등 첫 호출 제외
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        price_cases(QuoteRequest.model_validate(payloads[i % len(payloads)]))
+        samples.append((time.perf_counter() - start) * 1000)
+    result = latency_stats(samples)
+    ok = result["p99_ms"] <= LATENCY_BUDGET_MS
+    print(f"{count}건 x {repeat}회: p50 {result['p50_ms']:.2f}ms, p99 {result['p99_ms']:.2f}ms "
+          f"(목표 {LATENCY_BUDGET_MS}ms) {'OK' if ok else '초과'}")
+    return ok
+
+
+def run_server(port=DEFAULT_PORT):
+    import uvicorn
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="등기 비용 일괄 견적 API")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본 {DEFAULT_PORT})")
+    parser.add_argument("--bench", action="store_true", help="서버 대신 응답 시간 점검")
+    parser.add_argument("-n", "--count", type=int, default=500, help="점검 요청 1번의 건수")
+    parser.add_argument("-r", "--repeat", type=int, default=200, help="점검 반복 횟수")
+    args = parser.parse_args()
+    if args.bench:
+        sys.exit(0 if bench(args.count, args.repeat) else 1)
+    run_server(args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+등기부 일괄 추출 (Registry Batch)
+- 폴더 안의 등기부 PDF를 프로세스 풀로 나눠서 parse_registry_pdf + format_estate_text 실행
+- 파일 1개가 끝날 때마다 JSON 1줄(JSONL)로 바로 출력: 파일, 결과(예전 dict 모양), 부동산표시, 디버그, 소요 시간
+- 화면(Streamlit) 없이 실행: 금융사에서 받은 등기부를 밤사이 미리 추출해 둘 때 사용
+- 작업 프로세스가 죽어도(손상된 PDF 등) 중단하지 않음: 남은 파일은 하나씩 다시 처리, 죽은 파일은 오류 줄로 기록
+
+사용법
+  python registry_batch.py <폴더> [-o 결과.jsonl] [-j 작업수] [-r] [--cache]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from registry_parser import format_estate_text, parse_registry_pdf
+
+
+# 이보다 적으면 프로세스를 띄우지 않고 바로 처리
+MIN_FILES_FOR_POOL = 4
+
+
+def find_pdfs(folder, recursive=False):
+    """폴더 안의 PDF 경로 목록 (이름순)"""
+    paths = []
+    if recursive:
+        for root, _, names in os.walk(folder):
+            paths.extend(os.path.join(root, n) for n in names if n.lower().endswith(".pdf"))
+    else:
+        paths = [os.path.join(folder, n) for n in os.listdir(folder)
+                 if n.lower().endswith(".pdf") and os.path.isfile(os.path.join(folder, n))]
+    return sorted(paths)
+
+
+def _new_record(path):
+    return {"file": path, "ok": False, "result": None, "estate_text": "", "debug": None, "seconds": 0.0}
+
+
+def _error_record(path, error, start):
+    """작업 프로세스가 결과를 돌려주지 못한 파일 (프로세스 비정상 종료 등)"""
+    record = _new_record(path)
+    record["debug"] = {"errors": [f"{type(error).__name__}: {error}"], "warnings": [], "info": []}
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def parse_file(path, use_cache=False):
+    """작업 프로세스에서 실행: PDF 1개 → 출력 1줄 dict"""
+    start = time.perf_counter()
+    record = _new_record(path)
+    try:
+        if use_cache:
+            from registry_cache import parse_registry_cached
+            result, debug = parse_registry_cached(path)
+        else:
+            result, debug = parse_registry_pdf(path)
+        record["result"] = result.to_dict()
+        record["debug"] = debug
+        if not debug["errors"]:
+            record["estate_text"] = format_estate_text(result)
+            record["ok"] = True
+    except Exception as e:
+        record["debug"] = {"errors": [f"{type(e).__name__}: {e}"], "warnings": [], "info": []}
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def iter_results(paths, max_workers=None, use_cache=False):
+    """끝나는 순서대로 결과 dict를 하나씩 (파일 순서와 다를 수 있음)"""
+    if len(paths) < MIN_FILES_FOR_POOL or max_workers == 1:
+        for path in paths:
+            yield parse_file(path, use_cache)
+        return
+    try:
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    except Exception:
+        # 프로세스를 띄울 수 없는 환경(실행파일 등)에서는 순서대로 처리
+        for path in paths:
+            yield parse_file(path, use_cache)
+        return
+    # 작업 프로세스 하나가 죽으면(손상된 PDF에서 pdfplumber 비정상 종료 등) 풀 전체가 깨져서
+    # 끝나지 않은 파일이 모두 BrokenProcessPool로 끝남 → 그 파일들만 따로 다시 처리
+    unfinished = []
+    with pool:
+        start = time.perf_counter()
+        futures = {pool.submit(parse_file, path, use_cache): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                record = future.result()
+            except BrokenProcessPool:
+                unfinished.append(path)
+                continue
+            except Exception as e:
+                record = _error_record(path, e, start)
+            yield record
+    if unfinished:
+        print(f"⚠️ 작업 프로세스가 비정상 종료됨 - 남은 {len(unfinished)}건은 하나씩 다시 처리", file=sys.stderr)
+        yield from _iter_isolated(sorted(unfinished), use_cache)
+
+
+def _iter_isolated(paths, use_cache=False):
+    """파일마다 작업 프로세스 1개에서 차례로 처리 - 프로세스가 죽은 파일만 오류 기록 후 새 프로세스로 계속"""
+    pool = None
+    try:
+        for path in paths:
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=1)
+            start = time.perf_counter()
+            try:
+                record = pool.submit(parse_file, path, use_cache).result()
+            except BrokenProcessPool as e:
+                pool.shutdown(wait=False)
+                pool = None
+                record = _error_record(path, e, start)
+            except Exception as e:
+                record = _error_record(path, e, start)
+            yield record
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def run(folder, output=None, max_workers=None, recursive=False, use_cache=False):
+    """폴더 일괄 추출 → JSONL (output 없으면 표준출력), (성공 수, 전체 수) 반환"""
+    paths = find_pdfs(folder, recursive)
+    out = open(output, "w", encoding="utf-8") if output else sys.stdout
+    ok_count = 0
+    started = time.perf_counter()
+    try:
+        for done, record in enumerate(iter_results(paths, max_workers, use_cache), start=1):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            ok_count += record["ok"]
+            print(f"[{done}/{len(paths)}] {'성공' if record['ok'] else '실패'} {os.path.basename(record['file'])} "
+                  f"({record['seconds']:.2f}s)", file=sys.stderr)
+    finally:
+        if output:
+            out.close()
+    print(f"완료: {len(paths)}건 중 {ok_count}건 성공, {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return ok_count, len(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="등기부 PDF 일괄 추출 (JSONL 출력)")
+    parser.add_argument("folder", help="등기부 PDF 폴더")
+    parser.add_argument("-o", "--output", help="결과 JSONL 파일 (없으면 표준출력)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="하위 폴더 포함")
+    parser.add_argument("--cache", action="store_true", help="등기부 캐시(registry_cache) 사용")
+    args = parser.parse_args()
+    if not os.path.isdir(args.folder):
+        parser.error(f"폴더가 없습니다: {args.folder}")
+    ok_count, total = run(args.folder, args.output, args.jobs, args.recursive, args.cache)
+    sys.exit(0 if ok_count == total else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+등기부 파싱 성능/정확도 측정 (Registry Benchmark)
+- registry_corpus로 만든 폴더의 등기부를 parse_registry_pdf로 읽어
+  초당 페이지 수, 최대 메모리(tracemalloc), 항목별 정확도, 부동산표시(format_estate_text) 일치율 출력
+- 정답: 폴더의 expected.json (없거나 자료 형식이 바뀌었으면 --generate로 먼저 만듦)
+- 정답에 "unsupported"로 표시된 항목(파서가 지원하지 않는 경우)은 정확도/실패 판정에서 빼고 따로 셈
+- 사용법: python registry_benchmark.py [폴더] [-n 반복횟수] [--generate 개수] [--seed N] [-v]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from registry_corpus import CORPUS_VERSION, build_corpus, load_expected
+from registry_parser import format_estate_text, parse_registry_pdf
+
+
+DEFAULT_FOLDER = os.path.join(tempfile.gettempdir(), "dgon_registry_corpus")
+
+# 비교하는 결과 항목 (RegistryResult.to_dict 키)
+FIELDS = ["1동건물표시", "아파트명", "동명칭", "도로명주소", "건물번호", "고유번호",
+          "구조", "면적", "토지", "대지권종류", "대지권비율"]
+ESTATE_TEXT = "부동산표시"
+
+
+def compare_fields(result, expected):
+    """항목별 일치 여부 {항목: bool} (+ 부동산표시), result: RegistryResult"""
+    values = result.to_dict()
+    matches = {field: values.get(field) == expected["result"].get(field) for field in FIELDS}
+    matches[ESTATE_TEXT] = format_estate_text(result) == expected["estate_text"]
+    return matches
+
+
+def time_file(path, repeat):
+    """파일 1개 파싱 시간 (반복 중앙값, 초)과 결과"""
+    timings = []
+    result = debug = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result, debug = parse_registry_pdf(path)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result, debug
+
+
+def peak_memory(path):
+    """파일 1개 파싱 중 최대 메모리 (byte, 파이썬 할당 기준)"""
+    tracemalloc.start()
+    try:
+        parse_registry_pdf(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run(folder, repeat=3, verbose=False):
+    """폴더 측정 결과 출력 후 요약 dict 반환"""
+    expected = load_expected(folder)
+    if expected is None:
+        raise FileNotFoundError(f"정답 파일이 없습니다: {folder} (--generate로 먼저 생성)")
+    if expected.get("version") != CORPUS_VERSION:
+        raise ValueError(f"예전 형식의 자료입니다: {folder} (--generate로 다시 생성)")
+    files = expected["files"]
+
+    total_seconds = 0.0
+    total_pages = 0
+    peak = 0
+    field_hits = {field: 0 for field in FIELDS + [ESTATE_TEXT]}
+    field_counts = dict.fromkeys(field_hits, 0)
+    failures = {}
+    known = {}
+    for name, entry in files.items():
+        path = os.path.join(folder, name)
+        seconds, result, debug = time_file(path, repeat)
+        memory = peak_memory(path)
+        matches = compare_fields(result, entry) if not debug["errors"] else {f: False for f in field_hits}
+        total_seconds += seconds
+        total_pages += entry["pages"]
+        peak = max(peak, memory)
+        unsupported = entry.get("unsupported", {})
+        for field, ok in matches.items():
+            if field not in unsupported:
+                field_hits[field] += ok
+                field_counts[field] += 1
+        wrong = [field for field, ok in matches.items() if not ok and field not in unsupported]
+        if wrong:
+            failures[name] = wrong
+        if unsupported:
+            known[name] = list(unsupported)
+        if verbose:
+            status = "OK" if not wrong else "불일치: " + ", ".join(wrong)
+            if unsupported:
+                status += f"  (미지원 제외: {', '.join(unsupported)})"
+            print(f"{name:<14}{entry['pages']:>4}p {seconds * 1000:>8.1f}ms {memory / 1024 / 1024:>7.1f}MB  {status}")
+
+    count = len(files)
+    summary = {
+        "files": count,
+        "pages": total_pages,
+        "seconds": total_seconds,
+        "pages_per_second": total_pages / total_seconds if total_seconds else 0.0,
+        "peak_bytes": peak,
+        "accuracy": {field: hits / field_counts[field] if field_counts[field] else 0.0
+                     for field, hits in field_hits.items()},
+        "failures": failures,
+        "unsupported": known,
+    }
+
+    print(f"등기부 {count}건 / {total_pages}페이지, 파싱 {total_seconds:.2f}s "
+          f"→ {summary['pages_per_second']:.1f} 페이지/초, 최대 메모리 {peak / 1024 / 1024:.1f}MB")
+    print("\n항목별 정확도")
+    for field, accuracy in summary["accuracy"].items():
+        skipped = count - field_counts[field]
+        note = f", 미지원 {skipped}건 제외" if skipped else ""
+        print(f"  {field:<10}{accuracy * 100:>6.1f}%  ({field_hits[field]}/{field_counts[field]}{note})")
+    if failures and not verbose:
+        print(f"\n불일치 {len(failures)}건 (자세히: -v)")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="등기부 파싱 성능/정확도 측정")
+    parser.add_argument("folder", nargs="?", default=DEFAULT_FOLDER, help=f"합성 등기부 폴더 (기본: {DEFAULT_FOLDER})")
+    parser.add_argument("-n", "--repeat", type=int, default=3, help="파일별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--generate", type=int, metavar="개수", help="측정 전에 합성 등기부를 새로 생성")
+    parser.add_argument("--seed", type=int, default=0, help="생성 seed")
+    parser.add_argument("-v", "--verbose", action="store_true", help="파일별 결과 출력")
+    args = parser.parse_args()
+    # pdfminer가 폰트마다 출력하는 FontBBox 경고 숨김
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)
+    if args.generate:
+        build_corpus(args.folder, args.generate, args.seed)
+    else:
+        expected = load_expected(args.folder)
+        if expected is None:
+            parser.error(f"정답 파일이 없습니다: {args.folder} (--generate 개수로 먼저 생성)")
+        if expected.get("version") != CORPUS_VERSION:
+            parser.error(f"예전 형식의 자료입니다: {args.folder} (--generate 개수로 다시 생성)")
+    summary = run(args.folder, args.repeat, args.verbose)
+    sys.exit(0 if not summary["failures"] else 1)
+
+
+if __name__ == "__main__":
+    main()
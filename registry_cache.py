@@ -0,0 +1,223 @@
+"""
+등기부 파싱 결과 캐시 (Registry Cache)
+- 업로드한 PDF 바이트의 SHA-256 + 파서 버전(PARSER_VERSION)을 키로 (result, debug)를 디스크에 저장
+  (결과는 RegistryResult.to_compact - 키 이름 없이 값만 배열로 담은 짧은 JSON)
+- 같은 등기부를 다시 올리거나 재실행(rerun) 뒤 다시 추출하면 파싱 없이 바로 반환
+- 모든 세션/탭/프로세스가 같은 폴더를 공유, 오래 안 쓴 것부터 지워서 전체 크기/개수 제한
+- 파서가 바뀌면 PARSER_VERSION을 올림 → 예전 결과는 키가 달라져 쓰이지 않고 차례로 지워짐
+- RegistryParseJob: 작업 스레드에서 분석 (화면은 진행 상황만 읽고, 중단은 CancelToken으로)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from io import BytesIO
+
+from registry_parser import PARSER_VERSION, STAGE_DONE, CancelToken, ParseEvent, iter_parse_registry
+from registry_result import RegistryResult
+
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dgon_auto", "registry_cache")
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+MAX_CACHE_ENTRIES = 2000
+
+CACHE_HIT_INFO = "이전에 분석한 등기부 - 저장된 결과 사용"
+
+_lock = threading.Lock()
+_cache_dir = CACHE_DIR
+
+
+def set_cache_dir(path):
+    """캐시 폴더 변경 (None이면 기본 폴더)"""
+    global _cache_dir
+    _cache_dir = path or CACHE_DIR
+
+
+def _read_bytes(uploaded_file):
+    """경로/바이트/파일 객체(Streamlit 업로드 파일 등) → 바이트"""
+    if isinstance(uploaded_file, (bytes, bytearray)):
+        return bytes(uploaded_file)
+    if isinstance(uploaded_file, (str, os.PathLike)):
+        with open(uploaded_file, "rb") as f:
+            return f.read()
+    if hasattr(uploaded_file, "getvalue"):
+        return uploaded_file.getvalue()
+    position = uploaded_file.tell() if hasattr(uploaded_file, "tell") else None
+    data = uploaded_file.read()
+    if position is not None:
+        uploaded_file.seek(position)
+    return data
+
+
+def registry_cache_key(data):
+    """PDF 바이트 → 캐시 키 (SHA-256, 파서 버전 포함)"""
+    digest = hashlib.sha256()
+    digest.update(f"registry-parser:{PARSER_VERSION}\n".encode("ascii"))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(_cache_dir, f"{key}.json")
+
+
+def _load(key):
+    path = _entry_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("version") != PARSER_VERSION:
+        return None
+    try:
+        result = RegistryResult.from_compact(entry["result"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    try:
+        # 최근 사용 시각 갱신 (오래 안 쓴 것부터 지우는 기준)
+        os.utime(path, None)
+    except OSError:
+        pass
+    return result, entry["debug"]
+
+
+def _store(key, result, debug):
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        path = _entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": PARSER_VERSION, "result": result.to_compact(), "debug": debug}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        # 저장 실패(읽기 전용 폴더 등)는 캐시 없이 계속
+        return
+    _evict()
+
+
+def _list_entries():
+    """[(최근 사용 시각, 크기, 경로), ...]"""
+    entries = []
+    try:
+        names = os.listdir(_cache_dir)
+    except OSError:
+        return entries
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(_cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def _evict():
+    """크기/개수 제한을 넘으면 오래 안 쓴 것부터 삭제"""
+    with _lock:
+        entries = sorted(_list_entries())
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, path in entries:
+            if total <= MAX_CACHE_BYTES and count <= MAX_CACHE_ENTRIES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            count -= 1
+
+
+def iter_parse_registry_cached(uploaded_file, cancel=None):
+    """iter_parse_registry와 같은 진행 이벤트 - 같은 PDF는 저장된 결과로 STAGE_DONE 하나만
+
+    끝까지 분석한 결과만 저장 (오류/중단된 결과는 라이브러리 누락 등 일시적인 원인일 수 있음)
+    """
+    data = _read_bytes(uploaded_file)
+    key = registry_cache_key(data)
+
+    cached = _load(key)
+    if cached is not None:
+        result, debug = cached
+        debug.setdefault("info", []).append(CACHE_HIT_INFO)
+        yield ParseEvent(STAGE_DONE, 0, 0, result, debug)
+        return
+
+    for event in iter_parse_registry(BytesIO(data), cancel):
+        if event.stage == STAGE_DONE and not event.debug.get("errors"):
+            _store(key, event.result, event.debug)
+        yield event
+
+
+def parse_registry_cached(uploaded_file):
+    """parse_registry_pdf와 같은 (result, debug) - 같은 PDF는 저장된 결과 반환"""
+    for event in iter_parse_registry_cached(uploaded_file):
+        pass
+    return event.result, event.debug
+
+
+class RegistryParseJob:
+    """iter_parse_registry_cached를 작업 스레드에서 실행
+
+    화면(Streamlit)은 event로 진행 상황만 읽고, 화면이 다시 실행되어도 분석은 계속된다.
+    cancel() → CancelToken 취소, 파서가 다음 페이지를 읽기 전에 멈추고 중단 결과로 끝남
+    """
+
+    def __init__(self, uploaded_file):
+        data = _read_bytes(uploaded_file)
+        self.key = registry_cache_key(data)
+        self.token = CancelToken()
+        self.event = None        # 마지막 ParseEvent
+        self.error = None        # 작업 스레드에서 난 예외
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(data,), daemon=True)
+        self._thread.start()
+
+    def _run(self, data):
+        try:
+            for event in iter_parse_registry_cached(data, cancel=self.token):
+                self.event = event
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    def cancel(self):
+        self.token.cancel()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """끝날 때까지 (최대 timeout초) 기다림 - 끝났으면 True"""
+        return self._done.wait(timeout)
+
+    def result(self):
+        """끝날 때까지 기다린 뒤 (result, debug) - 작업 스레드에서 난 예외는 여기서 다시 발생"""
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.event.result, self.event.debug
+
+
+def clear_registry_cache():
+    """저장된 결과 모두 삭제"""
+    with _lock:
+        for _, _, path in _list_entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def registry_cache_info():
+    """{"dir", "entries", "bytes"}"""
+    entries = _list_entries()
+    return {"dir": _cache_dir, "entries": len(entries), "bytes": sum(size for _, size, _ in entries)}
@@ -0,0 +1,412 @@
+"""
+등기부 합성 자료 (Registry Corpus)
+- 인터넷등기소 집합건물 등기사항전부증명서 모양의 PDF를 만들고 정답(결과 dict + 부동산표시)을 expected.json에 저장
+- 포함하는 경우: 컬러(빨간 삭선)/흑백, 행정구역 변경(전라북도→전북특별자치도 등), 여러 필지 대지권,
+  말소된 토지, 도로명주소 유무, 아파트명이 갑구에만 있는 경우, 갑구/을구 길이에 따른 페이지 수
+- 같은 seed면 같은 자료 → 파서 변경 전후 비교용 (성능/정확도 측정은 registry_benchmark.py)
+- 파서가 지원하지 않는 경우는 정답에 "unsupported" {항목: 이유}로 표시 (정확도 판정에서 제외)
+- 사용법: python registry_corpus.py <폴더> [-n 개수] [--seed N]
+"""
+
+import argparse
+import json
+import os
+import random
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from font_manager import register_korean_font, string_width
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_PATH = os.path.join(BASE_DIR, "Malgun.ttf")
+
+EXPECTED_FILE = "expected.json"
+CORPUS_VERSION = 2
+
+# 파서가 지원하지 않는 경우 (정답의 "unsupported")
+UNSUPPORTED_BW_STRUCK_LOT = "흑백 PDF의 말소 필지 (번지가 달라 삭선 색 없이는 구분 불가)"
+
+# =========================================================
+# 양식 (A4, pt)
+# =========================================================
+PAGE_WIDTH, PAGE_HEIGHT = A4
+LEFT = 40
+TABLE_WIDTH = 515
+TOP = PAGE_HEIGHT - 90
+BOTTOM = 60
+FONT_SIZE = 8
+LINE_HEIGHT = 10
+CELL_PADDING = 3
+# 삭선 양 끝과 칸 테두리 사이 (pdfplumber 표 선 허용 오차 3pt보다 크게)
+STRIKE_INSET = 5
+
+# 섹션 → (칸 경계 x, 머리글, 칸 제목)
+SECTIONS = {
+    "1동건물": ([0, 50, 110, 300, 400, 515], "【 표 제 부 】 ( 1동의 건물의 표시 )",
+              ["표시번호", "접 수", "소재지번,건물명칭 및 번호", "건 물 내 역", "등기원인 및 기타사항"]),
+    "토지": ([0, 50, 260, 320, 400, 515], "( 대지권의 목적인 토지의 표시 )",
+           ["표시번호", "소 재 지 번", "지 목", "면 적", "등기원인 및 기타사항"]),
+    "전유부분": ([0, 50, 110, 220, 360, 515], "【 표 제 부 】 ( 전유부분의 건물의 표시 )",
+             ["표시번호", "접 수", "건 물 번 호", "건 물 내 역", "등기원인 및 기타사항"]),
+    "대지권": ([0, 50, 200, 330, 515], "( 대지권의 표시 )",
+            ["표시번호", "대지권종류", "대지권비율", "등기원인 및 기타사항"]),
+    "갑구": ([0, 50, 140, 220, 320, 515], "【 갑 구 】 ( 소유권에 관한 사항 )",
+           ["순위번호", "등 기 목 적", "접 수", "등 기 원 인", "권리자 및 기타사항"]),
+    "을구": ([0, 50, 140, 220, 320, 515], "【 을 구 】 ( 소유권 이외의 권리에 관한 사항 )",
+           ["순위번호", "등 기 목 적", "접 수", "등 기 원 인", "권리자 및 기타사항"]),
+}
+
+# =========================================================
+# 내용 재료
+# =========================================================
+# (지번 주소 앞부분, 도로명 주소 앞부분, 현행 지번 주소 앞부분, 현행 도로명 주소 앞부분)
+# 전라북도/강원도는 행정구역 변경 대상 - 정답은 파서 코드를 쓰지 않고 현행 명칭을 그대로 적음
+REGIONS = [
+    ("서울특별시 강남구 역삼동", "서울특별시 강남구 테헤란로",
+     "서울특별시 강남구 역삼동", "서울특별시 강남구 테헤란로"),
+    ("부산광역시 해운대구 우동", "부산광역시 해운대구 마린시티2로",
+     "부산광역시 해운대구 우동", "부산광역시 해운대구 마린시티2로"),
+    ("전라북도 전주시 완산구 효자동3가", "전라북도 전주시 완산구 홍산로",
+     "전북특별자치도 전주시 완산구 효자동3가", "전북특별자치도 전주시 완산구 홍산로"),
+    ("강원도 춘천시 석사동", "강원도 춘천시 영서로",
+     "강원특별자치도 춘천시 석사동", "강원특별자치도 춘천시 영서로"),
+    ("경기도 성남시 분당구 정자동", "경기도 성남시 분당구 정자일로",
+     "경기도 성남시 분당구 정자동", "경기도 성남시 분당구 정자일로"),
+    ("대구광역시 수성구 범어동", "대구광역시 수성구 달구벌대로",
+     "대구광역시 수성구 범어동", "대구광역시 수성구 달구벌대로"),
+    ("전라북도 익산시 영등동", "전라북도 익산시 무왕로",
+     "전북특별자치도 익산시 영등동", "전북특별자치도 익산시 무왕로"),
+    ("강원도 원주시 단계동", "강원도 원주시 봉화로",
+     "강원특별자치도 원주시 단계동", "강원특별자치도 원주시 봉화로"),
+]
+# 갑구에서 아파트명을 찾을 수 있도록 모두 아파트/파크/타운 등으로 끝나는 이름
+APT_NAMES = ["해운대아이파크", "정자동파크뷰", "역삼센트럴아파트", "효자동한신타운", "석사동현대아파트",
+             "수성범어타워", "영등동삼성아파트", "단계동우미린파크"]
+STRUCTURES = ["철근콘크리트구조", "철근콘크리트벽식구조", "철골철근콘크리트조"]
+OWNERS = ["홍길동", "김철수", "이영희", "박민수", "최지우", "정우성"]
+BANKS = ["주식회사 국민은행", "주식회사 신한은행", "주식회사 우리은행", "농협은행 주식회사"]
+
+
+# =========================================================
+# 내용 만들기
+# =========================================================
+def _receipt(rnd, year):
+    return f"{year}년{rnd.randint(1, 12)}월{rnd.randint(1, 28)}일\n제{rnd.randint(1000, 99999)}호"
+
+
+def random_registry(rnd, index=0):
+    """등기부 1건의 내용(spec) - 섹션별 행 목록과 정답 재료"""
+    region, road, new_region, new_road = REGIONS[rnd.randrange(len(REGIONS))]
+    apt = APT_NAMES[rnd.randrange(len(APT_NAMES))]
+    bunji = rnd.randint(100, 899)
+    dong = rnd.randint(101, 125)
+    floor = rnd.randint(2, 25)
+    ho = f"{floor}{rnd.randint(1, 4):02d}"
+    road_no = rnd.randint(1, 300)
+    year = rnd.randint(1995, 2015)
+
+    features = {
+        # 세 건 중 한 건은 흑백 (삭선이 검은색이라 색으로 구분 불가)
+        "color": index % 3 != 1,
+        "region_change": region != new_region and rnd.random() < 0.6,
+        "lots": rnd.choice([1, 1, 2, 3]),
+        "struck_lots": rnd.choice([0, 1, 1, 2]),
+        "apt_in_title": rnd.random() > 0.25,
+        "road_address": rnd.random() > 0.15,
+        "history": rnd.randint(2, 40),
+    }
+
+    # 1동 건물: 마지막 행이 현행, 앞의 행은 말소
+    def building(addr_region, addr_road):
+        lines = [f"{addr_region} {bunji}", f"{apt} 제{dong}동" if features["apt_in_title"] else f"제{dong}동"]
+        if addr_road:
+            lines += ["[도로명주소]", f"{addr_road} {road_no}"]
+        return "\n".join(lines)
+
+    structure = rnd.choice(STRUCTURES)
+    floors = rnd.randint(10, 35)
+    building_detail = f"{structure}\n(철근)콘크리트지붕\n{floors}층 아파트"
+    buildings = [["1", f"{year}년5월1일", building(region, None), building_detail, "도면편철장 제3책 제1면"]]
+    if features["road_address"]:
+        buildings.append(["2", "2012년7월3일", building(region, road), building_detail, "도로명주소\n2012년7월3일 등기"])
+    if features["region_change"]:
+        buildings.append([str(len(buildings) + 1), "2024년1월18일",
+                          building(new_region, new_road if features["road_address"] else None), building_detail,
+                          "행정구역명칭변경\n2024년1월18일 등기"])
+
+    # 토지: 말소된 필지(부번 있는 번지) → 현행 필지 (여러 필지면 한 행에 "1. ... 2. ...")
+    lands = []
+    for k in range(features["struck_lots"]):
+        lands.append(([str(len(lands) + 1), f"1. {region} {bunji - 10 - k}-{k + 1}", "대",
+                       f"{rnd.randint(1000, 9999)}.{rnd.randint(0, 9)}㎡", f"{year}년5월1일"], True))
+    parcels = []
+    for i in range(features["lots"]):
+        jimok = "대" if i == 0 or rnd.random() < 0.6 else "도로"
+        parcels.append((bunji + i, jimok, f"{rnd.randint(1000, 30000)}.{rnd.randint(0, 9)}㎡"))
+
+    def land_row(number, addr_region, cause):
+        return [number, "\n".join(f"{i + 1}. {addr_region} {b}" for i, (b, _, _) in enumerate(parcels)),
+                "\n".join(j for _, j, _ in parcels), "\n".join(a for _, _, a in parcels), cause]
+
+    first_number = str(len(lands) + 1)
+    if len(lands) == 0 and rnd.random() < 0.3:
+        first_number += f"\n(전 {first_number})"
+    lands.append((land_row(first_number, region, f"{year}년5월1일\n합병"), features["region_change"]))
+    if features["region_change"]:
+        lands.append((land_row(str(len(lands) + 1), new_region, "행정구역명칭변경\n2024년1월18일 등기"), False))
+
+    area = f"{rnd.randint(39, 165)}.{rnd.randint(10, 99)}"
+    exclusive = [["1", f"{year}년5월1일", f"제{floor}층 제{ho}호", f"{structure}\n{area}㎡", "도면편철장 제3책 제1면"]]
+
+    lot_numbers = ", ".join(str(i + 1) for i in range(features["lots"]))
+    total = rnd.randint(10000, 99999)
+    share = f"{rnd.randint(20, 90)}.{rnd.randint(100, 999)}"
+    land_rights = [["1", f"{lot_numbers} 소유권대지권", f"{total}분의\n{share}",
+                    f"{year}년4월1일 대지권\n{year}년5월1일 등기"]]
+
+    # 갑구: 소유자 주소에 아파트명 (표제부에 아파트명이 없을 때 찾는 곳)
+    owners = []
+    for i in range(features["history"]):
+        owner = rnd.choice(OWNERS)
+        text = f"소유자 {owner} {rnd.randint(50, 99)}0101-*******\n{region} {bunji}\n{apt} 제{dong}동 제{ho}호"
+        if i % 2:
+            text += f"\n거래가액 금{rnd.randint(1, 9)}00,000,000원"
+        owners.append(([str(i + 1), "소유권이전", _receipt(rnd, year + i // 4), "매매", text],
+                       i < features["history"] - 1 and i % 3 == 0))
+    mortgages = []
+    for i in range(rnd.randint(1, features["history"] * 2)):
+        text = (f"채권최고액 금{rnd.randint(1, 9)}00,000,000원\n채무자 {rnd.choice(OWNERS)}\n"
+                f"근저당권자 {rnd.choice(BANKS)}")
+        mortgages.append(([str(i + 1), "근저당권설정", _receipt(rnd, year + i // 6), "설정계약", text], i % 2 == 0))
+
+    # 흑백이면 삭선으로 말소 필지를 거를 수 없고, 번지가 현행 필지와 달라 번지 기준으로도 남음
+    unsupported = {}
+    if not features["color"] and features["struck_lots"]:
+        unsupported["토지"] = UNSUPPORTED_BW_STRUCK_LOT
+
+    unique_number = f"{rnd.randint(1101, 2899)}-{year}-{rnd.randint(0, 999999):06d}"
+    return {
+        "features": features,
+        "unsupported": unsupported,
+        "title": f"[집합건물] {region} {bunji} 제{dong}동 제{floor}층 제{ho}호",
+        "고유번호": unique_number,
+        "sections": {
+            "1동건물": [(row, i < len(buildings) - 1) for i, row in enumerate(buildings)],
+            "토지": lands,
+            "전유부분": [(row, False) for row in exclusive],
+            "대지권": [(row, False) for row in land_rights],
+            "갑구": owners,
+            "을구": mortgages,
+        },
+        "expected": {
+            "1동건물표시": f"{new_region} {bunji}",
+            "아파트명": apt,
+            "동명칭": f"제{dong}동",
+            "도로명주소": f"{new_road} {road_no}" if features["road_address"] else "",
+            "건물번호": f"제{dong}동 제{floor}층 제{ho}호",
+            "고유번호": unique_number,
+            "구조": structure,
+            "면적": f"{area}㎡",
+            "토지": [
+                {"번호": str(i + 1), "소재지": f"{new_region} {b}", "지목": j, "면적": a}
+                for i, (b, j, a) in enumerate(parcels)
+            ],
+            "대지권종류": "소유권",
+            "대지권비율": f"{total}분의 {share}",
+        },
+    }
+
+
+# =========================================================
+# PDF 그리기
+# =========================================================
+def _wrap(text, width, font_name):
+    """칸 폭에 맞게 줄바꿈 (띄어쓰기 단위, 원래 줄바꿈 유지)"""
+    lines = []
+    for paragraph in str(text or "").split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if line and string_width(candidate, font_name, FONT_SIZE) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+class _RegistryCanvas:
+    """위에서부터 표 행을 쌓고, 자리가 없으면 다음 페이지로"""
+
+    def __init__(self, path, spec, font_name):
+        self.c = canvas.Canvas(path, pagesize=A4)
+        self.spec = spec
+        self.font_name = font_name
+        self.strike_rgb = (1, 0, 0) if spec["features"]["color"] else (0, 0, 0)
+        self.page_no = 1
+        self.y = TOP
+        self._page_header()
+        self.c.setFont(font_name, 13)
+        self.c.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT - 75, "등기사항전부증명서(말소사항 포함) - 집합건물 -")
+        self.y -= 10
+
+    def _page_header(self):
+        c = self.c
+        c.setFont(self.font_name, 8)
+        c.drawString(LEFT, PAGE_HEIGHT - 35, self.spec["title"])
+        c.drawRightString(LEFT + TABLE_WIDTH, PAGE_HEIGHT - 48, f"고유번호 {self.spec['고유번호']}")
+        c.drawString(LEFT, BOTTOM - 25, "열람일시 : 2025년01월02일 10시11분12초")
+        c.drawRightString(LEFT + TABLE_WIDTH, BOTTOM - 25, str(self.page_no))
+
+    def _ensure(self, height):
+        if self.y - height < BOTTOM:
+            self.c.showPage()
+            self.page_no += 1
+            self.y = TOP
+            self._page_header()
+
+    def header_row(self, title):
+        height = LINE_HEIGHT + 8
+        self._ensure(height)
+        c = self.c
+        c.setStrokeColorRGB(0, 0, 0)
+        c.setLineWidth(0.5)
+        c.rect(LEFT, self.y - height, TABLE_WIDTH, height, stroke=1, fill=0)
+        c.setFont(self.font_name, 9)
+        c.drawCentredString(LEFT + TABLE_WIDTH / 2, self.y - 12, title)
+        self.y -= height
+
+    def row(self, bounds, cells, struck=False):
+        cell_lines = [_wrap(cell, bounds[i + 1] - bounds[i] - CELL_PADDING * 2, self.font_name)
+                      for i, cell in enumerate(cells)]
+        count = max(len(lines) for lines in cell_lines)
+        height = count * LINE_HEIGHT + 6
+        self._ensure(height)
+        c = self.c
+        c.setStrokeColorRGB(0, 0, 0)
+        c.setLineWidth(0.5)
+        c.setFont(self.font_name, FONT_SIZE)
+        for i, lines in enumerate(cell_lines):
+            x0, x1 = LEFT + bounds[i], LEFT + bounds[i + 1]
+            c.rect(x0, self.y - height, x1 - x0, height, stroke=1, fill=0)
+            for j, line in enumerate(lines):
+                c.drawString(x0 + CELL_PADDING, self.y - 10 - j * LINE_HEIGHT, line)
+        if struck:
+            # 말소: 칸마다 글자 줄을 따라 긋는 선 (인터넷등기소처럼 칸 테두리에 닿지 않음)
+            # 테두리까지 이어지면 pdfplumber가 표 선으로 읽어 행을 여러 칸으로 나눔
+            c.setStrokeColorRGB(*self.strike_rgb)
+            c.setLineWidth(0.8)
+            for i, lines in enumerate(cell_lines):
+                x0, x1 = LEFT + bounds[i] + STRIKE_INSET, LEFT + bounds[i + 1] - STRIKE_INSET
+                for j, line in enumerate(lines):
+                    if not line:
+                        continue
+                    end = min(LEFT + bounds[i] + CELL_PADDING + string_width(line, self.font_name, FONT_SIZE), x1)
+                    line_y = self.y - 7 - j * LINE_HEIGHT
+                    c.line(x0, line_y, max(end, x0), line_y)
+        self.y -= height
+
+    def section(self, key, rows):
+        bounds, title, column_titles = SECTIONS[key]
+        self.header_row(title)
+        self.row(bounds, column_titles)
+        for cells, struck in rows:
+            self.row(bounds, cells, struck)
+        self.y -= 12
+
+    def text(self, line, size=9):
+        self._ensure(16)
+        self.c.setFont(self.font_name, size)
+        self.c.drawString(LEFT, self.y - 10, line)
+        self.y -= 16
+
+    def save(self):
+        self.c.save()
+        return self.page_no
+
+
+def render_registry(spec, path, font_path=FONT_PATH):
+    """spec → PDF 파일, 페이지 수 반환"""
+    doc = _RegistryCanvas(path, spec, register_korean_font(font_path))
+    doc.text(f"고유번호 {spec['고유번호']}")
+    for key in ("1동건물", "토지", "전유부분", "대지권", "갑구", "을구"):
+        doc.section(key, spec["sections"][key])
+    doc.text("-- 이 하 여 백 --")
+    # 끝의 참고용 요약 (실제 등기부처럼 표 뒤에 붙는 글)
+    doc.text("주요 등기사항 요약 (참고용)", size=11)
+    doc.text(f"고유번호 {spec['고유번호']}   {spec['title']}")
+    doc.text("[ 참 고 사 항 ] 본 주요 등기사항 요약은 증명서상에 말소되지 않은 사항을 간략히 요약한 것입니다.", size=8)
+    return doc.save()
+
+
+def expected_estate_text(expected):
+    """정답 재료 → 부동산 표시 문구 (registry_parser.format_estate_text와 비교할 정답, 양식을 그대로 적음)"""
+    land = expected["토지"][-1]
+    return "\n".join([
+        "1동의 건물의 표시",
+        f"   {expected['1동건물표시']}",
+        f"   {expected['아파트명']} {expected['동명칭']}",
+        "",
+        "전유부분의 건물의 표시",
+        f"  1. 건물의 번호 : {expected['건물번호']}[고유번호:{expected['고유번호']}]",
+        f"      구조 및 면적 : {expected['구조']} {expected['면적']}",
+        "",
+        "전유부분의 대지권의 표시",
+        "      토지의 표시",
+        f"       1.{land['소재지']}",
+        f"           {land['지목']}  {land['면적']}",
+        f"          대지권의 종류: {expected['대지권종류']}",
+        f"          대지권의 비율: {expected['대지권비율']}",
+    ])
+
+
+# =========================================================
+# 자료 폴더
+# =========================================================
+def build_corpus(folder, count=20, seed=0, font_path=FONT_PATH):
+    """folder에 reg_000.pdf ... + expected.json 생성, 정답 dict 반환"""
+    os.makedirs(folder, exist_ok=True)
+    rnd = random.Random(seed)
+    files = {}
+    for index in range(count):
+        spec = random_registry(rnd, index)
+        name = f"reg_{index:03d}.pdf"
+        pages = render_registry(spec, os.path.join(folder, name), font_path)
+        files[name] = {
+            "pages": pages,
+            "features": spec["features"],
+            "unsupported": spec["unsupported"],
+            "result": spec["expected"],
+            "estate_text": expected_estate_text(spec["expected"]),
+        }
+    expected = {"version": CORPUS_VERSION, "seed": seed, "files": files}
+    with open(os.path.join(folder, EXPECTED_FILE), "w", encoding="utf-8") as f:
+        json.dump(expected, f, ensure_ascii=False, indent=1)
+    return expected
+
+
+def load_expected(folder):
+    """folder의 expected.json (없으면 None)"""
+    path = os.path.join(folder, EXPECTED_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 등기부 PDF + 정답 생성")
+    parser.add_argument("folder", help="만들 폴더")
+    parser.add_argument("-n", "--count", type=int, default=20, help="등기부 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 seed (같으면 같은 자료)")
+    args = parser.parse_args()
+    expected = build_corpus(args.folder, args.count, args.seed)
+    pages = sum(entry["pages"] for entry in expected["files"].values())
+    print(f"{args.folder}: 등기부 {len(expected['files'])}건, {pages}페이지")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,661 @@
+"""
+등기부 PDF 파싱 (Registry Parser)
+- 집합건물 등기사항전부증명서 PDF → 부동산표시 항목 (1동 건물/토지/전유부분/대지권)
+- 페이지마다 선/단어/표/텍스트를 한 번에 뽑아 페이지 기록에 담고, 이후 단계는 기록만 사용
+  (텍스트는 같은 단어 목록에서 만들어서 페이지 배치를 다시 분석하지 않음)
+- 페이지는 앞에서부터 필요한 만큼만 읽음: 표제부가 끝나는 "갑 구" 머리글이 나오면 표 추출 중단,
+  아파트명을 갑구에서 찾아야 할 때만 "을 구"까지 텍스트만 읽음
+- 표는 페이지 전체가 아니라 표 테두리 범위(갑구/을구 머리글이 있으면 그 위까지)만 잘라서
+  인터넷등기소 양식에 맞춘 TABLE_SETTINGS로 찾음
+- 컬러 PDF는 빨간 삭선이 그어진 토지 번지(말소)를 제외
+- iter_parse_registry: 페이지마다 진행 이벤트(ParseEvent)를 내보내고 CancelToken으로 중간에 멈출 수 있음
+- 결과는 RegistryResult (registry_result.py), 표 행은 섹션으로 나누는 즉시 페이지 기록에서 놓아줌
+- app.py(Streamlit)와 분리되어 있어 일괄 처리/작업 프로세스에서도 사용 가능
+"""
+
+import bisect
+import threading
+from collections import namedtuple
+
+try:
+    import pdfplumber
+    from pdfplumber.utils import cluster_objects
+    PDFPLUMBER_OK = True
+except Exception:
+    pdfplumber = None
+    cluster_objects = None
+    PDFPLUMBER_OK = False
+
+from registry_patterns import (
+    ADDRESS_UNIT_RE, APT_NAME_RE, HYPHENS_RE, LEADING_NUMBER_RE, ROW_NUMBER_RE, SIMPLE_지목,
+    WATERMARK_CHARS, WATERMARK_CHAR_RE, WATERMARK_RE, 고유번호_RE, 갑구_SECTION_RE, 구조_RE, 권리부_HEADER_RE,
+    SPACES_RE, 대지권종류_RE, 동_NAME_RE, 면적_RE, 번지_END_RE, 번지_TOKEN_RE, 을구_HEADER_RE, 지번_END_RE,
+    필지_NUMBER_RE, 필지_SPLIT_RE, 호_NUMBER_RE, scan_cell,
+)
+from registry_result import BuildingInfo, LandParcel, LandRightInfo, RegistryResult, UnitInfo
+
+# 파싱 결과가 달라지는 변경을 하면 올림 (registry_cache 키에 포함)
+PARSER_VERSION = "4"
+
+# 행정구역 변환
+REGION_RENAMES = {"전라북도": "전북특별자치도", "강원도": "강원특별자치도"}
+
+# extract_text와 같은 줄 묶음 기준 (pdfplumber 기본값)
+TEXT_Y_TOLERANCE = 3
+
+# 표 찾기 설정 (인터넷등기소 등기부: 칸마다 테두리가 그어진 표, 선 좌표가 정확히 맞음)
+# - 선(lines)만으로 칸을 나눔 (글자 정렬로 추측하지 않음)
+# - 잘라낸 영역 끝에 걸친 짧은 세로선 조각(edge_min_length 미만)은 표로 보지 않음
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "intersection_tolerance": 3,
+    "edge_min_length": 3,
+}
+
+# 표 영역을 자를 때 테두리 바깥으로 두는 여유 (pt) - edge_min_length보다 작아야 함
+TABLE_CROP_MARGIN = 1
+
+# 삭선이 단어 위/아래 이 거리(pt) 안에 있으면 그어진 것으로 봄
+STRIKE_Y_DISTANCE = 15
+
+
+
+def convert_region(text):
+    for old, new in REGION_RENAMES.items():
+        text = text.replace(old, new)
+    return text
+
+
+# =========================================================
+# 페이지 기록 (1회 추출)
+# =========================================================
+def _red_line_ys(lines):
+    """빨간 삭선 y좌표 목록 (오름차순, bisect 검색용)"""
+    red_ys = []
+    for line in lines:
+        color = line.get('stroking_color')
+        if color and isinstance(color, (list, tuple)) and len(color) >= 3:
+            r, g, b = color[0], color[1], color[2]
+            if r > 0.9 and g < 0.1 and b < 0.1:
+                width = line['x1'] - line['x0']
+                if width > 30:
+                    red_ys.append(line['top'])
+    red_ys.sort()
+    return red_ys
+
+
+def normalize_번지(text):
+    """하이픈 모양 통일 ("123－4" → "123-4")"""
+    return HYPHENS_RE.sub("-", text)
+
+
+def _index_번지(words):
+    """번지 토큰 → 그 토큰이 들어 있는 단어들의 top 목록"""
+    index = {}
+    for word in words:
+        for token in 번지_TOKEN_RE.findall(normalize_번지(word['text'])):
+            index.setdefault(token, []).append(word['top'])
+    return index
+
+
+def _text_lines(words):
+    """단어 목록 → [(줄 top, 줄 텍스트), ...] (줄: top 기준 묶음, 단어: 공백 구분)"""
+    if not words:
+        return []
+    return [
+        (min(w["top"] for w in line), " ".join(w["text"] for w in sorted(line, key=lambda w: w["x0"])))
+        for line in cluster_objects(words, "top", TEXT_Y_TOLERANCE)
+    ]
+
+
+def _words_to_text(words):
+    """단어 목록 → page.extract_text()와 같은 텍스트"""
+    return "\n".join(text for _, text in _text_lines(words))
+
+
+def _table_region(page, header_top):
+    """표를 찾을 영역 bbox - 테두리 선이 있는 범위 (없으면 None)
+
+    header_top: 갑구/을구 머리글 줄의 top - 있으면 머리글 칸의 윗선까지만 (그 아래는 표제부가 아님)
+    """
+    edges = page.edges
+    if header_top is not None:
+        # 머리글 칸의 세로선은 윗선에서 TABLE_CROP_MARGIN만큼만 남으므로 표로 잡히지 않음
+        edges = [e for e in edges if e["top"] < header_top]
+    horizontal = [e["top"] for e in edges if e["orientation"] == "h"]
+    if not horizontal:
+        return None
+    x0 = min(e["x0"] for e in edges) - TABLE_CROP_MARGIN
+    x1 = max(e["x1"] for e in edges) + TABLE_CROP_MARGIN
+    top = min(e["top"] for e in edges) - TABLE_CROP_MARGIN
+    if header_top is not None:
+        bottom = max(horizontal) + TABLE_CROP_MARGIN
+    else:
+        bottom = max(e["bottom"] for e in edges) + TABLE_CROP_MARGIN
+    page_x0, page_top, page_x1, page_bottom = page.bbox
+    return (max(x0, page_x0), max(top, page_top), min(x1, page_x1), min(bottom, page_bottom))
+
+
+def _extract_tables(page, header_top):
+    """표제부 표 영역만 잘라서 표 추출"""
+    region = _table_region(page, header_top)
+    if region is None:
+        return []
+    return page.crop(region).extract_tables(TABLE_SETTINGS)
+
+
+def extract_page(page, index, tables=True):
+    """페이지 1장 → 기록 {"index", "red_ys", "번지_index", "tables", "text", "header_top"}
+
+    red_ys: 빨간 삭선 y (정렬), 번지_index: 번지 토큰 → 단어 top 목록 (삭선 검사용)
+    header_top: 이 페이지의 갑구/을구 머리글 top (없으면 None) - 표는 그 위까지만 추출
+    tables=False: 단어/텍스트만 (표/삭선/번지 색인은 비움)
+    """
+    words = page.extract_words()
+    lines = _text_lines(words)
+    header_top = next((top for top, text in lines if 권리부_HEADER_RE.search(text)), None)
+    red_ys = _red_line_ys(page.lines) if tables else []
+    return {
+        "index": index,
+        "red_ys": red_ys,
+        # 삭선이 없는 페이지는 검사할 일이 없으므로 색인도 만들지 않음
+        "번지_index": _index_번지(words) if red_ys else {},
+        "tables": _extract_tables(page, header_top) if tables else [],
+        "text": "\n".join(text for _, text in lines),
+        "header_top": header_top,
+    }
+
+
+def iter_page_records(pdf, start=0, tables=True):
+    """start 페이지부터 기록을 하나씩 (꺼낼 때 읽고, 읽은 페이지의 배치 캐시는 바로 비움)"""
+    for index in range(start, len(pdf.pages)):
+        page = pdf.pages[index]
+        record = extract_page(page, index, tables)
+        page.close()
+        yield record
+
+
+def extract_pages(pdf):
+    """모든 페이지 기록 목록"""
+    return list(iter_page_records(pdf))
+
+
+# =========================================================
+# 섹션 분류
+# =========================================================
+def _has_strike_near(y, red_ys):
+    """정렬된 red_ys 중 |y - ry| < STRIKE_Y_DISTANCE 인 선이 있는지 (이분 탐색)"""
+    i = bisect.bisect_right(red_ys, y - STRIKE_Y_DISTANCE)
+    return i < len(red_ys) and red_ys[i] < y + STRIKE_Y_DISTANCE
+
+
+def is_번지_strikethrough(번지, 번지_index, red_ys):
+    """번지의 모든 위치에서 삭선 여부 확인 (번지_index/red_ys는 페이지 기록의 색인)"""
+    if not red_ys or not 번지:
+        return False
+
+    # 번지가 나온 단어 위치 (토큰이 정확히 같은 것만)
+    found_positions = 번지_index.get(normalize_번지(번지))
+    if not found_positions:
+        return False
+
+    # 삭선이 단어 위나 아래에 있을 수 있으므로 양방향 체크
+    # 삭선 없는 위치가 하나라도 있으면 False
+    return all(_has_strike_near(y, red_ys) for y in found_positions)
+
+
+def _new_sections():
+    return {"1동건물": [], "토지": [], "전유부분": [], "대지권": []}
+
+
+def _classify_page(record, sections, current_section):
+    """페이지 1장의 표 행을 섹션별로 분류 (토지는 삭선 말소 제외, (번지, 행) 형태)
+
+    current_section: 앞 페이지에서 이어지는 섹션
+    행을 나눈 페이지의 표/번지 색인은 바로 비움 (이후에는 텍스트/삭선 y만 사용)
+    반환: (다음 페이지로 이어지는 섹션, "갑 구" 머리글을 찾았는지)
+    """
+    # 표는 머리글 위까지만 잘라 왔으므로 머리글 여부는 페이지 텍스트로 판단
+    reached_갑구 = record["header_top"] is not None
+    for table in record["tables"]:
+        if not table:
+            continue
+
+        for row in table:
+            row_text = str(row[0]) if row[0] else ""
+
+            # 섹션 헤더 감지
+            if "1동의 건물의 표시" in row_text:
+                current_section = "1동건물"
+                continue
+            elif "대지권의 목적인 토지의 표시" in row_text:
+                current_section = "토지"
+                continue
+            elif "전유부분의 건물의 표시" in row_text:
+                current_section = "전유부분"
+                continue
+            elif "대지권의 표시" in row_text and "목적인 토지" not in row_text:
+                current_section = "대지권"
+                continue
+            elif "갑 구" in row_text or "을 구" in row_text:
+                # 표제부 끝 - 이 페이지의 나머지 행까지만 보고 멈춤
+                current_section = None
+                reached_갑구 = True
+                continue
+
+            # 컬럼 헤더 스킵
+            if row_text.strip() in ["표시번호", "순위번호"]:
+                continue
+
+            # 현행 데이터: "1", "2" 또는 "1\n(전 1)" 형태
+            if current_section and row[0]:
+                row0_clean = str(row[0]).strip()
+                if ROW_NUMBER_RE.match(row0_clean):
+
+                    # 토지 섹션: 삭선 감지 적용
+                    if current_section == "토지":
+                        소재지 = (row[1] or "") if len(row) > 1 else ""
+
+                        # 주소 패턴 체크
+                        if not ADDRESS_UNIT_RE.search(소재지):
+                            continue
+
+                        # 번지 추출
+                        소재지_clean = 소재지.replace('\n', ' ').strip()
+                        번지_match = 번지_END_RE.search(소재지_clean)
+                        번지 = 번지_match.group(1) if 번지_match else None
+
+                        # 컬러 PDF면 삭선 체크 (같은 페이지에 빨간 선이 있을 때만 해당)
+                        if 번지 and record["red_ys"]:
+                            if is_번지_strikethrough(번지, record["번지_index"], record["red_ys"]):
+                                continue  # 말소 스킵
+
+                        sections["토지"].append((번지, row))
+                    else:
+                        sections[current_section].append(row)
+    record["tables"] = []
+    record["번지_index"] = {}
+    return current_section, reached_갑구
+
+
+# =========================================================
+# 섹션별 항목
+# =========================================================
+def _parse_1동건물(row):
+    """1동건물 마지막 유효 행 → BuildingInfo (표시/아파트명/동명칭/도로명주소)"""
+    building = BuildingInfo()
+    col2 = (row[2] or "") if len(row) > 2 else ""
+
+    # 워터마크 제거
+    col2 = WATERMARK_RE.sub('', col2)
+    col2 = WATERMARK_CHAR_RE.sub('', col2)
+
+    lines = col2.split('\n')
+
+    # [도로명주소] 위치 찾기
+    road_idx = -1
+    for i, line in enumerate(lines):
+        if '[도로명주소]' in line:
+            road_idx = i
+            break
+
+    # 도로명주소 추출
+    if road_idx > 0:
+        road_lines = []
+        for i in range(road_idx + 1, len(lines)):
+            line = lines[i].strip()
+            if line and line not in WATERMARK_CHARS:
+                road_lines.append(line)
+        building.도로명주소 = convert_region(' '.join(road_lines))
+
+    # [도로명주소] 앞부분만 사용
+    content_lines = lines[:road_idx] if road_idx > 0 else lines
+    content_lines = [l.strip() for l in content_lines if l.strip() and l.strip() not in WATERMARK_CHARS]
+
+    if not content_lines:
+        return building
+
+    # 번지(숫자)로 끝나는 마지막 줄 = 지번 끝
+    지번_end_idx = -1
+    for i, line in enumerate(content_lines):
+        if 지번_END_RE.search(line.strip()):
+            지번_end_idx = i
+
+    if 지번_end_idx >= 0:
+        building.표시 = convert_region(' '.join(content_lines[:지번_end_idx+1]))
+
+        건물명_lines = content_lines[지번_end_idx+1:]
+        if 건물명_lines:
+            건물명_text = ' '.join(건물명_lines)
+            동_match = 동_NAME_RE.search(건물명_text)
+            if 동_match:
+                building.동명칭 = 동_match.group(1)
+                building.아파트명 = 건물명_text[:동_match.start()].strip()
+            else:
+                building.아파트명 = 건물명_text
+    else:
+        building.표시 = convert_region(' '.join(content_lines))
+    return building
+
+
+def _parse_토지(rows):
+    """토지 (번지, 행) 목록 → LandParcel 목록 (같은 번지면 마지막만, 번지 숫자순)"""
+    parcels = []
+    토지_by_번지 = {}
+    for 번지, row in rows:
+        토지_by_번지[번지] = row
+
+    # 번지 숫자순 정렬
+    def 번지_order(item):
+        match = LEADING_NUMBER_RE.search(item[0]) if item[0] else None
+        return int(match.group(1)) if match else 0
+    토지_items = sorted(토지_by_번지.items(), key=번지_order)
+
+    for idx, (번지, row) in enumerate(토지_items, 1):
+        소재지_raw = (row[1] or "").replace('\n', ' ').strip()
+
+        # 지목과 면적: row[2:]에서 패턴으로 찾기 (pdfplumber 파싱 차이 대응)
+        # 칸마다 scan_cell 한 번으로 지목/면적 토큰을 같이 뽑아 둠
+        지목_raw = ""
+        면적_raw = ""
+        지목_tokens = []
+        면적_tokens = []
+        for col in row[2:]:
+            col_str = (col or "").strip()
+            if col_str:
+                tokens = scan_cell(col_str)
+                # 지목: 대, 전, 답 등으로만 구성
+                if tokens.지목_only:
+                    지목_raw = col_str
+                    지목_tokens = tokens.지목
+                # 면적: ㎡ 포함
+                elif '㎡' in col_str:
+                    면적_raw = col_str
+                    면적_tokens = tokens.면적
+
+        # 여러 필지가 한 행에 있는 경우 분리 (1. xxx 2. xxx 3. xxx 형태)
+        필지_matches = 필지_SPLIT_RE.split(소재지_raw)
+        필지_matches = [p.strip() for p in 필지_matches if p.strip()]
+
+        if len(필지_matches) > 1:
+            # 지목과 면적도 분리
+            지목_list = 지목_tokens
+            면적_list = 면적_tokens
+
+            for i, 필지 in enumerate(필지_matches):
+                소재지 = 필지_NUMBER_RE.sub('', 필지).strip()
+                지목 = 지목_list[i] if i < len(지목_list) else (지목_list[0] if 지목_list else "")
+                면적 = 면적_list[i] if i < len(면적_list) else ""
+
+                parcels.append(LandParcel(str(len(parcels) + 1), convert_region(소재지), 지목, 면적))
+        else:
+            # 단일 필지
+            소재지 = 필지_NUMBER_RE.sub('', 소재지_raw)
+            지목 = next((t for t in 지목_tokens if t in SIMPLE_지목), 지목_raw)
+            면적 = 면적_tokens[0] if 면적_tokens else 면적_raw
+
+            parcels.append(LandParcel(str(len(parcels) + 1), convert_region(소재지), 지목, 면적))
+    return parcels
+
+
+def _parse_전유부분(row, 동명칭=""):
+    """전유부분 마지막 유효 행 → UnitInfo (건물번호/구조/면적), 건물번호 앞에 1동의 동명칭을 붙임"""
+    건물번호 = (row[2] or "").replace('\n', ' ').strip() if len(row) > 2 else ""
+    건물내역 = (row[3] or "").replace('\n', ' ').strip() if len(row) > 3 else ""
+
+    if 동명칭 and 동명칭 not in 건물번호:
+        건물번호 = f"{동명칭} {건물번호}"
+
+    구조_match = 구조_RE.search(건물내역)
+    면적_match = 면적_RE.search(건물내역)
+    return UnitInfo(
+        건물번호,
+        구조_match.group(1) if 구조_match else "",
+        면적_match.group(1) if 면적_match else "",
+    )
+
+
+def _parse_대지권(rows):
+    """대지권: 소유권/지상권/전세권이 있는 마지막 유효 행 → LandRightInfo (종류/비율)"""
+    land_right = LandRightInfo()
+    valid_대지권_row = None
+    for row in rows:
+        종류_raw = (row[1] or "").replace('\n', ' ').strip() if len(row) > 1 else ""
+        if 대지권종류_RE.search(종류_raw):
+            valid_대지권_row = row
+
+    if not valid_대지권_row:
+        return land_right
+    row = valid_대지권_row
+
+    종류_raw = (row[1] or "").replace('\n', ' ').strip() if len(row) > 1 else ""
+    # "1, 2, 3 소유권대지권" → "소유권" 으로 단순화
+    종류_match = 대지권종류_RE.search(종류_raw)
+    land_right.종류 = 종류_match.group(1) if 종류_match else 종류_raw
+
+    # 대지권비율: "분의" 패턴이 있는 컬럼 찾기
+    for col in row[2:]:
+        col_str = (col or "").replace('\n', ' ').strip()
+        if "분의" in col_str:
+            land_right.비율 = col_str
+            break
+    return land_right
+
+
+def _find_apt_name_in_갑구(texts):
+    """갑구 본문에서 아파트명 찾기 (표제부에 건물명이 없을 때)
+
+    texts: 앞에서부터 "을 구" 머리글이 나온 페이지까지의 페이지 텍스트
+    """
+    full_text = "\n".join(texts)
+    갑구_match = 갑구_SECTION_RE.search(full_text)
+    if 갑구_match:
+        아파트_match = APT_NAME_RE.search(갑구_match.group(1))
+        if 아파트_match:
+            return 아파트_match.group(1)
+    return ""
+
+
+# =========================================================
+# 파싱
+# =========================================================
+# 진행 이벤트 단계
+STAGE_PAGE = "page"            # 표제부 페이지 1장 분석
+STAGE_TITLE = "표제부"          # 표제부 끝 - 부분 결과 (아파트명은 갑구 검색 전일 수 있음)
+STAGE_APT_PAGE = "갑구"         # 아파트명을 찾으려고 갑구 페이지 1장 읽음 (텍스트만)
+STAGE_DONE = "done"
+STAGE_CANCELLED = "cancelled"
+
+# stage, page: 지금까지 읽은 페이지 수, page_count: 전체 페이지 수,
+# result/debug: STAGE_TITLE 이후에만 (그 전에는 result None)
+ParseEvent = namedtuple("ParseEvent", ["stage", "page", "page_count", "result", "debug"])
+
+CANCELLED_ERROR = "분석 중단 - 표제부를 다 읽기 전에 멈춤"
+CANCELLED_APT_WARNING = "분석 중단 - 갑구에서 아파트명을 찾지 않음"
+
+
+class CancelToken:
+    """다른 스레드나 화면 콜백에서 cancel() → 파서가 다음 페이지를 읽기 전에 멈춤"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+def iter_parse_registry(uploaded_file, cancel=None):
+    """parse_registry_pdf를 페이지 단위로 진행하며 ParseEvent를 하나씩
+
+    표제부 페이지마다 STAGE_PAGE, 표제부가 끝나면 STAGE_TITLE(부분 결과), 아파트명을 찾으려고
+    갑구를 읽으면 페이지마다 STAGE_APT_PAGE, 마지막은 STAGE_DONE 또는 STAGE_CANCELLED.
+    cancel(CancelToken)이 취소되면 다음 페이지를 읽기 전에 멈춤:
+    표제부를 다 읽기 전이면 debug["errors"], 갑구 검색 중이면 debug["warnings"]에 기록
+    """
+    result = RegistryResult()
+
+    debug = {
+        "errors": [],
+        "warnings": [],
+        "info": []
+    }
+
+    if not PDFPLUMBER_OK:
+        debug["errors"].append("pdfplumber 라이브러리가 설치되지 않았습니다.")
+        yield ParseEvent(STAGE_DONE, 0, 0, result, debug)
+        return
+
+    stage = STAGE_DONE
+    page_count = 0
+    pages_read = 0
+    try:
+        with pdfplumber.open(uploaded_file) as pdf:
+            page_count = len(pdf.pages)
+            debug["info"].append(f"PDF 페이지 수: {page_count}")
+
+            # 표제부 ("갑 구" 머리글이 나오는 페이지까지)만 표 추출
+            sections = _new_sections()
+            current_section = None
+            records = []
+            reached_갑구 = False
+            for record in iter_page_records(pdf):
+                records.append(record)
+                current_section, reached_갑구 = _classify_page(record, sections, current_section)
+                pages_read = len(records)
+                yield ParseEvent(STAGE_PAGE, pages_read, page_count, None, debug)
+                if reached_갑구:
+                    break
+                if cancel is not None and cancel.cancelled and pages_read < page_count:
+                    debug["errors"].append(CANCELLED_ERROR)
+                    yield ParseEvent(STAGE_CANCELLED, pages_read, page_count, result, debug)
+                    return
+            if reached_갑구 and len(records) < page_count:
+                debug["info"].append(f"표제부 {len(records)}페이지까지 분석 (갑구 이후 표 추출 생략)")
+
+            # 고유번호 추출
+            first_page_text = records[0]["text"]
+            고유번호_match = 고유번호_RE.search(first_page_text)
+            if 고유번호_match:
+                result.고유번호 = 고유번호_match.group(1)
+
+            # 컬러 PDF 여부
+            has_color = any(len(record["red_ys"]) > 0 for record in records)
+            if has_color:
+                debug["info"].append("컬러 PDF 감지 - 삭선 기반 필터링")
+            else:
+                debug["info"].append("흑백 PDF - 번지 기반 필터링")
+
+            if sections["1동건물"]:
+                result.건물 = _parse_1동건물(sections["1동건물"][-1])
+            result.토지 = _parse_토지(sections["토지"])
+            if sections["전유부분"]:
+                result.전유부분 = _parse_전유부분(sections["전유부분"][-1], result.건물.동명칭)
+            if sections["대지권"]:
+                result.대지권 = _parse_대지권(sections["대지권"])
+            yield ParseEvent(STAGE_TITLE, pages_read, page_count, result, debug)
+
+            # 아파트명 없으면 갑구에서 찾기 (이어지는 페이지는 텍스트만, "을 구" 머리글까지)
+            if not result.건물.아파트명:
+                texts = [record["text"] for record in records]
+                if not any(을구_HEADER_RE.search(text) for text in texts):
+                    for record in iter_page_records(pdf, start=len(records), tables=False):
+                        if cancel is not None and cancel.cancelled:
+                            stage = STAGE_CANCELLED
+                            break
+                        texts.append(record["text"])
+                        pages_read = record["index"] + 1
+                        yield ParseEvent(STAGE_APT_PAGE, pages_read, page_count, result, debug)
+                        if 을구_HEADER_RE.search(record["text"]):
+                            break
+                if stage == STAGE_CANCELLED:
+                    debug["warnings"].append(CANCELLED_APT_WARNING)
+                else:
+                    result.건물.아파트명 = _find_apt_name_in_갑구(texts)
+
+    except Exception as e:
+        debug["errors"].append(f"PDF 파싱 오류: {str(e)}")
+
+    yield ParseEvent(stage, pages_read, page_count, result, debug)
+
+
+def parse_registry_pdf(uploaded_file):
+    """집합건물 등기부 PDF에서 부동산표시 추출 - 삭선 감지 포함
+
+    uploaded_file: 파일 경로 또는 파일 객체 (Streamlit 업로드 파일 등)
+    반환: (RegistryResult, 디버그 {"errors", "warnings", "info"}) - 예전 dict 모양은 result.to_dict()
+    진행 상황/중단이 필요하면 iter_parse_registry
+    """
+    for event in iter_parse_registry(uploaded_file):
+        pass
+    return event.result, event.debug
+
+
+def format_estate_text(data):
+    """부동산 표시 포맷팅 (data: RegistryResult 또는 예전 결과 dict)"""
+    if isinstance(data, dict):
+        data = RegistryResult.from_dict(data)
+    building = data.건물
+    lines = []
+
+    # 1동의 건물의 표시
+    lines.append("1동의 건물의 표시")
+    lines.append(f"   {building.표시}")
+
+    # 아파트명/동명칭
+    건물명칭_parts = []
+    if building.아파트명:
+        건물명칭_parts.append(building.아파트명)
+    if building.동명칭:
+        건물명칭_parts.append(building.동명칭)
+    if 건물명칭_parts:
+        lines.append(f"   {' '.join(건물명칭_parts)}")
+
+    lines.append("")  # 빈 줄
+
+    # 전유부분의 건물의 표시
+    lines.append("전유부분의 건물의 표시")
+    lines.append(f"  1. 건물의 번호 : {data.전유부분.건물번호}[고유번호:{data.고유번호}]")
+    lines.append(f"      구조 및 면적 : {data.전유부분.구조} {data.전유부분.면적}")
+
+    lines.append("")  # 빈 줄
+
+    # 전유부분의 대지권의 표시
+    lines.append("전유부분의 대지권의 표시")
+    lines.append("      토지의 표시")
+
+    # 토지는 최신 것만 (행정구역 변경된 경우 마지막 것만)
+    if data.토지:
+        # 마지막 토지만 사용 (최신)
+        t = data.토지[-1]
+        소재지 = convert_region(t.소재지)
+        lines.append(f"       1.{소재지}")
+        lines.append(f"           {t.지목}  {t.면적}")
+
+    lines.append(f"          대지권의 종류: {data.대지권.종류}")
+    lines.append(f"          대지권의 비율: {data.대지권.비율}")
+
+    return "\n".join(lines)
+
+
+def format_collateral_address(data):
+    """위택스용 물건지 주소: 도로명주소 + 동 + 호 (도로명주소가 없으면 "")
+
+    data: RegistryResult 또는 예전 결과 dict
+    동은 1동 건물 동명칭(제1동 → 1동), 호는 전유부분 건물번호(제5층 제507호 → 507호)에서 가져옴
+    """
+    if isinstance(data, dict):
+        data = RegistryResult.from_dict(data)
+    if not data.건물.도로명주소:
+        return ""
+    동 = data.건물.동명칭.replace("제", "")
+    호_match = 호_NUMBER_RE.search(data.전유부분.건물번호)
+    호 = f"{호_match.group(1)}호" if 호_match else ""
+    # 연속 공백 제거
+    return SPACES_RE.sub(' ', f"{data.건물.도로명주소} {동} {호}".strip())
@@ -0,0 +1,94 @@
+"""
+등기부/주소 정규식 모음 (Registry Patterns)
+- 등기부 파싱(registry_parser)과 주소/번호 처리(app.py)에서 쓰는 정규식을 한 번만 컴파일해서 이름으로 제공
+- 토지 칸(지목/면적)은 scan_cell 한 번으로 지목/면적 토큰을 함께 뽑음 (칸마다 정규식 여러 번 → 1번)
+- 비교: python pattern_benchmark.py
+"""
+
+import re
+from collections import namedtuple
+
+
+# =========================================================
+# 등기부 - 페이지/섹션
+# =========================================================
+고유번호_RE = re.compile(r'고유번호\s*(\d{4}-\d{4}-\d{6})')
+갑구_SECTION_RE = re.compile(r'【\s*갑\s*구\s*】(.+?)【\s*을\s*구\s*】', re.DOTALL)
+을구_HEADER_RE = re.compile(r'【\s*을\s*구\s*】')
+# 표제부가 끝나는 머리글 (갑구 또는 을구)
+권리부_HEADER_RE = re.compile(r'【\s*[갑을]\s*구\s*】')
+
+# 표시번호 칸: "1", "2" 또는 "1\n(전 1)" 형태 (현행 데이터 행)
+ROW_NUMBER_RE = re.compile(r'\d+(?:$|\n\(전)')
+
+# =========================================================
+# 등기부 - 1동 건물
+# =========================================================
+# 열람용 워터마크 (붙어 있거나 글자 사이에 끼어 든 경우)
+WATERMARK_RE = re.compile(r'열\s*람\s*용')
+WATERMARK_CHAR_RE = re.compile(r'(?<=[가-힣])(열|람|용)(?=[가-힣])')
+WATERMARK_CHARS = frozenset(['열', '람', '용'])
+
+지번_END_RE = re.compile(r'\d+(-\d+)?$')
+동_NAME_RE = re.compile(r'(제[가-힣\d]+동)$')
+
+# =========================================================
+# 등기부 - 토지
+# =========================================================
+ADDRESS_UNIT_RE = re.compile(r'(시|군|구|동|리|읍|면)\s')
+번지_END_RE = re.compile(r'(\d+(-\d+)?)$')
+번지_TOKEN_RE = re.compile(r'\d+(?:-\d+)?')
+HYPHENS_RE = re.compile(r'[‐‑‒–—―－−]')
+LEADING_NUMBER_RE = re.compile(r'^(\d+)')
+
+# 여러 필지가 한 행에 있는 경우 "1. xxx 2. xxx" 나누기 / 앞 번호 떼기
+필지_SPLIT_RE = re.compile(r'(?=\d+\.\s*[가-힣])')
+필지_NUMBER_RE = re.compile(r'^\d+\.\s*')
+
+# 지목 칸으로 인정하는 값 (칸 전체가 이 값들을 줄바꿈으로 이은 것)
+CELL_지목 = ('대', '전', '답', '임야', '잡종지', '도로', '하천')
+# 단일 필지에서 지목으로 쓰는 값
+SIMPLE_지목 = frozenset(['대', '전', '답', '임야', '잡종지'])
+면적_RE = re.compile(r'([\d.]+㎡)')
+
+# 토지 칸 토큰: 면적("123.4㎡") 또는 지목(CELL_지목) - 두 종류를 한 번에 스캔
+CELL_TOKEN_RE = re.compile(r'(?P<면적>[\d.]+㎡)|(?P<지목>' + '|'.join(CELL_지목) + ')')
+
+# scan_cell 결과: 지목 토큰 목록, 면적 토큰 목록, 칸 전체가 지목으로만 되어 있는지
+CellTokens = namedtuple("CellTokens", ["지목", "면적", "지목_only"])
+
+
+def scan_cell(text):
+    """토지 칸 1개를 한 번 훑어서 지목/면적 토큰 분리
+
+    지목_only: 칸 전체가 지목 값을 줄바꿈으로 이은 것 ("대", "대\\n대") → 지목 칸
+    """
+    지목 = []
+    면적 = []
+    for match in CELL_TOKEN_RE.finditer(text):
+        if match.lastgroup == "면적":
+            면적.append(match.group())
+        else:
+            지목.append(match.group())
+    지목_only = bool(지목) and not 면적 and "\n".join(지목) == text
+    return CellTokens(지목, 면적, 지목_only)
+
+
+# =========================================================
+# 등기부 - 전유부분/대지권/갑구
+# =========================================================
+구조_RE = re.compile(r'([가-힣]+조|[가-힣]+구조)')
+대지권종류_RE = re.compile(r'(소유권|지상권|전세권)')
+APT_NAME_RE = re.compile(r'([가-힣A-Za-z0-9]+(?:아파트|빌라|오피스텔|주상복합|타운|파크|힐스|뷰|애비뉴|타워|팰리스|하이츠))')
+
+# =========================================================
+# 주소/번호
+# =========================================================
+NON_DIGIT_RE = re.compile(r'[^0-9]')
+SPACES_RE = re.compile(r'\s+')
+# 전유부분 건물번호의 호수: "제5층 제507호" → "507"
+호_NUMBER_RE = re.compile(r'제(\d+)호')
+# "테헤란로 123-4 101동" → ("테헤란로 123-4", "101동")
+ROAD_ADDRESS_RE = re.compile(r'(.+?(?:로|길)\s*\d+(?:-\d+)?)\s*(.*)$')
+# 부동산표시에서 주소 줄로 보는 표시
+REGION_MARKER_RE = re.compile(r'특별시|광역시|시 |군 |구 ')
@@ -0,0 +1,105 @@
+"""
+등기부 파싱 결과 (Registry Result)
+- parse_registry_pdf 결과를 __slots__ 데이터클래스로: 1동 건물 / 토지 필지 / 전유부분 / 대지권
+- to_dict/from_dict: 예전 dict 모양 ("1동건물표시", "토지": [{...}], ...) - JSONL 출력, 정답 파일 비교용
+- dumps_result/loads_result: 키 이름 없이 값만 배열로 담은 짧은 JSON - 등기부 캐시 저장용
+"""
+
+import json
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class BuildingInfo:
+    """1동의 건물의 표시"""
+    표시: str = ""
+    아파트명: str = ""
+    동명칭: str = ""
+    도로명주소: str = ""
+
+
+@dataclass(slots=True)
+class LandParcel:
+    """대지권의 목적인 토지 1필지"""
+    번호: str = ""
+    소재지: str = ""
+    지목: str = ""
+    면적: str = ""
+
+
+@dataclass(slots=True)
+class UnitInfo:
+    """전유부분의 건물의 표시"""
+    건물번호: str = ""
+    구조: str = ""
+    면적: str = ""
+
+
+@dataclass(slots=True)
+class LandRightInfo:
+    """대지권의 표시"""
+    종류: str = ""
+    비율: str = ""
+
+
+def _values(obj):
+    return [getattr(obj, name) for name in obj.__slots__]
+
+
+@dataclass(slots=True)
+class RegistryResult:
+    고유번호: str = ""
+    건물: BuildingInfo = field(default_factory=BuildingInfo)
+    토지: list = field(default_factory=list)
+    전유부분: UnitInfo = field(default_factory=UnitInfo)
+    대지권: LandRightInfo = field(default_factory=LandRightInfo)
+
+    def to_dict(self):
+        """예전 결과 dict 모양"""
+        return {
+            "1동건물표시": self.건물.표시,
+            "아파트명": self.건물.아파트명,
+            "동명칭": self.건물.동명칭,
+            "도로명주소": self.건물.도로명주소,
+            "건물번호": self.전유부분.건물번호,
+            "고유번호": self.고유번호,
+            "구조": self.전유부분.구조,
+            "면적": self.전유부분.면적,
+            "토지": [{"번호": p.번호, "소재지": p.소재지, "지목": p.지목, "면적": p.면적} for p in self.토지],
+            "대지권종류": self.대지권.종류,
+            "대지권비율": self.대지권.비율,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """예전 결과 dict → RegistryResult (없는 키는 빈 값)"""
+        return cls(
+            고유번호=data.get("고유번호", ""),
+            건물=BuildingInfo(data.get("1동건물표시", ""), data.get("아파트명", ""),
+                            data.get("동명칭", ""), data.get("도로명주소", "")),
+            토지=[LandParcel(p.get("번호", ""), p.get("소재지", ""), p.get("지목", ""), p.get("면적", ""))
+                for p in data.get("토지", [])],
+            전유부분=UnitInfo(data.get("건물번호", ""), data.get("구조", ""), data.get("면적", "")),
+            대지권=LandRightInfo(data.get("대지권종류", ""), data.get("대지권비율", "")),
+        )
+
+    def to_compact(self):
+        """[고유번호, [건물], [[필지], ...], [전유부분], [대지권]] - 필드 순서대로 값만"""
+        return [self.고유번호, _values(self.건물), [_values(p) for p in self.토지],
+                _values(self.전유부분), _values(self.대지권)]
+
+    @classmethod
+    def from_compact(cls, data):
+        고유번호, building, parcels, unit, land_right = data
+        return cls(고유번호, BuildingInfo(*building), [LandParcel(*p) for p in parcels],
+                   UnitInfo(*unit), LandRightInfo(*land_right))
+
+
+def dumps_result(result):
+    """RegistryResult → 짧은 JSON 문자열"""
+    return json.dumps(result.to_compact(), ensure_ascii=False, separators=(",", ":"))
+
+
+def loads_result(text):
+    """dumps_result 결과 → RegistryResult"""
+    return RegistryResult.from_compact(json.loads(text))
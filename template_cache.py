@@ -0,0 +1,459 @@
+"""
+PDF 템플릿 캐시 (Template Cache)
+- 템플릿 PDF(1.pdf, 2.pdf, 3.pdf, 위임장, 자필서명정보 등)를 (경로, 수정시각) 기준으로 한 번만 파싱
+- 모듈 전역에 보관하므로 Streamlit 재실행(rerun)/다른 세션에서도 그대로 재사용
+- 요청마다 페이지 사전만 얕게 복사해서 넘겨주므로 캐시된 원본 페이지는 수정되지 않음
+- 템플릿 본문 내용(content stream)도 한 번만 풀어서 보관 → 병합 시 오버레이 쪽만 파싱
+- 고정 문구(채권자 이름/주소 등)를 미리 찍어둔 템플릿도 (템플릿, 고정값) 기준으로 보관
+- 병합 방식(backend)은 MERGE_BACKENDS 중에서 선택 (set_merge_backend, 비교는 merge_benchmark.py)
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+try:
+    from PyPDF2 import PdfReader, PdfWriter, PageObject
+    from PyPDF2.generic import (
+        ArrayObject, DecodedStreamObject, DictionaryObject, EncodedStreamObject, NameObject
+    )
+    PDF_OK = True
+except Exception:
+    PdfReader = None
+    PdfWriter = None
+    PageObject = None
+    ArrayObject = None
+    DecodedStreamObject = None
+    DictionaryObject = None
+    EncodedStreamObject = None
+    NameObject = None
+    PDF_OK = False
+
+# pypdf 병합 방식 (선택)
+try:
+    import pypdf
+    PYPDF_OK = True
+except Exception:
+    pypdf = None
+    PYPDF_OK = False
+
+
+# 경로 → _TemplateEntry
+_cache = {}
+_cache_lock = threading.Lock()
+
+# (경로, 고정값 키) → _TemplateEntry (고정 문구를 미리 찍은 템플릿, 오래 안 쓴 것부터 삭제)
+_stamped = OrderedDict()
+_stamped_lock = threading.Lock()
+STAMPED_CACHE_SIZE = 64
+
+
+class _TemplateEntry:
+    """파싱된 템플릿 1개 (원본 바이트 + PdfReader + 페이지별 본문)"""
+
+    def __init__(self, path, mtime, data=None):
+        self.path = path
+        self.mtime = mtime
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        self.data = data
+        self.reader = PdfReader(BytesIO(self.data))
+        # 페이지 트리를 미리 풀어둠 (첫 요청에서 파싱 비용이 나가지 않도록)
+        self.pages = list(self.reader.pages)
+        # 페이지 번호 → q ... Q로 감싼 본문 바이트 (처음 병합할 때 채움)
+        self.contents = {}
+        # PdfReader는 스트림 seek를 공유하므로 같은 템플릿은 한 번에 하나씩 사용
+        self.lock = threading.Lock()
+        # pypdf 병합 방식용 reader (처음 쓸 때 만듦)
+        self.pypdf_reader = None
+
+    def get_pypdf_reader(self):
+        if self.pypdf_reader is None:
+            self.pypdf_reader = pypdf.PdfReader(BytesIO(self.data))
+        return self.pypdf_reader
+
+    def get_wrapped_contents(self, page_index):
+        """템플릿 페이지 본문을 그래픽 상태 push/pop(q/Q)으로 감싼 바이트"""
+        data = self.contents.get(page_index)
+        if data is None:
+            contents = self.pages[page_index].get_contents()
+            if contents is None:
+                body = b""
+            elif isinstance(contents, ArrayObject):
+                body = b"\n".join(s.get_object().get_data() for s in contents)
+            else:
+                body = contents.get_data()
+            data = b"q\n" + body + b"\nQ\n"
+            self.contents[page_index] = data
+        return data
+
+    def copy_page(self, page_index):
+        """요청용 페이지 복사본 (페이지 사전만 얕게 복사, 폰트/이미지 객체는 캐시와 공유)"""
+        original = self.pages[page_index]
+        page = PageObject(self.reader, original.indirect_reference)
+        page.update(original)
+        return page
+
+
+def _get_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def get_template(template_path):
+    """캐시된 템플릿 반환 (파일이 바뀌었으면 다시 파싱)"""
+    path = os.path.abspath(template_path)
+    mtime = _get_mtime(path)
+    if mtime is None:
+        raise FileNotFoundError(template_path)
+
+    entry = _cache.get(path)
+    if entry is not None and entry.mtime == mtime:
+        return entry
+
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is None or entry.mtime != mtime:
+            entry = _TemplateEntry(path, mtime)
+            _cache[path] = entry
+    return entry
+
+
+def get_template_page_count(template_path):
+    """템플릿 페이지 수"""
+    return len(get_template(template_path).pages)
+
+
+# 내용 스트림 토큰: 문자열 (...) / <hex> 은 건너뛰고 이름(/F1 등)만 골라냄
+_TOKEN_RE = re.compile(rb"\((?:\\.|[^\\()])*\)|<[0-9A-Fa-f\s]*>|/[^\s/\[\]()<>{}%]+", re.S)
+# 인라인 이미지(BI ... ID ... EI)는 바이너리라 토큰 단위로 다룰 수 없음
+_INLINE_IMAGE_RE = re.compile(rb"(?:^|\s)BI\s")
+
+
+def _rename_names(data, renames):
+    """내용 스트림 안의 리소스 이름 바꾸기 (문자열 안의 바이트는 건드리지 않음)"""
+    if not renames:
+        return data
+
+    def sub(match):
+        token = match.group(0)
+        if token[:1] == b"/":
+            return renames.get(token, token)
+        return token
+    return _TOKEN_RE.sub(sub, data)
+
+
+def _merge_cached_page_generic(entry, page_index, overlay_page):
+    """PyPDF2 merge_page로 병합 ("pypdf2" 방식, "direct" 방식이 인라인 이미지 오버레이에 대신 사용)
+
+    merge_page는 양쪽 본문을 모두 연산자 단위로 파싱/재직렬화하므로, 템플릿 본문을
+    뺀 복사본에 오버레이만 병합(리소스 이름 충돌 처리 포함)한 뒤 캐시된 템플릿 본문을 앞에 붙인다.
+    """
+    template_contents = entry.get_wrapped_contents(page_index)
+    page = entry.copy_page(page_index)
+    if NameObject("/Contents") in page:
+        del page[NameObject("/Contents")]
+    page.merge_page(overlay_page)
+
+    stream = DecodedStreamObject()
+    stream.set_data(template_contents + page.get_contents().get_data())
+    page[NameObject("/Contents")] = stream
+    return page
+
+
+def _merge_cached_page_direct(entry, page_index, overlay_page):
+    """캐시된 템플릿 페이지 복사본 위에 오버레이 페이지를 직접 병합 ("direct" 방식)
+
+    PyPDF2 merge_page는 양쪽 본문을 연산자 단위로 여러 번 파싱/재직렬화한다.
+    여기서는 리소스 사전만 합치고(이름이 겹치는 오버레이 리소스는 이름 변경),
+    템플릿의 원본 본문 스트림(압축된 상태 그대로) 뒤에 압축한 오버레이 본문을 붙인다.
+    결과는 merge_page와 같은 "q 템플릿 Q q 오버레이 Q" 구조.
+    """
+    overlay_contents = overlay_page.get_contents()
+    if overlay_contents is None:
+        return entry.copy_page(page_index)
+    if isinstance(overlay_contents, ArrayObject):
+        overlay_data = b"\n".join(s.get_object().get_data() for s in overlay_contents)
+    else:
+        overlay_data = overlay_contents.get_data()
+    if _INLINE_IMAGE_RE.search(overlay_data):
+        return _merge_cached_page_generic(entry, page_index, overlay_page)
+
+    page = entry.copy_page(page_index)
+    template_refs = page.raw_get("/Contents") if NameObject("/Contents") in page else None
+
+    resources = page.get(NameObject("/Resources"))
+    resources = resources.get_object() if resources is not None else DictionaryObject()
+    overlay_resources = overlay_page.get(NameObject("/Resources"))
+    overlay_resources = overlay_resources.get_object() if overlay_resources is not None else DictionaryObject()
+
+    new_resources = DictionaryObject(resources)
+    renames = {}
+    for category, overlay_items in overlay_resources.items():
+        overlay_items = overlay_items.get_object()
+        if category == "/ProcSet":
+            proc_set = ArrayObject(resources.get(category, ArrayObject()).get_object())
+            for item in overlay_items:
+                if item not in proc_set:
+                    proc_set.append(item)
+            new_resources[NameObject(category)] = proc_set
+            continue
+        items = DictionaryObject(resources.get(category, DictionaryObject()).get_object())
+        for name, value in overlay_items.items():
+            new_name = name
+            n = 0
+            while new_name in items:
+                n += 1
+                new_name = f"{name}-ov{n}"
+            if new_name != name:
+                renames[name.encode("latin-1")] = new_name.encode("latin-1")
+            items[NameObject(new_name)] = value
+        new_resources[NameObject(category)] = items
+    page[NameObject("/Resources")] = new_resources
+
+    body = b"q\n" + _rename_names(overlay_data, renames) + b"\nQ\n"
+    _set_contents(page, template_refs, body)
+    return page
+
+
+def _small_stream(data, compress=False):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    if compress:
+        stream = stream.flate_encode()
+    # 아직 간접 객체가 아님 → writer.add_page가 페이지를 복사할 때 writer에 새 객체로 등록
+    stream.indirect_reference = None
+    return stream
+
+
+def _set_contents(page, template_refs, body):
+    """본문 = q + 템플릿 원본(압축된) 스트림 + Q + body
+
+    템플릿 본문은 다시 풀거나 압축하지 않고 원래 스트림을 그대로 참조한다.
+    새 스트림은 배열에 그대로 넣고, writer.add_page가 간접 객체로 등록한다.
+    """
+    contents = ArrayObject()
+    if template_refs is not None:
+        contents.append(_small_stream(b"q\n"))
+        if isinstance(template_refs, ArrayObject):
+            contents.extend(template_refs)
+        else:
+            contents.append(template_refs)
+        body = b"\nQ\n" + body
+    contents.append(_small_stream(body, compress=True))
+    page[NameObject("/Contents")] = contents
+
+
+def _merge_xobject_page(entry, page_index, overlay_page):
+    """오버레이 페이지 전체를 Form XObject 1개로 만들어 템플릿 위에 찍음 ("q /이름 Do Q")
+
+    오버레이 본문은 풀지 않고 압축된 바이트를 그대로 옮긴다.
+    오버레이 리소스는 XObject 안에 따로 들어가므로 이름 충돌/이름 변경이 없다.
+    """
+    overlay_contents = overlay_page.get_contents()
+    if overlay_contents is None:
+        return entry.copy_page(page_index)
+
+    if isinstance(overlay_contents, EncodedStreamObject):
+        form = EncodedStreamObject()
+        form._data = overlay_contents._data
+        for key in ("/Filter", "/DecodeParms"):
+            if key in overlay_contents:
+                form[NameObject(key)] = overlay_contents[key]
+    else:
+        if isinstance(overlay_contents, ArrayObject):
+            overlay_data = b"\n".join(s.get_object().get_data() for s in overlay_contents)
+        else:
+            overlay_data = overlay_contents.get_data()
+        form = _small_stream(overlay_data, compress=True)
+
+    form[NameObject("/Type")] = NameObject("/XObject")
+    form[NameObject("/Subtype")] = NameObject("/Form")
+    form[NameObject("/BBox")] = ArrayObject(overlay_page.mediabox)
+    overlay_resources = overlay_page.get(NameObject("/Resources"))
+    if overlay_resources is not None:
+        form[NameObject("/Resources")] = overlay_resources.get_object()
+
+    page = entry.copy_page(page_index)
+    template_refs = page.raw_get("/Contents") if NameObject("/Contents") in page else None
+
+    resources = page.get(NameObject("/Resources"))
+    new_resources = DictionaryObject(resources.get_object() if resources is not None else {})
+    xobjects = DictionaryObject(new_resources.get(NameObject("/XObject"), DictionaryObject()).get_object())
+    name = "/Overlay"
+    n = 0
+    while name in xobjects:
+        n += 1
+        name = f"/Overlay{n}"
+    # 오버레이 리소스(폰트 등)는 writer.add_page가 페이지와 함께 복사
+    xobjects[NameObject(name)] = form
+    new_resources[NameObject("/XObject")] = xobjects
+    page[NameObject("/Resources")] = new_resources
+
+    _set_contents(page, template_refs, b"q\n" + name.encode("latin-1") + b" Do\nQ\n")
+    return page
+
+
+def _page_count(entry_pages, overlay_pages, max_pages):
+    page_count = min(len(entry_pages), len(overlay_pages))
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    return page_count
+
+
+def _merge_entry_pages(entry, overlay_packet, max_pages, merge_page):
+    """PyPDF2로 페이지마다 merge_page(템플릿 항목, 페이지 번호, 오버레이 페이지) 적용"""
+    overlay_pdf = PdfReader(overlay_packet)
+    page_count = _page_count(entry.pages, overlay_pdf.pages, max_pages)
+
+    writer = PdfWriter()
+    with entry.lock:
+        for page_num in range(page_count):
+            page = merge_page(entry, page_num, overlay_pdf.pages[page_num])
+            writer.add_page(page)
+
+    output_buffer = BytesIO()
+    writer.write(output_buffer)
+    output_buffer.seek(0)
+    return output_buffer
+
+
+def _merge_entry_pypdf2(entry, overlay_packet, max_pages=None):
+    return _merge_entry_pages(entry, overlay_packet, max_pages, _merge_cached_page_generic)
+
+
+def _merge_entry_direct(entry, overlay_packet, max_pages=None):
+    return _merge_entry_pages(entry, overlay_packet, max_pages, _merge_cached_page_direct)
+
+
+def _merge_entry_xobject(entry, overlay_packet, max_pages=None):
+    return _merge_entry_pages(entry, overlay_packet, max_pages, _merge_xobject_page)
+
+
+def _merge_entry_pypdf(entry, overlay_packet, max_pages=None):
+    """pypdf의 merge_page 사용 (템플릿 파싱 결과는 캐시, 병합은 라이브러리에 맡김)"""
+    overlay_pdf = pypdf.PdfReader(overlay_packet)
+    writer = pypdf.PdfWriter()
+    with entry.lock:
+        reader = entry.get_pypdf_reader()
+        page_count = _page_count(reader.pages, overlay_pdf.pages, max_pages)
+        for page_num in range(page_count):
+            page = writer.add_page(reader.pages[page_num])
+            page.merge_page(overlay_pdf.pages[page_num])
+
+    output_buffer = BytesIO()
+    writer.write(output_buffer)
+    output_buffer.seek(0)
+    return output_buffer
+
+
+# =========================================================
+# 병합 방식 (backend)
+# =========================================================
+# 이름 → (병합 함수, 사용 가능 여부)
+# 병합 함수: (템플릿 항목, 오버레이 BytesIO, 최대 페이지 수) → BytesIO
+# - pypdf2 : PyPDF2 merge_page (템플릿 본문만 캐시)
+# - direct : 리소스 사전을 직접 합치고 오버레이 본문을 붙임 (merge_page 파싱 없음)
+# - xobject: 오버레이 페이지 전체를 Form XObject 1개로 찍음
+# - pypdf  : pypdf merge_page
+# 기본값은 PyPDF2 merge_page(pypdf2), 나머지는 set_merge_backend / backend 인자로 골라 씀
+# (빠른 방식은 merge_benchmark.py로 결과가 같은지 확인한 뒤 사용)
+MERGE_BACKENDS = {
+    "pypdf2": (_merge_entry_pypdf2, PDF_OK),
+    "direct": (_merge_entry_direct, PDF_OK),
+    "xobject": (_merge_entry_xobject, PDF_OK),
+    "pypdf": (_merge_entry_pypdf, PDF_OK and PYPDF_OK),
+}
+DEFAULT_MERGE_BACKEND = "pypdf2"
+_backend = DEFAULT_MERGE_BACKEND
+
+
+def available_merge_backends():
+    """설치된 라이브러리로 사용할 수 있는 병합 방식 이름 목록"""
+    return [name for name, (_, ok) in MERGE_BACKENDS.items() if ok]
+
+
+def set_merge_backend(name):
+    """이후 병합에 사용할 방식 선택 (프로세스 전체에 적용)"""
+    global _backend
+    if name not in MERGE_BACKENDS:
+        raise ValueError(f"알 수 없는 병합 방식: {name} ({', '.join(MERGE_BACKENDS)})")
+    if not MERGE_BACKENDS[name][1]:
+        raise RuntimeError(f"{name} 병합 방식에 필요한 라이브러리가 설치되지 않았습니다.")
+    _backend = name
+
+
+def get_merge_backend():
+    return _backend
+
+
+def _merge_entry(entry, overlay_packet, max_pages=None, backend=None):
+    func = MERGE_BACKENDS[backend or _backend][0]
+    return func(entry, overlay_packet, max_pages)
+
+
+def merge_overlay(template_path, overlay_packet, max_pages=None, backend=None):
+    """오버레이 PDF(BytesIO)를 캐시된 템플릿 위에 병합해서 BytesIO로 반환
+
+    backend: MERGE_BACKENDS 이름 (없으면 set_merge_backend로 정한 방식)
+    """
+    return _merge_entry(get_template(template_path), overlay_packet, max_pages, backend)
+
+
+def get_stamped_template(template_path, stamp_key, build_stamp, backend=None):
+    """고정 문구를 미리 병합한 템플릿 (없거나 원본 템플릿이 바뀌었으면 build_stamp()로 새로 만듦)
+
+    stamp_key: 고정 문구 값을 담은 키 (채권자 정보가 바뀌면 키가 달라져서 새로 만들어짐)
+    build_stamp: 고정 문구만 그린 오버레이 PDF(BytesIO)를 돌려주는 함수
+    backend: 고정 문구를 찍을 병합 방식 (방식마다 따로 보관)
+    """
+    base = get_template(template_path)
+    backend = backend or _backend
+    key = (base.path, stamp_key, backend)
+
+    with _stamped_lock:
+        entry = _stamped.get(key)
+        if entry is not None and entry.mtime == base.mtime:
+            _stamped.move_to_end(key)
+            return entry
+
+    data = _merge_entry(base, build_stamp(), backend=backend).getvalue()
+    entry = _TemplateEntry(base.path, base.mtime, data)
+    with _stamped_lock:
+        _stamped[key] = entry
+        _stamped.move_to_end(key)
+        while len(_stamped) > STAMPED_CACHE_SIZE:
+            _stamped.popitem(last=False)
+    return entry
+
+
+def merge_overlay_stamped(template_path, stamp_key, build_stamp, overlay_packet, max_pages=None, backend=None):
+    """고정 문구를 미리 찍은 템플릿 위에 나머지 오버레이만 병합"""
+    entry = get_stamped_template(template_path, stamp_key, build_stamp, backend)
+    return _merge_entry(entry, overlay_packet, max_pages, backend)
+
+
+def clear_template_cache():
+    """캐시 비우기"""
+    with _cache_lock:
+        _cache.clear()
+    with _stamped_lock:
+        _stamped.clear()
+
+
+def template_cache_info():
+    """캐시 상태 (경로별 페이지 수/바이트 수)"""
+    info = {
+        path: {"mtime": entry.mtime, "pages": len(entry.pages), "bytes": len(entry.data)}
+        for path, entry in list(_cache.items())
+    }
+    for (path, stamp_key, _), entry in list(_stamped.items()):
+        info.setdefault(path, {}).setdefault("stamped", []).append(
+            {"key": stamp_key, "bytes": len(entry.data)}
+        )
+    return info
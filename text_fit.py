@@ -0,0 +1,78 @@
+"""
+텍스트 맞춤 계산 (Text Fit)
+- 한 줄 박스(max_width)에 들어가는 폰트 크기와 표시 문자열을 계산
+- 문자열 폭은 크기에 비례하므로 한 번만 재고 맞는 크기를 바로 계산 (0.5pt 단위, 기존 방식과 같은 결과)
+- 최소 크기로도 안 맞으면 글자 폭 누적합 + 이분 탐색으로 잘라낼 위치를 찾음 ("..." 추가)
+- 결과는 (문자열, 폰트, 크기, 박스) 단위로 캐시
+"""
+
+import bisect
+import math
+from functools import lru_cache
+
+from font_manager import font_generation, prefix_widths, string_width
+
+
+SIZE_STEP = 0.5
+ELLIPSIS = "..."
+# 잘라낼 때 최소한 남기는 글자 수
+MIN_KEEP_CHARS = 10
+
+
+def fit_font_size(text, font_name, font_size, max_width, min_font_size=5):
+    """font_size에서 0.5pt씩 줄였을 때 처음으로 max_width에 들어가는 크기 (없으면 None)"""
+    total = prefix_widths(text, font_name)[-1]
+    if total <= 0:
+        return font_size
+
+    # 폭 = total * size / 1000 이므로 맞는 최대 크기는 max_width * 1000 / total
+    limit = max_width * 1000.0 / total
+    steps = max(0, math.ceil((font_size - limit) / SIZE_STEP - 1e-9))
+    size = font_size - steps * SIZE_STEP
+
+    # 부동소수 경계 보정 (실제 stringWidth 기준으로 한 단계씩 확인)
+    while size >= min_font_size and string_width(text, font_name, size) > max_width:
+        size -= SIZE_STEP
+    while size + SIZE_STEP <= font_size and string_width(text, font_name, size + SIZE_STEP) <= max_width:
+        size += SIZE_STEP
+
+    return size if size >= min_font_size else None
+
+
+def truncate_to_width(text, font_name, font_size, max_width, min_keep=MIN_KEEP_CHARS):
+    """text[:n] + "..." 가 max_width에 들어가는 가장 긴 n으로 자르기 (최소 min_keep 글자는 남김)"""
+    if len(text) <= min_keep:
+        return text
+    prefix = prefix_widths(text, font_name)
+    ellipsis = prefix_widths(ELLIPSIS, font_name)[-1]
+    limit = max_width * 1000.0 / font_size - ellipsis
+    n = bisect.bisect_right(prefix, limit) - 1
+
+    # 부동소수 경계 보정
+    n = max(0, min(n, len(text)))
+    while n > 0 and string_width(text[:n] + ELLIPSIS, font_name, font_size) > max_width:
+        n -= 1
+    while n < len(text) and string_width(text[:n + 1] + ELLIPSIS, font_name, font_size) <= max_width:
+        n += 1
+
+    n = max(n, min_keep)
+    if n >= len(text):
+        return text
+    return text[:n] + ELLIPSIS
+
+
+@lru_cache(maxsize=2048)
+def _fit_text(text, font_name, font_size, max_width, min_font_size, generation):
+    size = fit_font_size(text, font_name, font_size, max_width, min_font_size)
+    if size is not None:
+        return size, text
+    return min_font_size, truncate_to_width(text, font_name, min_font_size, max_width)
+
+
+def fit_text(text, font_name, font_size, max_width, min_font_size=5):
+    """(출력할 폰트 크기, 출력할 문자열) - 한 줄에 맞춤, 안 되면 최소 크기로 잘라서 "..." """
+    return _fit_text(text, font_name, font_size, max_width, min_font_size, font_generation())
+
+
+def clear_fit_cache():
+    _fit_text.cache_clear()